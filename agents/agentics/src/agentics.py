@@ -14,7 +14,7 @@ from .config import init_config, get_config, AgenticsConfig
 from .services import init_services, get_service_manager
 from .workflows import init_workflows, get_workflow_manager
 from .exceptions import AgenticsError, ServiceUnavailableError, ValidationError
-from .utils import log_info, validate_github_url
+from .utils import log_info, validate_github_url, validate_github_urls
 from .openspec_loader import is_local_change_ref
 from .monitoring import structured_log
 
@@ -352,8 +352,8 @@ class AgenticsApp:
             # Filter to valid URLs, record invalid ones as failures
             valid_urls = []
             invalid_results = []
-            for url in issue_urls:
-                if validate_github_url(url):
+            for url, valid in zip(issue_urls, validate_github_urls(issue_urls)):
+                if valid:
                     valid_urls.append(url)
                 else:
                     invalid_results.append(
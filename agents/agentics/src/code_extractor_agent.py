@@ -4,7 +4,7 @@ import json
 import re
 from .tool_integrated_agent import ToolIntegratedAgent
 from .tools import read_file_tool, list_files_tool, check_file_exists_tool
-from .utils import safe_json_dumps, remove_thinking_tags, log_info
+from .utils import remove_thinking_tags, log_info, log_state
 
 
 class CodeExtractorAgent(ToolIntegratedAgent):
@@ -381,10 +381,7 @@ class CodeExtractorAgent(ToolIntegratedAgent):
         """
         Analyze code structure and determine relevant files dynamically.
         """
-        log_info(
-            self.name,
-            f"Before processing in {self.name}: {safe_json_dumps(state, indent=2)}",
-        )
+        log_state(self.name, f"Before processing in {self.name}", state)
         log_info(self.name, "Starting code extraction process")
 
         # Extract identifiers from the refined ticket
@@ -516,10 +513,7 @@ class CodeExtractorAgent(ToolIntegratedAgent):
             self.name,
             f"Total relevant files found: {len(relevant_code_files) + len(relevant_test_files)}",
         )
-        log_info(
-            self.name,
-            f"After processing in {self.name}: {safe_json_dumps(state, indent=2)}",
-        )
+        log_state(self.name, f"After processing in {self.name}", state)
         return state
 
     def read_file_content(self, rel_path):
@@ -18,7 +18,7 @@ from .tools import (
     check_file_exists_tool,
 )
 from .state import State, CodeGenerationState
-from .utils import safe_json_dumps, remove_thinking_tags, log_info, safe_get
+from .utils import remove_thinking_tags, log_info, log_state, safe_get
 from .models import CodeGenerationOutput, GeneratedTests
 from .circuit_breaker import get_circuit_breaker, CircuitBreakerOpenException
 from .prompts import ModularPrompts
@@ -653,10 +653,7 @@ this.addCommand({{
         return fallback_code
 
     def process(self, state: State) -> State:
-        log_info(
-            self.name,
-            f"Before processing in {self.name}: {safe_json_dumps(state, indent=2)}",
-        )
+        log_state(self.name, f"Before processing in {self.name}", state)
         log_info(self.name, "Starting code generation process")
         try:
             # Get available dependencies dynamically from package.json
@@ -912,10 +909,7 @@ this.addCommand({{
             log_info(
                 self.name, "Code and tests generated and stored in state successfully"
             )
-            log_info(
-                self.name,
-                f"After processing in {self.name}: {safe_json_dumps(state, indent=2)}",
-            )
+            log_state(self.name, f"After processing in {self.name}", state)
             return state
         except KeyError as e:
             error_context = {
@@ -11,7 +11,7 @@ from .tools import (
     npm_install_tool,
 )
 from .state import State
-from .utils import safe_json_dumps, remove_thinking_tags, log_info
+from .utils import remove_thinking_tags, log_info, log_state
 from .prompts import ModularPrompts
 
 
@@ -48,10 +48,7 @@ class CodeIntegratorAgent(ToolIntegratedAgent):
         Integrate generated code and tests into project files based on relevant code and test files.
         Updates existing files if present, otherwise creates new ones under src/ and src/__tests__/.
         """
-        log_info(
-            self.name,
-            f"Before processing in {self.name}: {safe_json_dumps(state, indent=2)}",
-        )
+        log_state(self.name, f"Before processing in {self.name}", state)
         log_info(self.name, "Starting code integration process")
         try:
             # Handle proposed JS dependencies first
@@ -314,10 +311,7 @@ class CodeIntegratorAgent(ToolIntegratedAgent):
                 log_info(self.name, "Updated state with new file details")
 
             log_info(self.name, "Code integration process completed successfully")
-            log_info(
-                self.name,
-                f"After processing in {self.name}: {safe_json_dumps(state, indent=2)}",
-            )
+            log_state(self.name, f"After processing in {self.name}", state)
             return state
 
         except Exception as e:
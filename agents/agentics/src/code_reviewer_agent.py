@@ -3,7 +3,7 @@ import json
 from langchain_core.runnables import RunnablePassthrough, RunnableLambda
 from .tool_integrated_agent import ToolIntegratedAgent
 from .state import State
-from .utils import safe_json_dumps, remove_thinking_tags, log_info
+from .utils import remove_thinking_tags, log_info, log_state
 from .circuit_breaker import get_circuit_breaker, CircuitBreakerOpenException
 from .code_validator import PostGenValidator
 from .tools import read_file_tool, list_files_tool, check_file_exists_tool
@@ -74,10 +74,7 @@ class CodeReviewerAgent(ToolIntegratedAgent):
             }
 
     def process(self, state: State) -> State:
-        log_info(
-            self.logger,
-            f"Before processing in {self.name}: {safe_json_dumps(state, indent=2)}",
-        )
+        log_state(self.name, f"Before processing in {self.name}", state)
         log_info(self.logger, f"DEBUG: state['result'] = {state.get('result')}")
         log_info(self.logger, "Starting code/test review")
         try:
@@ -119,10 +116,7 @@ class CodeReviewerAgent(ToolIntegratedAgent):
             log_info(
                 self.logger, f"Review result: {json.dumps(review_result, indent=2)}"
             )
-            log_info(
-                self.logger,
-                f"After processing in {self.name}: {safe_json_dumps(state, indent=2)}",
-            )
+            log_state(self.name, f"After processing in {self.name}", state)
             return state
         except Exception as e:
             self.monitor.error(f"Error during review: {str(e)}")
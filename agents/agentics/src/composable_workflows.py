@@ -7,6 +7,7 @@ Composable workflows using AgentComposer for the three-phase architecture:
 
 import os
 import shutil
+import uuid
 from datetime import datetime
 from typing import Dict, Any
 from langchain_core.runnables import Runnable, RunnableParallel, RunnableLambda
@@ -846,9 +847,12 @@ class ComposableWorkflows:
 
         log_info(logger, f"Starting composable workflow for issue: {issue_url}")
 
+        # Each run gets its own checkpoint thread so a reused instance never
+        # resumes a previous or concurrent run of the same issue.
+        thread_id = f"{workflow_id}:{uuid.uuid4().hex}"
         try:
             initial_state = {"url": issue_url}
-            config = {"configurable": {"thread_id": workflow_id}, "recursion_limit": 500}
+            config = {"configurable": {"thread_id": thread_id}, "recursion_limit": 500}
             result = await self.full_workflow.ainvoke(initial_state, config)
 
             self.monitor.info(
@@ -880,6 +884,10 @@ class ComposableWorkflows:
                 "workflow_id": workflow_id,
                 "success": False,
             }
+        finally:
+            # Checkpoints are only used within a run; drop them so the
+            # in-memory saver does not grow with every processed issue.
+            self.checkpointer.delete_thread(thread_id)
 
     def get_monitoring_data(self) -> Dict[str, Any]:
         """Get monitoring data for all workflows and components."""
@@ -14,7 +14,7 @@ from .tools import (
     execute_command_tool,
 )
 from .state import State
-from .utils import safe_json_dumps, log_info
+from .utils import log_info, log_state
 
 
 class DependencyAnalyzerAgent(ToolIntegratedAgent):
@@ -35,10 +35,7 @@ class DependencyAnalyzerAgent(ToolIntegratedAgent):
         self.system_prompt = "Scan only files in /src/ and package.json; ignore node_modules and other directories."
 
     def process(self, state: State) -> State:
-        log_info(
-            self.name,
-            f"Before processing in {self.name}: {safe_json_dumps(state, indent=2)}",
-        )
+        log_state(self.name, f"Before processing in {self.name}", state)
         log_info(self.name, "Starting dependency analysis")
         try:
             project_root = state.get("project_root")
@@ -140,10 +137,7 @@ class DependencyAnalyzerAgent(ToolIntegratedAgent):
             log_info(self.name, f"Available dependencies: {list(all_deps)}")
 
             state["available_dependencies"] = list(all_deps)
-            log_info(
-                self.name,
-                f"After processing in {self.name}: {safe_json_dumps(state, indent=2)}",
-            )
+            log_state(self.name, f"After processing in {self.name}", state)
             return state
         except Exception as e:
             self.monitor.error(f"Error during dependency analysis: {str(e)}")
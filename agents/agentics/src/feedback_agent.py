@@ -5,7 +5,7 @@ from typing import Dict, Any
 
 from .base_agent import BaseAgent
 from .state import State
-from .utils import safe_json_dumps, log_info
+from .utils import log_info, log_state
 
 
 class FeedbackAgent(BaseAgent):
@@ -18,10 +18,7 @@ class FeedbackAgent(BaseAgent):
         )
 
     def process(self, state: State) -> State:
-        log_info(
-            self.logger,
-            f"Before processing in {self.name}: {safe_json_dumps(state, indent=2)}",
-        )
+        log_state(self.name, f"Before processing in {self.name}", state)
         log_info(self.logger, "Collecting feedback metrics from generation process")
 
         # Collect metrics
@@ -120,6 +120,29 @@ class StructuredLogger(logging.Logger):
         super().__init__(name)
         self.logger = logging.getLogger(name)
 
+    def setLevel(self, level):
+        """Set the level and drop cached isEnabledFor results.
+
+        Instances are not registered with the logging manager, so the
+        manager-wide cache clear in Logger.setLevel never reaches them.
+        """
+        super().setLevel(level)
+        self._cache.clear()
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Return True if an event at this level reaches this logger or the root logger."""
+        return self.isEnabledFor(level) or logging.getLogger().isEnabledFor(level)
+
+    @staticmethod
+    def _event_data(
+        data: Optional[Dict[str, Any]], kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Merge inline data with a lazily evaluated data_factory payload."""
+        data_factory = kwargs.pop("data_factory", None)
+        if data_factory is not None:
+            return {**(data or {}), **data_factory()}
+        return data or {}
+
     def _log_structured(
         self,
         level: int,
@@ -129,6 +152,8 @@ class StructuredLogger(logging.Logger):
         extra: Optional[Dict[str, Any]] = None,
     ):
         """Log structured event with proper logging level"""
+        if not self.is_enabled_for(level):
+            return
         log_data = {
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "level": logging.getLevelName(level),
@@ -165,22 +190,28 @@ class StructuredLogger(logging.Logger):
 
     def debug(self, event: str, data: Optional[Dict[str, Any]] = None, *args, **kwargs):
         """Log debug event"""
+        if not self.is_enabled_for(logging.DEBUG):
+            return
         extra = kwargs.pop("extra", {})
-        extra.update(data or {})
+        extra.update(self._event_data(data, kwargs))
         self._log_structured(logging.DEBUG, event, extra=extra)
 
     def info(self, event: str, data: Optional[Dict[str, Any]] = None, *args, **kwargs):
         """Log info event"""
+        if not self.is_enabled_for(logging.INFO):
+            return
         extra = kwargs.pop("extra", {})
-        extra.update(data or {})
+        extra.update(self._event_data(data, kwargs))
         self._log_structured(logging.INFO, event, extra=extra)
 
     def warning(
         self, event: str, data: Optional[Dict[str, Any]] = None, *args, **kwargs
     ):
         """Log warning event"""
+        if not self.is_enabled_for(logging.WARNING):
+            return
         extra = kwargs.pop("extra", {})
-        extra.update(data or {})
+        extra.update(self._event_data(data, kwargs))
         self._log_structured(logging.WARNING, event, extra=extra)
 
     def error(
@@ -192,16 +223,20 @@ class StructuredLogger(logging.Logger):
         **kwargs,
     ):
         """Log error event"""
+        if not self.is_enabled_for(logging.ERROR):
+            return
         extra = kwargs.pop("extra", {})
-        extra.update(data or {})
+        extra.update(self._event_data(data, kwargs))
         self._log_structured(logging.ERROR, event, data=extra, error=error)
 
     def critical(
         self, event: str, data: Optional[Dict[str, Any]] = None, *args, **kwargs
     ):
         """Log critical event"""
+        if not self.is_enabled_for(logging.CRITICAL):
+            return
         extra = kwargs.pop("extra", {})
-        extra.update(data or {})
+        extra.update(self._event_data(data, kwargs))
         self._log_structured(logging.CRITICAL, event, extra=extra)
 
     def exception(
@@ -4,7 +4,7 @@ import logging
 from .base_agent import BaseAgent
 from .state import State
 from .post_test_runner_agent import MAX_SELF_CORRECT_ATTEMPTS
-from .utils import safe_json_dumps
+from .utils import log_state
 
 
 class OutputResultAgent(BaseAgent):
@@ -21,9 +21,7 @@ class OutputResultAgent(BaseAgent):
         `self_correct_success=False` and `failing_gate` so the result is never reported as
         "done". The loop never claims success it did not earn.
         """
-        self.logger.debug(
-            f"Before processing in {self.name}: {safe_json_dumps(state, indent=2)}"
-        )
+        log_state(self.name, f"Before processing in {self.name}", state)
         self.logger.debug("Starting output result process")
         result = state["result"]
         self.logger.debug(f"Final result content: {json.dumps(result, indent=2)}")
@@ -45,7 +43,5 @@ class OutputResultAgent(BaseAgent):
             new_state["self_correct_success"] = True
             new_state["failing_gate"] = ""
 
-        self.logger.debug(
-            f"After processing in {self.name}: {safe_json_dumps(new_state, indent=2)}"
-        )
+        log_state(self.name, f"After processing in {self.name}", new_state)
         return new_state
@@ -22,7 +22,7 @@ from .tools import (
 )
 from .tool_integrated_agent import ToolIntegratedAgent
 from .state import State
-from .utils import safe_json_dumps, log_info, safe_get
+from .utils import log_info, log_state, safe_get
 from .exceptions import TestRecoveryNeeded, CompileError, LintError, OmissionDetected
 
 # Bounded self-correction (agentic-self-correct-loop §5.2): max re-runs of the
@@ -166,9 +166,7 @@ class PostTestRunnerAgent(ToolIntegratedAgent):
         ]
 
     def process(self, state: State) -> State:
-        self.monitor.info(
-            f"Before processing in {self.name}: {safe_json_dumps(state, indent=2)}"
-        )
+        log_state(self.name, f"Before processing in {self.name}", state)
         self.monitor.info("Starting post-test runner process")
         log_info(self.name, f"Using project_root: {self.project_root}")
         log_info(
@@ -198,9 +196,7 @@ class PostTestRunnerAgent(ToolIntegratedAgent):
                 self.monitor.info(
                     "Post-integration metrics: tests_passed=0, coverage_all_files=0.0"
                 )
-                self.monitor.info(
-                    f"After processing in {self.name}: {safe_json_dumps(new_state, indent=2)}"
-                )
+                log_state(self.name, f"After processing in {self.name}", new_state)
                 return new_state
 
         log_info(
@@ -344,9 +340,7 @@ class PostTestRunnerAgent(ToolIntegratedAgent):
         self.monitor.info(
             f"Improvement: coverage +{coverage_improvement:.2f}%, tests +{tests_improvement}"
         )
-        self.monitor.info(
-            f"After processing in {self.name}: {safe_json_dumps(new_state, indent=2)}"
-        )
+        log_state(self.name, f"After processing in {self.name}", new_state)
 
         # §4 Omission guard: compare generated file sizes vs the timestamped backup taken
         # at run start. A file SMALLER than its backup means logic was dropped — restore it
@@ -16,7 +16,7 @@ from tenacity import (
 
 from .base_agent import BaseAgent
 from .state import State
-from .utils import safe_json_dumps, log_info
+from .utils import log_info, log_state
 from .tools import ToolExecutor, typescript_typecheck_tool
 from .exceptions import CompileError
 
@@ -41,9 +41,7 @@ class PreTestRunnerAgent(BaseAgent):
         return ansi_escape.sub("", text)
 
     def process(self, state: State) -> State:
-        self.monitor.info(
-            f"Before processing in {self.name}: {safe_json_dumps(state, indent=2)}"
-        )
+        log_state(self.name, f"Before processing in {self.name}", state)
         self.monitor.info("Starting pre-test runner process")
 
         # Debug logging for permissions and paths
@@ -72,9 +70,7 @@ class PreTestRunnerAgent(BaseAgent):
                 self.monitor.info(
                     f"Extracted default metrics: tests_passed=0, coverage_all_files=0.0"
                 )
-                self.monitor.info(
-                    f"After processing in {self.name}: {safe_json_dumps(state, indent=2)}"
-                )
+                log_state(self.name, f"After processing in {self.name}", state)
                 return state
 
         log_info(
@@ -283,7 +279,5 @@ class PreTestRunnerAgent(BaseAgent):
         self.monitor.info(
             f"Extracted metrics: tests_passed={tests_passed}, coverage_all_files={coverage_all_files}"
         )
-        self.monitor.info(
-            f"After processing in {self.name}: {safe_json_dumps(state, indent=2)}"
-        )
+        log_state(self.name, f"After processing in {self.name}", state)
         return state
@@ -8,11 +8,24 @@ from functools import lru_cache
 from langchain_core.runnables import RunnablePassthrough, RunnableLambda
 from .base_agent import BaseAgent
 from .state import State
-from .utils import safe_json_dumps, remove_thinking_tags, log_info, parse_json_response
+from .utils import remove_thinking_tags, log_info, log_state, parse_json_response
 from .performance import get_response_cache, get_memory_manager
 from .llm_validator import validate_llm_response, MultiModelFallback
 from .circuit_breaker import get_circuit_breaker, CircuitBreakerOpenException
 
+# Keys every structured ticket must carry after parsing
+_REQUIRED_TICKET_KEYS = frozenset(
+    {
+        "title",
+        "description",
+        "requirements",
+        "acceptance_criteria",
+        "implementation_steps",
+        "npm_packages",
+        "manual_implementation_notes",
+    }
+)
+
 
 class ProcessLLMAgent(BaseAgent):
     def __init__(self, llm_client, prompt_template, fallback_llms=None):
@@ -79,15 +92,7 @@ class ProcessLLMAgent(BaseAgent):
         log_info(self.name, f"Cleaned LLM response: {clean_response[:500]}...")
 
         # Define validation requirements for structured ticket data
-        required_keys = {
-            "title",
-            "description",
-            "requirements",
-            "acceptance_criteria",
-            "implementation_steps",
-            "npm_packages",
-            "manual_implementation_notes",
-        }
+        required_keys = _REQUIRED_TICKET_KEYS
         fallback_defaults = {
             "title": "Untitled Task",
             "description": "No description provided",
@@ -151,10 +156,7 @@ class ProcessLLMAgent(BaseAgent):
         """
         Process ticket content with LLM to extract structured task details and update the state.
         """
-        log_info(
-            self.name,
-            f"Before processing in {self.name}: {safe_json_dumps(state, indent=2)}",
-        )
+        log_state(self.name, f"Before processing in {self.name}", state)
         log_info(self.name, "Starting LLM processing with LCEL chain")
 
         # Bypass re-processing if refined_ticket is already structured
@@ -178,10 +180,7 @@ class ProcessLLMAgent(BaseAgent):
                     self.name,
                     f"Bypassed LLM re-processing using refined_ticket. Reqs len: {len(refined.get('requirements', []))}, AC len: {len(refined.get('acceptance_criteria', []))}",
                 )
-                log_info(
-                    self.name,
-                    f"After bypass in {self.name}: {safe_json_dumps(state, indent=2)}",
-                )
+                log_state(self.name, f"After bypass in {self.name}", state)
                 return state
 
         # Check cache first
@@ -198,10 +197,7 @@ class ProcessLLMAgent(BaseAgent):
                 f"cached_result_{cache_key}", cached_result
             )
             state["result"] = cached_result
-            log_info(
-                self.name,
-                f"After processing in {self.name}: {safe_json_dumps(state, indent=2)}",
-            )
+            log_state(self.name, f"After processing in {self.name}", state)
             return state
 
         for attempt in range(self.max_retries):
@@ -228,10 +224,7 @@ class ProcessLLMAgent(BaseAgent):
                 self.memory_manager.track_object(f"llm_result_{cache_key}", result)
                 state["result"] = result
                 log_info(self.name, "LLM processing completed successfully")
-                log_info(
-                    self.name,
-                    f"After processing in {self.name}: {safe_json_dumps(state, indent=2)}",
-                )
+                log_state(self.name, f"After processing in {self.name}", state)
                 return state
             except (ValueError, json.JSONDecodeError) as e:
                 self.monitor.warning(f"Attempt {attempt + 1} failed: {str(e)}")
@@ -12,9 +12,9 @@ class ToolExecutor:
         self.tools = {tool.name: tool for tool in tools}
 
     def execute_tool(self, tool_name: str, tool_args: Dict[str, Any]) -> Any:
-        if tool_name not in self.tools:
+        tool = self.tools.get(tool_name)
+        if tool is None:
             raise ValueError(f"Unknown tool: {tool_name}")
-        tool = self.tools[tool_name]
         return tool.invoke(tool_args)
 
     def execute(self, response: Any) -> Dict[str, str]:
@@ -2,12 +2,218 @@
 LangChain tools for file operations used by agents.
 """
 
+import json
 import logging
+import os
+import reprlib
+import signal
+import stat
 import subprocess
-from typing import List, Dict, Any
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+import requests
 from langchain_core.tools import tool, BaseTool
 from .config import LOGGER_LEVEL
-from .monitoring import structured_log
+from .exceptions import CompileError
+from .monitoring import structured_log, StructuredLogger
+
+logger = logging.getLogger(__name__)
+
+# Shared HTTP session so registry lookups reuse keep-alive connections
+_NPM_SESSION = requests.Session()
+_NPM_BATCH_MAX_WORKERS = 8
+
+# Tool output is consumed by the LLM, so emit compact JSON rather than pretty-printing
+_JSON_SEPARATORS = (",", ":")
+
+# Per-name monitor cache so per-request executors don't rebuild loggers
+_MONITORS: Dict[str, StructuredLogger] = {}
+
+
+def _get_monitor(name: str) -> StructuredLogger:
+    """Return the shared structured logger for a component name."""
+    monitor = _MONITORS.get(name)
+    if monitor is None:
+        monitor = _MONITORS.setdefault(name, structured_log(name))
+    return monitor
+
+
+# Bounded repr for tool inputs so multi-MB file contents never reach the log
+_TOOL_INPUT_REPR = reprlib.Repr()
+_TOOL_INPUT_REPR.maxstring = 200
+_TOOL_INPUT_REPR.maxother = 200
+
+# Short-lived stat cache so "exists then read" tool sequences stat a path once
+_STAT_TTL = 0.5
+_STAT_CACHE_MAX_ENTRIES = 256
+_STAT_CACHE: "OrderedDict[str, Tuple[float, Optional[os.stat_result]]]" = OrderedDict()
+_STAT_CACHE_LOCK = threading.Lock()
+
+
+def _store_stat(path: str, st: Optional[os.stat_result]) -> None:
+    """Record a stat result, evicting the least recently used entries."""
+    with _STAT_CACHE_LOCK:
+        _STAT_CACHE[path] = (time.monotonic(), st)
+        _STAT_CACHE.move_to_end(path)
+        while len(_STAT_CACHE) > _STAT_CACHE_MAX_ENTRIES:
+            _STAT_CACHE.popitem(last=False)
+
+
+def _invalidate_stat(path: str) -> None:
+    """Drop a cached stat result after the file has been modified."""
+    with _STAT_CACHE_LOCK:
+        _STAT_CACHE.pop(path, None)
+
+
+def _cached_stat(path: str) -> Optional[os.stat_result]:
+    """Return os.stat(path), or None if missing, reusing results younger than the TTL."""
+    with _STAT_CACHE_LOCK:
+        cached = _STAT_CACHE.get(path)
+    if cached is not None and time.monotonic() - cached[0] < _STAT_TTL:
+        return cached[1]
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        st = None
+    _store_stat(path, st)
+    return st
+
+
+# Directories write_file_tool has already created or confirmed in this process
+_ENSURED_DIRS: set = set()
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write data to path with raw os-level writes, bypassing the text I/O layer."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+# Subprocess output is read incrementally and only the tail is retained, so a
+# huge npm/tsc dump cannot balloon memory
+_STREAM_CHUNK_SIZE = 64 * 1024
+_STREAM_MAX_BYTES = 4 << 20
+# A grandchild that left the process group can hold a pipe open after the
+# child exits or is killed; its readers are abandoned after this long.
+_READER_JOIN_TIMEOUT = 5.0
+
+
+def _drain_tail(pipe, chunks: deque, max_bytes: Optional[int]) -> None:
+    """Read a pipe to EOF, keeping only its last max_bytes (None: all) in chunks."""
+    total = 0
+    try:
+        # read1 returns what is available instead of waiting for a full chunk
+        for chunk in iter(lambda: pipe.read1(_STREAM_CHUNK_SIZE), b""):
+            chunks.append(chunk)
+            total += len(chunk)
+            while max_bytes is not None and total > max_bytes:
+                excess = total - max_bytes
+                head = chunks[0]
+                if len(head) <= excess:
+                    chunks.popleft()
+                    total -= len(head)
+                else:
+                    chunks[0] = head[excess:]
+                    total -= excess
+    finally:
+        pipe.close()
+
+
+def _run_streaming(
+    cmd,
+    cwd: str,
+    timeout: float,
+    max_bytes: Optional[int] = _STREAM_MAX_BYTES,
+    shell: bool = False,
+) -> subprocess.CompletedProcess:
+    """
+    Run a command, streaming stdout/stderr into bounded tail buffers.
+
+    max_bytes=None keeps the whole output, for output that is only usable
+    whole (such as JSON).
+
+    The child runs in its own process group so the whole tree is killed on
+    timeout, after which subprocess.TimeoutExpired is raised.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
+        shell=shell,
+        start_new_session=True,
+    )
+    stdout_chunks: deque = deque()
+    stderr_chunks: deque = deque()
+    readers = [
+        threading.Thread(
+            target=_drain_tail, args=(proc.stdout, stdout_chunks, max_bytes), daemon=True
+        ),
+        threading.Thread(
+            target=_drain_tail, args=(proc.stderr, stderr_chunks, max_bytes), daemon=True
+        ),
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        try:
+            os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
+        except (ProcessLookupError, OSError):
+            pass
+        proc.wait()
+        raise
+    finally:
+        deadline = time.monotonic() + _READER_JOIN_TIMEOUT
+        for reader in readers:
+            reader.join(max(0.0, deadline - time.monotonic()))
+    # An abandoned reader may still be appending, so read from copies
+    return subprocess.CompletedProcess(
+        cmd,
+        returncode,
+        b"".join(stdout_chunks.copy()).decode("utf-8", errors="replace"),
+        b"".join(stderr_chunks.copy()).decode("utf-8", errors="replace"),
+    )
+
+
+# `npm list` results keyed on the manifest/lockfile mtimes that determine them
+_NPM_LIST_CACHE_MAX_ENTRIES = 32
+_NPM_LIST_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_NPM_LIST_CACHE_LOCK = threading.Lock()
+_NPM_LIST_KEY_FILES = (
+    "package.json",
+    "package-lock.json",
+    os.path.join("node_modules", ".package-lock.json"),
+)
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    """Return a file's mtime in nanoseconds, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _npm_list_cache_key(cwd_path: str, depth: int) -> tuple:
+    """Build the npm list cache key for a project directory and depth."""
+    return (
+        cwd_path,
+        depth,
+        *(_mtime_ns(os.path.join(cwd_path, name)) for name in _NPM_LIST_KEY_FILES),
+    )
 
 
 class ToolExecutor:
@@ -16,21 +222,26 @@ class ToolExecutor:
     def __init__(self, tools: List[BaseTool]):
         self.tools = {tool.name: tool for tool in tools}
         self.logger = logging.getLogger("ToolExecutor")
-        self.monitor = structured_log("ToolExecutor")
+        self.monitor = _get_monitor("ToolExecutor")
         self.monitor.setLevel(LOGGER_LEVEL)
 
     def execute_tool(self, tool_name: str, tool_input: Dict[str, Any]) -> Any:
         """Execute a tool with error handling."""
-        if tool_name not in self.tools:
+        tool = self.tools.get(tool_name)
+        if tool is None:
             error_msg = f"Tool '{tool_name}' not found"
             self.monitor.error(error_msg)
             raise ValueError(error_msg)
 
-        tool = self.tools[tool_name]
         try:
-            self.monitor.info(f"Executing tool: {tool_name} with input: {tool_input}")
+            info_enabled = self.monitor.is_enabled_for(logging.INFO)
+            if info_enabled:
+                self.monitor.info(
+                    f"Executing tool: {tool_name} with input: {_TOOL_INPUT_REPR.repr(tool_input)}"
+                )
             result = tool.invoke(tool_input)
-            self.monitor.info(f"Tool {tool_name} executed successfully")
+            if info_enabled:
+                self.monitor.info(f"Tool {tool_name} executed successfully")
             return result
         except Exception as e:
             error_msg = f"Tool {tool_name} execution failed: {str(e)}"
@@ -67,12 +278,11 @@ def read_file_tool(file_path: str) -> str:
     Returns:
         File content as string, or empty string if file not found
     """
-    import os
-
     project_root = os.getenv("PROJECT_ROOT", "/project")
     full_path = os.path.join(project_root, file_path)
     try:
         with open(full_path, "r", encoding="utf-8") as f:
+            _store_stat(full_path, os.fstat(f.fileno()))
             return f.read()
     except Exception as e:
         return f"Error reading file {file_path}: {str(e)}"
@@ -89,8 +299,6 @@ def list_files_tool(directory: str = ".") -> str:
     Returns:
         Comma-separated list of files and directories
     """
-    import os
-
     project_root = os.getenv("PROJECT_ROOT", "/project")
     full_path = os.path.join(project_root, directory)
     try:
@@ -111,11 +319,36 @@ def check_file_exists_tool(file_path: str) -> bool:
     Returns:
         True if file exists, False otherwise
     """
-    import os
-
     project_root = os.getenv("PROJECT_ROOT", "/project")
     full_path = os.path.join(project_root, file_path)
-    return os.path.isfile(full_path)
+    st = _cached_stat(full_path)
+    return st is not None and stat.S_ISREG(st.st_mode)
+
+
+@lru_cache(maxsize=1024)
+def _npm_search_cached(package_name: str) -> Optional[str]:
+    """
+    Look up the latest registry version of a package, memoized per process.
+
+    Returns None when the registry has no match. Network and HTTP errors
+    propagate so that transient failures are not cached.
+    """
+    url = f"https://registry.npmjs.org/-/v1/search?text={package_name}&size=1"
+    response = _NPM_SESSION.get(url, timeout=10)
+    response.raise_for_status()
+    data = response.json()
+    if "objects" in data and data["objects"]:
+        return data["objects"][0]["package"]["version"]
+    return None
+
+
+def _npm_search(package_name: str) -> List[Dict[str, str]]:
+    """Resolve the latest version of a package from the npm registry."""
+    try:
+        version = _npm_search_cached(package_name)
+    except Exception:
+        return []
+    return [{"name": package_name, "version": version}] if version else []
 
 
 @tool
@@ -129,25 +362,36 @@ def npm_search_tool(package_name: str, limit: int = 5) -> str:
     Returns:
         Dict with 'version' key
     """
-    from functools import lru_cache
-    import requests
-    import json
+    return json.dumps(_npm_search(package_name), separators=_JSON_SEPARATORS)
 
-    @lru_cache(maxsize=128)
-    def _search(package_name: str) -> dict:
-        try:
-            url = f"https://registry.npmjs.org/-/v1/search?text={package_name}&size=1"
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if "objects" in data and data["objects"]:
-                    version = data["objects"][0]["package"]["version"]
-                    return json.dumps([{"name": package_name, "version": version}])
-        except Exception as e:
-            pass
-        return json.dumps([])
 
-    return _search(package_name)
+@tool
+def npm_search_batch_tool(package_names: List[str], limit: int = 5) -> str:
+    """
+    Search for several npm packages concurrently and return version info.
+
+    Args:
+        package_names: Names of the packages to search for
+
+    Returns:
+        JSON array with a 'name'/'version' entry per resolved package
+    """
+    names = list(dict.fromkeys(package_names))
+    if not names:
+        return "[]"
+
+    results: Dict[str, List[Dict[str, str]]] = {}
+    max_workers = min(_NPM_BATCH_MAX_WORKERS, len(names))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_npm_search, name): name for name in names}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    # Keep the caller's ordering regardless of completion order
+    return json.dumps(
+        [entry for name in names for entry in results[name]],
+        separators=_JSON_SEPARATORS,
+    )
 
 
 @tool
@@ -169,9 +413,6 @@ def npm_install_tool(
     Returns:
         Success message or error details
     """
-    import subprocess
-    import os
-
     try:
         cmd = ["npm", "install"]
         if is_dev:
@@ -188,6 +429,8 @@ def npm_install_tool(
         result = subprocess.run(
             cmd, capture_output=True, text=True, timeout=60, cwd=cwd_path
         )
+        with _NPM_LIST_CACHE_LOCK:
+            _NPM_LIST_CACHE.clear()
 
         if result.returncode == 0:
             if package_name:
@@ -214,10 +457,6 @@ def npm_list_tool(depth: int = 0, cwd: str = "") -> str:
     Returns:
         JSON string with installed packages information
     """
-    import os
-    import subprocess
-    import json
-
     try:
         cmd = ["npm", "list", "--json"]
         if depth > 0:
@@ -225,14 +464,24 @@ def npm_list_tool(depth: int = 0, cwd: str = "") -> str:
 
         project_root = os.getenv("PROJECT_ROOT", "/project")
         cwd_path = cwd if cwd else project_root
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=30, cwd=cwd_path
-        )
+        cache_key = _npm_list_cache_key(cwd_path, depth)
+        with _NPM_LIST_CACHE_LOCK:
+            cached = _NPM_LIST_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # A truncated tail would not parse, so the JSON is read uncapped
+        result = _run_streaming(cmd, cwd=cwd_path, timeout=30, max_bytes=None)
 
         if result.returncode == 0:
             try:
                 packages = json.loads(result.stdout)
-                return json.dumps(packages, indent=2)
+                listing = json.dumps(packages, separators=_JSON_SEPARATORS)
+                with _NPM_LIST_CACHE_LOCK:
+                    _NPM_LIST_CACHE[cache_key] = listing
+                    while len(_NPM_LIST_CACHE) > _NPM_LIST_CACHE_MAX_ENTRIES:
+                        _NPM_LIST_CACHE.popitem(last=False)
+                return listing
             except json.JSONDecodeError:
                 return f"Raw package list: {result.stdout[:1000]}"
         else:
@@ -253,16 +502,24 @@ def write_file_tool(file_path: str, content: str) -> str:
     Returns:
         Success message or error details
     """
-    import os
-    from .monitoring import structured_log
-
-    monitor = structured_log("write_file_tool")
+    monitor = _get_monitor("write_file_tool")
     project_root = os.getenv("PROJECT_ROOT", "/project")
     full_path = os.path.join(project_root, file_path)
     try:
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        with open(full_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        data = content.encode("utf-8")
+        directory = os.path.dirname(full_path)
+        if directory not in _ENSURED_DIRS:
+            os.makedirs(directory, exist_ok=True)
+            _ENSURED_DIRS.add(directory)
+        try:
+            _write_bytes(full_path, data)
+        except FileNotFoundError:
+            # Directory was removed since we last ensured it
+            _ENSURED_DIRS.discard(directory)
+            os.makedirs(directory, exist_ok=True)
+            _ENSURED_DIRS.add(directory)
+            _write_bytes(full_path, data)
+        _invalidate_stat(full_path)
         monitor.info("File written successfully")
         return f"Successfully wrote to {file_path}"
     except Exception as e:
@@ -283,11 +540,6 @@ def npm_run_tool(script: str, args: str = "", cwd: str = "") -> str:
     Returns:
         Output of the npm run command or error details
     """
-    import os
-    import signal
-    import subprocess
-    import logging
-
     try:
         cmd = ["npm", "run", script]
         if args:
@@ -296,28 +548,16 @@ def npm_run_tool(script: str, args: str = "", cwd: str = "") -> str:
         project_root = os.getenv("PROJECT_ROOT", "/project")
         cwd_path = cwd if cwd else project_root
 
-        logger = logging.getLogger(__name__)
         logger.info(f"npm_run_tool: Running in cwd: {cwd_path}, cmd: {cmd}")
 
-        # Use Popen with a new process group so we can kill all children on timeout
-        proc = subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-            cwd=cwd_path, preexec_fn=os.setsid,
-        )
         try:
-            stdout, stderr = proc.communicate(timeout=30)
-            if proc.returncode == 0:
-                return stdout.decode("utf-8", errors="replace")
-            else:
-                return f"npm run {script} failed: {stderr.decode('utf-8', errors='replace')}"
+            result = _run_streaming(cmd, cwd=cwd_path, timeout=30)
         except subprocess.TimeoutExpired:
-            # Kill the entire process group
-            try:
-                os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
-            except (ProcessLookupError, OSError):
-                pass
-            proc.wait()
             return f"npm run {script} timed out after 30s"
+        if result.returncode == 0:
+            return result.stdout
+        else:
+            return f"npm run {script} failed: {result.stderr}"
     except Exception as e:
         return f"Error running npm script {script}: {str(e)}"
 
@@ -335,21 +575,13 @@ def typescript_typecheck_tool(cwd: str = "") -> str:
     Raises:
         CompileError if there are TypeScript errors.
     """
-    import os
-    import subprocess
-    import logging
-    from .exceptions import CompileError
-
     project_root = os.getenv("PROJECT_ROOT", "/project")
     cwd_path = cwd if cwd else project_root
 
     cmd = ["npx", "tsc", "--noEmit"]
-    logger = logging.getLogger(__name__)
     logger.info(f"typescript_typecheck_tool: Running in cwd: {cwd_path}, cmd: {cmd}")
 
-    result = subprocess.run(
-        cmd, capture_output=True, text=True, timeout=60, cwd=cwd_path
-    )
+    result = _run_streaming(cmd, cwd=cwd_path, timeout=60)
     if result.returncode == 0:
         return "TypeScript typecheck passed."
     else:
@@ -372,20 +604,10 @@ def execute_command_tool(command: str, cwd: str = "") -> str:
     Returns:
         Output of the command or error details
     """
-    import subprocess
-    import os
-
     try:
         project_root = os.getenv("PROJECT_ROOT", "/project")
         cwd_path = cwd if cwd else project_root
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=60,
-            cwd=cwd_path,
-        )
+        result = _run_streaming(command, cwd=cwd_path, timeout=60, shell=True)
         if result.returncode == 0:
             return result.stdout
         else:
@@ -401,6 +623,7 @@ __all__ = [
     "list_files_tool",
     "check_file_exists_tool",
     "npm_search_tool",
+    "npm_search_batch_tool",
     "npm_install_tool",
     "npm_list_tool",
     "write_file_tool",
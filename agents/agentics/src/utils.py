@@ -1,8 +1,11 @@
 import re
 import json
+import asyncio
+import hashlib
 import logging
 from datetime import datetime
 from dataclasses import is_dataclass, asdict
+from functools import lru_cache
 from .config import INFO_AS_DEBUG
 from .monitoring import structured_log
 
@@ -13,39 +16,114 @@ try:
 except ImportError:
     JSON_REPAIR_AVAILABLE = False
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 monitor = structured_log(__name__)
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catching
+# the stdlib error keep working with either backend.
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+_GITHUB_URL_RE = re.compile(r"^https://github\.com/[\w-]+/[\w-]+/issues/\d+$")
+_STRIP_CACHE_MAX_LEN = 64 * 1024
+_ASYNC_PARSE_THRESHOLD = 64 * 1024
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+_CODEBLOCK_RE = re.compile(r"```(\w+)?\n(.*?)```", re.DOTALL)
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*\n?|\n?```\s*$", re.MULTILINE)
+_BRACE_CHAR_RE = re.compile(r"[{}]")
+_JSON_TOKEN_RE = re.compile(r'[{}"\\]')
+_QUOTED_ITEM_RE = re.compile(r'"([^"]*(?:\\.[^"]*)*)"')
+_LIST_FIELDS = frozenset(("requirements", "acceptance_criteria"))
+_FIELD_COUNT = 4
+# One alternation with a named value group per field, so the final regex
+# fallback finds every field in a single scan of the reply.
+_FIELDS_RE = re.compile(
+    r'"title"\s*:\s*"(?P<title>[^"]*(?:\\.[^"]*)*)"'
+    r'|"description"\s*:\s*"(?P<description>[^"]*(?:\\.[^"]*)*)"'
+    r'|"requirements"\s*:\s*\[(?P<requirements>[^\]]*)\]'
+    r'|"acceptance_criteria"\s*:\s*\[(?P<acceptance_criteria>[^\]]*)\]',
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 def validate_github_url(url: str) -> bool:
     monitor.info("github_url_validation_start", data={"url": url})
-    pattern = r"^https://github\.com/[\w-]+/[\w-]+/issues/\d+$"
-    result = bool(re.match(pattern, url))
+    result = bool(_GITHUB_URL_RE.match(url))
     monitor.info("github_url_validation_result", data={"url": url, "result": result})
     return result
 
 
+def validate_github_urls(urls) -> list:
+    """Validate many GitHub issue URLs, logging one summary event for the batch."""
+    results = [isinstance(url, str) and bool(_GITHUB_URL_RE.match(url)) for url in urls]
+    monitor.info(
+        "github_url_batch_validation",
+        data={"count": len(results), "invalid": results.count(False)},
+    )
+    return results
+
+
 def remove_thinking_tags(text: str) -> str:
     """Remove <think>...</think> tags and markdown code blocks from the text, excluding language specifiers."""
-    text = getattr(text, "content", text)
-    text = str(text)
-    monitor.info("remove_thinking_tags_start", data={"input_length": len(text)})
+    if not isinstance(text, str):
+        # Message objects carry the reply in .content; anything else is coerced
+        text = getattr(text, "content", text)
+        if not isinstance(text, str):
+            text = str(text)
+    input_length = len(text)
+    log_lengths = monitor.is_enabled_for(logging.INFO)
+    if log_lengths:
+        monitor.info("remove_thinking_tags_start", data={"input_length": input_length})
     monitor.debug("remove_thinking_tags_input", data={"text": text})
 
+    if input_length <= _STRIP_CACHE_MAX_LEN:
+        cleaned_text = _strip_thinking_tags_cached(text)
+    else:
+        cleaned_text = _strip_thinking_tags(text)
+    if log_lengths:
+        monitor.info(
+            "remove_thinking_tags_complete",
+            data={"output_length": len(cleaned_text)},
+        )
+    return cleaned_text
+
+
+def _strip_thinking_tags(text: str) -> str:
+    """Apply the remove_thinking_tags substitutions to a plain string."""
     # Remove <think>...</think> tags, including nested content
-    text = re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL)
+    if "<think>" in text:
+        text = _THINK_RE.sub("", text)
 
     # Remove markdown code blocks, capturing only content after optional language specifier and newline
-    text = re.sub(r"```(\w+)?\n(.*?)```", r"\2", text, flags=re.DOTALL)
+    if "```" in text:
+        text = _CODEBLOCK_RE.sub(r"\2", text)
 
-    cleaned_text = text.strip()
-    monitor.info(
-        "remove_thinking_tags_complete", data={"output_length": len(cleaned_text)}
+    return text.strip()
+
+
+# Identical replies are cleaned repeatedly across retries and agents; only
+# moderately sized ones are memoized so the cache stays bounded in memory.
+_strip_thinking_tags_cached = lru_cache(maxsize=512)(_strip_thinking_tags)
+
+
+def _log_info_enabled() -> bool:
+    """Return True if a log_info event would reach any handler."""
+    # log_info builds a fresh logger with no handlers or parent for each call,
+    # so below WARNING its events are only visible through the root logger.
+    return logging.getLogger().isEnabledFor(
+        logging.DEBUG if INFO_AS_DEBUG else logging.INFO
     )
-    return cleaned_text
 
 
 def log_info(component, msg, extra_data=None):
     """Log a message at INFO or DEBUG level based on INFO_AS_DEBUG setting."""
+    if not _log_info_enabled():
+        return
     monitor = structured_log(component)
     data = {"message": msg}
     if extra_data:
@@ -56,6 +134,17 @@ def log_info(component, msg, extra_data=None):
         monitor.info("log_info", data=data)
 
 
+def log_state(component, label, state):
+    """Log a state snapshot via log_info, serializing it only if it will be emitted.
+
+    Callers pass the state object itself rather than a pre-rendered JSON string,
+    so agents no longer dump the full state on every step when logging is off.
+    """
+    if not _log_info_enabled():
+        return
+    log_info(component, f"{label}: {safe_json_dumps(state, indent=2)}")
+
+
 def parse_json_response(
     response: str,
     required_keys=None,
@@ -82,48 +171,41 @@ def parse_json_response(
     """
     monitor.info(
         "json_parsing_start",
-        data={"response_length": len(response), "response_preview": response[:200]},
+        data_factory=lambda: {
+            "response_length": len(response),
+            "response_preview": response[:200],
+        },
     )
 
     # Clean the response first
-    cleaned_response = remove_thinking_tags(response).strip()
-    cleaned_response = re.sub(
-        r"^\s*```(?:json)?\s*\n?", "", cleaned_response, flags=re.DOTALL | re.MULTILINE
-    )
-    cleaned_response = re.sub(
-        r"\\n?```\\s*$", "", cleaned_response, flags=re.DOTALL | re.MULTILINE
-    )
-    # Trim trailing text after the last closing brace
-    cleaned_response = re.sub(r"}([^}]*)$", "}", cleaned_response, flags=re.DOTALL)
-    parsing_attempts = [
-        ("direct_parse", lambda: json.loads(cleaned_response)),
-        ("markdown_code_block", lambda: _extract_json_from_markdown(cleaned_response)),
-        ("brace_extraction", lambda: _extract_json_by_braces(cleaned_response)),
-    ]
-    if JSON_REPAIR_AVAILABLE:
-        parsing_attempts.append(
-            ("json_repair", lambda: json.loads(repair_json(cleaned_response)))
-        )
-    parsing_attempts.append(
-        ("regex_extraction", lambda: _extract_json_by_regex(cleaned_response))
+    cleaned_response = _clean_llm_json_string(response)
+    # Per-attempt events follow INFO_AS_DEBUG like log_info, and their
+    # payloads are only built when the level is actually enabled.
+    log_attempt = monitor.debug if INFO_AS_DEBUG else monitor.info
+    trace_attempts = monitor.is_enabled_for(logging.DEBUG)
+    log_attempts = monitor.is_enabled_for(
+        logging.DEBUG if INFO_AS_DEBUG else logging.INFO
     )
 
     last_error = None
-    for attempt_name, parse_func in parsing_attempts:
+    for attempt_name, parse_func in _attempts_for(cleaned_response):
         try:
-            monitor.debug("json_parsing_attempt", data={"method": attempt_name})
-            result = parse_func()
-            monitor.info("json_parsing_success", data={"method": attempt_name})
+            if trace_attempts:
+                monitor.debug("json_parsing_attempt", data={"method": attempt_name})
+            result = parse_func(cleaned_response)
+            if log_attempts:
+                log_attempt("json_parsing_success", data={"method": attempt_name})
 
             # Validate required keys if specified
             if required_keys:
                 result = _validate_and_fill_json(
                     result, required_keys, fallback_defaults or {}
                 )
-                monitor.info(
-                    "json_validation_passed",
-                    data={"required_keys": list(required_keys)},
-                )
+                if log_attempts:
+                    log_attempt(
+                        "json_validation_passed",
+                        data={"required_keys": list(required_keys)},
+                    )
 
             return result
         except (json.JSONDecodeError, ValueError) as e:
@@ -136,42 +218,58 @@ def parse_json_response(
 
     # If all parsing failed and LLM client provided, retry with feedback
     if llm_client and original_prompt:
+        # Imported here because performance imports this module
+        from .performance import get_response_cache
+
+        feedback_prompt = (
+            original_prompt
+            + f"\n\nPrevious response had parsing errors (e.g., missing commas, unbalanced braces); output *strictly valid JSON* only. Do not include any additional text, code blocks, or explanations."
+        )
+        # Only replies that parsed are cached, so a hit on the first retry
+        # skips the LLM round trip and later retries still ask for a new reply.
+        response_cache = get_response_cache()
+        # Keyed per client as well as per prompt: another client or model may
+        # not have produced the same reply.
+        cache_key = (
+            f"json_retry:{_llm_cache_identity(llm_client)}:"
+            + hashlib.md5(feedback_prompt.encode()).hexdigest()
+        )
+        # Cleaned texts every attempt already failed on; a reply that cleans
+        # to one of them is skipped instead of being parsed again.
+        failed_texts = {cleaned_response}
         for retry in range(max_retries):
             monitor.info(
                 "json_parsing_retry",
                 data={"retry": retry + 1, "max_retries": max_retries},
             )
-            feedback_prompt = (
-                original_prompt
-                + f"\n\nPrevious response had parsing errors (e.g., missing commas, unbalanced braces); output *strictly valid JSON* only. Do not include any additional text, code blocks, or explanations."
-            )
             try:
-                retry_response = llm_client.invoke(feedback_prompt)
-                retry_cleaned = remove_thinking_tags(retry_response).strip()
-                retry_cleaned = re.sub(
-                    r"^\s*```(?:json)?\s*\n?",
-                    "",
-                    retry_cleaned,
-                    flags=re.DOTALL | re.MULTILINE,
-                )
-                retry_cleaned = re.sub(
-                    r"\n?```\s*$", "", retry_cleaned, flags=re.DOTALL | re.MULTILINE
-                )
-                retry_cleaned = re.sub(r"}.*", "}", retry_cleaned, flags=re.DOTALL)
-                for attempt_name, parse_func in parsing_attempts:
+                retry_response = response_cache.get(cache_key) if retry == 0 else None
+                if retry_response is None:
+                    retry_response = llm_client.invoke(feedback_prompt)
+                retry_cleaned = _clean_llm_json_string(retry_response)
+                if retry_cleaned in failed_texts:
+                    monitor.warning(
+                        "json_parsing_retry_failed",
+                        data={"retry": retry + 1, "error": "unchanged response"},
+                    )
+                    continue
+                for attempt_name, parse_func in _attempts_for(retry_cleaned):
                     try:
-                        result = parse_func()
-                        monitor.info(
-                            "json_parsing_success_on_retry",
-                            data={"method": attempt_name, "retry": retry + 1},
-                        )
+                        result = parse_func(retry_cleaned)
+                        if log_attempts:
+                            log_attempt(
+                                "json_parsing_success_on_retry",
+                                data={"method": attempt_name, "retry": retry + 1},
+                            )
                         if required_keys:
                             result = _validate_and_fill_json(
                                 result, required_keys, fallback_defaults or {}
                             )
+                        response_cache.set(cache_key, retry_cleaned)
                         return result
                     except (json.JSONDecodeError, ValueError):
                         continue
+                failed_texts.add(retry_cleaned)
             except Exception as e:
                 monitor.warning(
                     "json_parsing_retry_failed",
@@ -204,65 +302,150 @@ def parse_json_response(
         )
 
 
-def _extract_json_from_markdown(text: str):
-    """Extract JSON from markdown code blocks."""
-    # Look for JSON code blocks
-    json_match = re.search(
-        r"```(?:json)?\s*\n(.*?)\n```", text, re.DOTALL | re.IGNORECASE
-    )
-    if json_match:
-        return json.loads(json_match.group(1).strip())
-    raise ValueError("No JSON code block found")
+async def parse_json_response_async(response, *args, **kwargs):
+    """Async variant of parse_json_response for coroutine callers.
+
+    Replies larger than _ASYNC_PARSE_THRESHOLD are parsed in a worker thread so
+    the regex and brace scanning does not block the event loop; smaller ones
+    are parsed inline since the thread hand-off would cost more than it saves.
+    """
+    text = getattr(response, "content", response)
+    if isinstance(text, str) and len(text) > _ASYNC_PARSE_THRESHOLD:
+        return await asyncio.to_thread(parse_json_response, response, *args, **kwargs)
+    return parse_json_response(response, *args, **kwargs)
+
+
+def _llm_cache_identity(llm_client) -> str:
+    """Return a cache key part identifying which LLM client produced a reply."""
+    model = getattr(llm_client, "model", None)
+    if isinstance(model, str):
+        return f"{type(llm_client).__qualname__}:{model}:{id(llm_client):x}"
+    return f"{type(llm_client).__qualname__}:{id(llm_client):x}"
+
+
+def _clean_llm_json_string(text) -> str:
+    """Strip thinking tags, stray code fences and trailing prose from an LLM reply."""
+    cleaned = remove_thinking_tags(text).strip()
+    if "```" in cleaned:
+        # Leading and trailing fences are removed in a single pass
+        cleaned = _FENCE_RE.sub("", cleaned)
+    # Trim trailing text after the last closing brace
+    if not cleaned.endswith("}"):
+        end = cleaned.rfind("}")
+        if end != -1:
+            cleaned = cleaned[: end + 1]
+    return cleaned
 
 
 def _extract_json_by_braces(text: str):
     """Extract JSON by finding balanced braces."""
-    start_idx = str(text).find("{")
+    start_idx = text.find("{")
     if start_idx == -1:
         raise ValueError("No opening brace found")
 
+    # Let the regex engine skip over everything that is not a brace instead
+    # of stepping through each character in Python.
     brace_count = 0
-    for i, char in enumerate(text[start_idx:], start_idx):
-        if char == "{":
+    for match in _BRACE_CHAR_RE.finditer(text, start_idx):
+        if match.group() == "{":
             brace_count += 1
-        elif char == "}":
+        else:
             brace_count -= 1
             if brace_count == 0:
-                json_str = text[start_idx : i + 1]
-                return json.loads(json_str)
+                json_str = text[start_idx : match.end()]
+                return _loads(json_str)
 
     raise ValueError("Unbalanced braces")
 
 
+def _find_json_span(text: str):
+    """Return (start, end) of the first balanced JSON object in text.
+
+    A single left-to-right pass over braces, quotes and backslashes keeps a
+    stack of open braces, ignoring braces inside string literals, so nesting
+    depth is unbounded and adversarial input cannot cause backtracking.
+    """
+    stack = []
+    in_string = False
+    escaped_until = -1
+    best = None
+    for match in _JSON_TOKEN_RE.finditer(text):
+        i = match.start()
+        if i < escaped_until:
+            continue
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                escaped_until = i + 2
+            elif char == '"':
+                in_string = False
+        elif char == "{":
+            stack.append(i)
+        elif char == "}":
+            if stack:
+                start = stack.pop()
+                if not stack:
+                    return start, i + 1
+                # Inside an unclosed outer brace; keep the earliest candidate
+                if best is None or start < best[0]:
+                    best = (start, i + 1)
+        elif char == '"' and stack:
+            in_string = True
+    if best is None:
+        raise ValueError("No valid JSON pattern found")
+    return best
+
+
 def _extract_json_by_regex(text: str):
-    """Extract JSON using regex pattern."""
-    # More robust regex that handles nested objects
-    json_match = re.search(r"\{(?:[^{}]|{(?:[^{}]|{[^{}]*})*})*\}", text, re.DOTALL)
-    if json_match:
-        return json.loads(json_match.group(0))
-    raise ValueError("No valid JSON pattern found")
+    """Extract the first balanced JSON object, allowing any nesting depth."""
+    start, end = _find_json_span(text)
+    return _loads(text[start:end])
+
+
+def _load_repaired_json(text: str):
+    """Repair common JSON syntax errors before parsing."""
+    return _loads(repair_json(text))
+
+
+# Code fences are already stripped by _clean_llm_json_string, so direct parsing
+# covers the common clean response and brace scanning is the structural
+# fallback. Each attempt takes the cleaned text as its only argument.
+_PARSE_ATTEMPTS = (
+    ("direct_parse", _loads),
+    ("brace_extraction", _extract_json_by_braces),
+    *((("json_repair", _load_repaired_json),) if JSON_REPAIR_AVAILABLE else ()),
+    ("regex_extraction", _extract_json_by_regex),
+)
+
+
+def _attempts_for(text: str):
+    """Return the parse attempts worth running on the cleaned text."""
+    # Without an opening brace only a direct parse can succeed (arrays and
+    # scalars); the object extractors would scan the whole reply and fail.
+    if "{" not in text:
+        return _PARSE_ATTEMPTS[:1]
+    return _PARSE_ATTEMPTS
 
 
 def _extract_fields_by_regex(text: str) -> dict:
     """Extract key fields from text using regex as final fallback."""
     fields = {}
-    # Simple patterns for common keys
-    patterns = {
-        "title": r'"title"\s*:\s*"([^"]*(?:\\.[^"]*)*)"',
-        "description": r'"description"\s*:\s*"([^"]*(?:\\.[^"]*)*)"',
-        "requirements": r'"requirements"\s*:\s*\[([^\]]*)\]',
-        "acceptance_criteria": r'"acceptance_criteria"\s*:\s*\[([^\]]*)\]',
-    }
-    for key, pattern in patterns.items():
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-        if match:
-            if key in ["requirements", "acceptance_criteria"]:
-                # Parse list items
-                items_str = match.group(1)
-                items = re.findall(r'"([^"]*(?:\\.[^"]*)*)"', items_str)
-                fields[key] = items
-            else:
-                fields[key] = match.group(1).replace('\\"', '"').replace("\\\\", "\\")
+    set_field = fields.__setitem__
+    find_items = _QUOTED_ITEM_RE.findall
+    for match in _FIELDS_RE.finditer(text):
+        key = match.lastgroup
+        # The first occurrence of each field wins
+        if key in fields:
+            continue
+        if key in _LIST_FIELDS:
+            # Parse list items
+            set_field(key, find_items(match.group(key)))
+        else:
+            set_field(
+                key, match.group(key).replace('\\"', '"').replace("\\\\", "\\")
+            )
+        if len(fields) == _FIELD_COUNT:
+            break
     monitor.info(
         "regex_field_extraction", data={"extracted_fields": list(fields.keys())}
     )
@@ -276,7 +459,9 @@ def _validate_and_fill_json(
     if not isinstance(parsed_json, dict):
         raise ValueError("Parsed result must be a dictionary")
 
-    missing_keys = required_keys - set(parsed_json.keys())
+    # Only the (usually empty) set of missing keys is sorted, so defaults
+    # are filled and reported in a stable order.
+    missing_keys = sorted(required_keys - parsed_json.keys())
     if missing_keys:
         monitor.warning("json_missing_keys", data={"missing_keys": list(missing_keys)})
         for key in missing_keys:
@@ -294,28 +479,62 @@ def _validate_and_fill_json(
     return parsed_json
 
 
+def _safe_default(obj):
+    """Convert objects the JSON encoders cannot handle natively."""
+    try:
+        if is_dataclass(obj):
+            return asdict(obj)
+        elif isinstance(obj, datetime):
+            return obj.isoformat()
+        elif hasattr(obj, "__dict__"):
+            return obj.__dict__
+        elif isinstance(obj, (set, frozenset)):
+            return list(obj)
+    except (TypeError, AttributeError, NameError):
+        pass
+    # Fallback for any serialization issues
+    return f"<non-serializable: {type(obj).__name__}>"
+
+
 class SafeJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder that can handle dataclasses and other non-serializable objects"""
 
     def default(self, obj):
-        try:
-            if is_dataclass(obj):
-                return asdict(obj)
-            elif isinstance(obj, datetime):
-                return obj.isoformat()
-            elif hasattr(obj, "__dict__"):
-                return obj.__dict__
-            elif isinstance(obj, (set, frozenset)):
-                return list(obj)
-            else:
-                return super().default(obj)
-        except (TypeError, AttributeError, NameError):
-            # Fallback for any serialization issues
-            return f"<non-serializable: {type(obj).__name__}>"
+        return _safe_default(obj)
+
+
+# Dataclasses and datetimes go through _safe_default like the stdlib path
+_ORJSON_DUMP_OPTIONS = (
+    (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+    if ORJSON_AVAILABLE
+    else 0
+)
 
 
 def safe_json_dumps(obj, indent=None, **kwargs):
-    """Safely serialize objects to JSON, handling dataclasses and other complex types"""
+    """Safely serialize objects to JSON, handling dataclasses and other complex types
+
+    With orjson installed, two-space indented dumps are written by orjson
+    and match the stdlib output except that NaN and +/-Infinity become null
+    (the stdlib writes non-standard NaN/Infinity tokens), some small floats
+    lose their exponent (1e-05 is written as 0.00001), and UUIDs and enums
+    are written as their values.
+    """
+    # orjson's compact separators and its lack of json.dumps' keyword
+    # options differ from the stdlib, so only indent=2 goes through it.
+    if ORJSON_AVAILABLE and not kwargs and indent == 2:
+        try:
+            out = orjson.dumps(obj, default=_safe_default, option=_ORJSON_DUMP_OPTIONS)
+        except TypeError:
+            out = None
+        # orjson writes raw UTF-8 where the stdlib escapes non-ASCII
+        if out is not None and out.isascii():
+            return out.decode()
     try:
         return json.dumps(obj, cls=SafeJSONEncoder, indent=indent, **kwargs)
     except (TypeError, ValueError) as e:
@@ -335,6 +554,21 @@ def safe_json_dumps(obj, indent=None, **kwargs):
         )
 
 
+def to_columns(rows, columns) -> dict:
+    """Pack homogeneous dicts into a columnar table for compact log payloads.
+
+    The column names are written once instead of being repeated in every row.
+    """
+    columns = list(columns)
+    return {"columns": columns, "rows": [[row.get(c) for c in columns] for row in rows]}
+
+
+def rows_to_dicts(table: dict) -> list:
+    """Expand a table produced by to_columns back into a list of dicts."""
+    columns = table["columns"]
+    return [dict(zip(columns, row)) for row in table["rows"]]
+
+
 def safe_get(s, k, d=None):
     """Safe get from state dict or object. Returns default if missing."""
     return s.get(k, d) if isinstance(s, dict) else getattr(s, k, d)
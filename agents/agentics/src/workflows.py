@@ -8,7 +8,7 @@ from .exceptions import WorkflowError, BatchProcessingError, ValidationError
 from .services import get_service_manager
 from .performance import get_task_manager, get_batch_processor
 from .composable_workflows import ComposableWorkflows
-from .utils import log_info, validate_github_url
+from .utils import log_info, to_columns, validate_github_url, validate_github_urls
 from .monitoring import structured_log
 from .circuit_breaker import get_circuit_breaker
 
@@ -37,12 +37,22 @@ class Workflow(ABC):
 class IssueProcessingWorkflow(Workflow):
     """Workflow for processing GitHub issues."""
 
-    def __init__(self):
+    def __init__(self, reuse_workflow_system: bool = False):
+        """Create the workflow.
+
+        With reuse_workflow_system=True the composable workflow system is
+        built once and reused by every execute() call. Its agents and
+        checkpointer are not meant to be shared by concurrent issues, so
+        only enable it for an instance that runs one issue at a time, as
+        the batch workers do.
+        """
         super().__init__("issue_processing")
         self.service_manager = get_service_manager()
         self.task_manager = get_task_manager()
         self.batch_processor = get_batch_processor()
         self.circuit_breaker = get_circuit_breaker("workflow_execution")
+        self.reuse_workflow_system = reuse_workflow_system
+        self._workflow_system: Optional[ComposableWorkflows] = None
 
     def validate_input(self, input_data: Dict[str, Any]) -> None:
         """Validate input for issue processing."""
@@ -81,16 +91,24 @@ class IssueProcessingWorkflow(Workflow):
             raise WorkflowError(f"Workflow execution failed: {str(e)}") from e
 
     async def _create_workflow_system(self) -> ComposableWorkflows:
-        """Create a composable workflow system instance."""
+        """Return the composable workflow system for one execution."""
+        if self._workflow_system is not None:
+            return self._workflow_system
+
         github_client = (
-            self.service_manager.github._client if self.service_manager.github else None
+            self.service_manager.github._client
+            if self.service_manager.github
+            else None
         )
 
-        return ComposableWorkflows(
+        workflow_system = ComposableWorkflows(
             llm_reasoning=self.service_manager.ollama_reasoning._client,
             llm_code=self.service_manager.ollama_code._client,
             github_client=github_client,
         )
+        if self.reuse_workflow_system:
+            self._workflow_system = workflow_system
+        return workflow_system
 
 
 class BatchIssueProcessingWorkflow(Workflow):
@@ -111,9 +129,15 @@ class BatchIssueProcessingWorkflow(Workflow):
         if not isinstance(issue_urls, list) or not issue_urls:
             raise ValidationError("'issue_urls' must be a non-empty list")
 
-        for url in issue_urls:
-            if not isinstance(url, str) or not validate_github_url(url):
-                raise ValidationError(f"Invalid GitHub issue URL: {url}")
+        invalid = [
+            url
+            for url, valid in zip(issue_urls, validate_github_urls(issue_urls))
+            if not valid
+        ]
+        if invalid:
+            raise ValidationError(
+                f"Invalid GitHub issue URL: {', '.join(map(str, invalid))}"
+            )
 
     async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute batch issue processing workflow."""
@@ -129,6 +153,17 @@ class BatchIssueProcessingWorkflow(Workflow):
             successful = sum(1 for r in results if r.get("success", False))
             failed = len(results) - successful
 
+            if failed:
+                _monitor.warning(
+                    "batch_issue_failures",
+                    {
+                        "failures": to_columns(
+                            (r for r in results if not r.get("success", False)),
+                            ("issue_url", "error"),
+                        )
+                    },
+                )
+
             _monitor.info(
                 "batch_processing_completed",
                 {
@@ -153,19 +188,38 @@ class BatchIssueProcessingWorkflow(Workflow):
     async def _process_batch(self, issue_urls: List[str]) -> List[Dict[str, Any]]:
         """Process multiple issues concurrently."""
 
+        # Workflows not currently running an issue. Each one is used by a single
+        # issue at a time to avoid state conflicts, so at most as many are
+        # built as there are issues in flight rather than one per URL. They
+        # reuse their workflow system for the rest of this batch only.
+        idle_workflows: List[IssueProcessingWorkflow] = []
+
         async def process_single_issue(issue_url: str) -> Dict[str, Any]:
             """Process a single issue asynchronously."""
+            workflow: Optional[IssueProcessingWorkflow] = None
             try:
-                # Create a fresh workflow for each issue to avoid state conflicts
-                workflow = IssueProcessingWorkflow()
+                workflow = (
+                    idle_workflows.pop()
+                    if idle_workflows
+                    else IssueProcessingWorkflow(reuse_workflow_system=True)
+                )
                 result = await workflow.execute({"url": issue_url})
                 return result
+            except WorkflowError as e:
+                # IssueProcessingWorkflow.execute already logged the failure;
+                # execute() reports all failed issues in one table afterwards.
+                return {"issue_url": issue_url, "success": False, "error": str(e)}
             except Exception as e:
-                _monitor.warning(
-                    "single_issue_processing_failed",
+                # Raised before the issue ran (building the workflow or
+                # validating its input), so nothing has logged it yet.
+                _monitor.debug(
+                    "issue_workflow_setup_failed",
                     {"issue_url": issue_url, "error": str(e)},
                 )
                 return {"issue_url": issue_url, "success": False, "error": str(e)}
+            finally:
+                if workflow is not None:
+                    idle_workflows.append(workflow)
 
         # Use batch processor for concurrent execution
         return await self.batch_processor.process_batch(
@@ -0,0 +1,28 @@
+"""
+Read-only fixture data helpers.
+
+Fixtures shared between tests are frozen so one test cannot change what
+another sees; thaw() returns a mutable deep copy for tests that need one.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+
+def freeze(value: Any) -> Any:
+    """Recursively make a fixture read-only so it can be shared between tests."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a mutable (and JSON-serializable) copy of a frozen fixture."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (tuple, list)):
+        return [thaw(item) for item in value]
+    return value
@@ -5,457 +5,346 @@ Provides sample TypeScript code, Jest tests, and mock responses for comprehensiv
 """
 
 import json
-from typing import Dict, Any
+import os
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
+from ._frozen import freeze
 
-# Valid TypeScript code samples
-VALID_CALCULATOR_CODE = """
-export class Calculator {
-    add(a: number, b: number): number {
-        return a + b;
-    }
 
-    subtract(a: number, b: number): number {
-        return a - b;
-    }
+# TypeScript sources and Jest tests used as fixtures live next to this module
+_TYPESCRIPT_DIR = os.path.join(os.path.dirname(__file__), "typescript")
 
-    multiply(a: number, b: number): number {
-        return a * b;
-    }
 
-    divide(a: number, b: number): number {
-        if (b === 0) {
-            throw new Error('Division by zero');
-        }
-        return a / b;
-    }
-}
-"""
+def _read_typescript(filename: str) -> str:
+    """Read a TypeScript fixture file."""
+    with open(os.path.join(_TYPESCRIPT_DIR, filename), encoding="utf-8") as f:
+        return f.read()
 
-VALID_CALCULATOR_TESTS = """
-import { Calculator } from './source';
-
-describe('Calculator', () => {
-    let calculator: Calculator;
-
-    beforeEach(() => {
-        calculator = new Calculator();
-    });
-
-    describe('add', () => {
-        it('should add two positive numbers', () => {
-            expect(calculator.add(2, 3)).toBe(5);
-        });
-
-        it('should add positive and negative numbers', () => {
-            expect(calculator.add(5, -3)).toBe(2);
-        });
-    });
-
-    describe('subtract', () => {
-        it('should subtract two numbers', () => {
-            expect(calculator.subtract(5, 3)).toBe(2);
-        });
-    });
-
-    describe('multiply', () => {
-        it('should multiply two numbers', () => {
-            expect(calculator.multiply(3, 4)).toBe(12);
-        });
-    });
-
-    describe('divide', () => {
-        it('should divide two numbers', () => {
-            expect(calculator.divide(10, 2)).toBe(5);
-        });
-
-        it('should throw error when dividing by zero', () => {
-            expect(() => calculator.divide(10, 0)).toThrow('Division by zero');
-        });
-    });
-});
-"""
 
-# High coverage test samples
-HIGH_COVERAGE_CODE = """
-export class StringProcessor {
-    process(input: string | null | undefined): string {
-        if (input === null || input === undefined) {
-            return '';
-        }
-
-        if (input.length === 0) {
-            return '';
-        }
+# Valid TypeScript code samples
+@cache
+def _valid_calculator_code() -> str:
+    return _read_typescript("calculator.ts")
 
-        return input.trim().toUpperCase();
-    }
 
-    validateEmail(email: string): boolean {
-        if (!email || email.length === 0) {
-            return false;
-        }
+@cache
+def _valid_calculator_tests() -> str:
+    return _read_typescript("calculator.test.ts")
 
-        const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
-        return emailRegex.test(email);
-    }
 
-    calculateLength(input: string): number {
-        return input ? input.length : 0;
-    }
-}
-"""
-
-HIGH_COVERAGE_TESTS = """
-import { StringProcessor } from './source';
-
-describe('StringProcessor', () => {
-    let processor: StringProcessor;
-
-    beforeEach(() => {
-        processor = new StringProcessor();
-    });
-
-    describe('process', () => {
-        it('should return empty string for null input', () => {
-            expect(processor.process(null)).toBe('');
-        });
-
-        it('should return empty string for undefined input', () => {
-            expect(processor.process(undefined)).toBe('');
-        });
-
-        it('should return empty string for empty input', () => {
-            expect(processor.process('')).toBe('');
-        });
-
-        it('should trim and uppercase normal input', () => {
-            expect(processor.process('  hello world  ')).toBe('HELLO WORLD');
-        });
-    });
-
-    describe('validateEmail', () => {
-        it('should return false for null input', () => {
-            expect(processor.validateEmail(null as any)).toBe(false);
-        });
-
-        it('should return false for empty string', () => {
-            expect(processor.validateEmail('')).toBe(false);
-        });
-
-        it('should return false for invalid email', () => {
-            expect(processor.validateEmail('invalid-email')).toBe(false);
-        });
-
-        it('should return true for valid email', () => {
-            expect(processor.validateEmail('test@example.com')).toBe(true);
-        });
-    });
-
-    describe('calculateLength', () => {
-        it('should return 0 for null input', () => {
-            expect(processor.calculateLength(null as any)).toBe(0);
-        });
-
-        it('should return 0 for empty string', () => {
-            expect(processor.calculateLength('')).toBe(0);
-        });
-
-        it('should return correct length for normal string', () => {
-            expect(processor.calculateLength('hello')).toBe(5);
-        });
-    });
-});
-"""
+# High coverage test samples
+@cache
+def _high_coverage_code() -> str:
+    return _read_typescript("string_processor.ts")
 
-# Invalid code samples for error testing
-INVALID_TYPESCRIPT_CODE = """
-export class InvalidCalculator {
-    add(a: number, b: number): number {
-        return a + b;  // Valid
 
-    subtract(a: number, b: number): number {  // Missing closing brace
-        return a - b
+@cache
+def _high_coverage_tests() -> str:
+    return _read_typescript("string_processor.test.ts")
 
-    multiply(a: number, b: number): number {
-        return a * b;  // Valid
-    }
 
-    divide(a: number, b: number): number {
-        if (b === 0) {
-            throw new Error('Division by zero');
-        return a / b;  // Missing closing brace
-    }
-}
-"""
+# Invalid code samples for error testing
+@cache
+def _invalid_typescript_code() -> str:
+    return _read_typescript("invalid_calculator.ts")
 
-INVALID_JEST_TESTS = """
-import { Calculator } from './source';
 
-describe('Calculator', () => {
-    let calculator: Calculator;
+@cache
+def _invalid_jest_tests() -> str:
+    return _read_typescript("invalid_calculator.test.ts")
 
-    beforeEach(() => {
-        calculator = new Calculator();
-    });
 
-    describe('add', () => {
-        it('should add two numbers', () => {
-            expect(calculator.add(2, 3)).toBe(5);  // Valid
+# Async code samples
+@cache
+def _async_processor_code() -> str:
+    return _read_typescript("async_processor.ts")
 
-        it('should fail with invalid syntax', () => {  // Missing closing paren
-            expect(calculator.add(2, 3)).toBe(6);  // Wrong expectation
-        });
-    });
 
-    describe('divide', () => {
-        it('should throw error when dividing by zero', () => {
-            expect(() => calculator.divide(10, 0)).toThrow('Division by zero');  // Valid
+@cache
+def _async_processor_tests() -> str:
+    return _read_typescript("async_processor.test.ts")
 
-        it('should handle invalid test syntax', () => {  // Missing closing paren
-            expect(calculator.divide(10, 0)).toBe('error');  // Wrong type
-        });
-    });
-});
-"""
 
-# Async code samples
-ASYNC_PROCESSOR_CODE = """
-export class AsyncProcessor {
-    async delay(ms: number): Promise<void> {
-        return new Promise(resolve => setTimeout(resolve, ms));
+# Fixed parts of the Jest results; the fixtures and helpers below copy these
+# and only fill in the fields that differ.
+_JEST_RESULT_TEMPLATE = MappingProxyType(
+    {
+        "numFailedTestSuites": 0,
+        "numFailedTests": 0,
+        "numPassedTestSuites": 0,
+        "numPassedTests": 0,
+        "numPendingTestSuites": 0,
+        "numPendingTests": 0,
+        "numRuntimeErrorTestSuites": 0,
+        "numTodoTests": 0,
+        "numTotalTestSuites": 1,
+        "numTotalTests": 0,
+        "success": True,
     }
-
-    async processData(data: string): Promise<string> {
-        await this.delay(100);
-        return data.toUpperCase();
+)
+
+_TEST_FILE_RESULT_TEMPLATE = MappingProxyType(
+    {
+        "endTime": 1638360000000,
+        "message": "",
+        "name": "/tmp/test/source.test.ts",
+        "startTime": 1638360000000,
+        "summary": "",
     }
+)
 
-    async processMultiple(items: string[]): Promise<string[]> {
-        const promises = items.map(item => this.processData(item));
-        return Promise.all(promises);
-    }
-}
-"""
+_PASSED_ASSERTION_PROTO = MappingProxyType({"location": None, "status": "passed"})
+_FAILED_ASSERTION_PROTO = MappingProxyType({"location": None, "status": "failed"})
+
+
+@cache
+def _calculator_assertion(
+    describe: str, title: str, failure_message: str = ""
+) -> Mapping[str, Any]:
+    """Read-only assertion result of the Calculator samples, shared by outputs"""
+    return freeze(
+        {
+            "ancestorTitles": ["Calculator", describe],
+            "failureMessages": [failure_message] if failure_message else [],
+            "fullName": f"Calculator {describe} {title}",
+            "location": None,
+            "status": "failed" if failure_message else "passed",
+            "title": title,
+        }
+    )
 
-ASYNC_PROCESSOR_TESTS = """
-import { AsyncProcessor } from './source';
-
-describe('AsyncProcessor', () => {
-    let processor: AsyncProcessor;
-
-    beforeEach(() => {
-        processor = new AsyncProcessor();
-    });
-
-    describe('processData', () => {
-        it('should process data asynchronously', async () => {
-            const result = await processor.processData('hello');
-            expect(result).toBe('HELLO');
-        });
-
-        it('should handle empty string', async () => {
-            const result = await processor.processData('');
-            expect(result).toBe('');
-        });
-    });
-
-    describe('processMultiple', () => {
-        it('should process multiple items in parallel', async () => {
-            const items = ['hello', 'world', 'test'];
-            const results = await processor.processMultiple(items);
-            expect(results).toEqual(['HELLO', 'WORLD', 'TEST']);
-        });
-    });
-});
-"""
 
 # Mock Jest output samples
-MOCK_JEST_SUCCESS_OUTPUT = {
-    "numFailedTestSuites": 0,
-    "numFailedTests": 0,
-    "numPassedTestSuites": 1,
-    "numPassedTests": 4,
-    "numPendingTestSuites": 0,
-    "numPendingTests": 0,
-    "numRuntimeErrorTestSuites": 0,
-    "numTodoTests": 0,
-    "numTotalTestSuites": 1,
-    "numTotalTests": 4,
-    "success": True,
-    "testResults": [
+@cache
+def _mock_jest_success_output() -> Mapping[str, Any]:
+    return freeze(
         {
-            "assertionResults": [
-                {
-                    "ancestorTitles": ["Calculator", "add"],
-                    "failureMessages": [],
-                    "fullName": "Calculator add should add two positive numbers",
-                    "location": None,
-                    "status": "passed",
-                    "title": "should add two positive numbers",
-                },
-                {
-                    "ancestorTitles": ["Calculator", "add"],
-                    "failureMessages": [],
-                    "fullName": "Calculator add should add positive and negative numbers",
-                    "location": None,
-                    "status": "passed",
-                    "title": "should add positive and negative numbers",
-                },
-                {
-                    "ancestorTitles": ["Calculator", "subtract"],
-                    "failureMessages": [],
-                    "fullName": "Calculator subtract should subtract two numbers",
-                    "location": None,
-                    "status": "passed",
-                    "title": "should subtract two numbers",
-                },
+            **_JEST_RESULT_TEMPLATE,
+            "numPassedTestSuites": 1,
+            "numPassedTests": 4,
+            "numTotalTests": 4,
+            "testResults": [
                 {
-                    "ancestorTitles": ["Calculator", "divide"],
-                    "failureMessages": [],
-                    "fullName": "Calculator divide should throw error when dividing by zero",
-                    "location": None,
+                    **_TEST_FILE_RESULT_TEMPLATE,
+                    "assertionResults": [
+                        _calculator_assertion(
+                            "add", "should add two positive numbers"
+                        ),
+                        _calculator_assertion(
+                            "add", "should add positive and negative numbers"
+                        ),
+                        _calculator_assertion(
+                            "subtract", "should subtract two numbers"
+                        ),
+                        _calculator_assertion(
+                            "divide", "should throw error when dividing by zero"
+                        ),
+                    ],
                     "status": "passed",
-                    "title": "should throw error when dividing by zero",
-                },
+                }
             ],
-            "endTime": 1638360000000,
-            "message": "",
-            "name": "/tmp/test/source.test.ts",
-            "startTime": 1638360000000,
-            "status": "passed",
-            "summary": "",
         }
-    ],
-}
+    )
 
-MOCK_JEST_FAILURE_OUTPUT = {
-    "numFailedTestSuites": 1,
-    "numFailedTests": 2,
-    "numPassedTestSuites": 0,
-    "numPassedTests": 2,
-    "numPendingTestSuites": 0,
-    "numPendingTests": 0,
-    "numRuntimeErrorTestSuites": 0,
-    "numTodoTests": 0,
-    "numTotalTestSuites": 1,
-    "numTotalTests": 4,
-    "success": False,
-    "testResults": [
+
+@cache
+def _mock_jest_failure_output() -> Mapping[str, Any]:
+    return freeze(
         {
-            "assertionResults": [
-                {
-                    "ancestorTitles": ["Calculator", "add"],
-                    "failureMessages": [],
-                    "fullName": "Calculator add should add two positive numbers",
-                    "location": None,
-                    "status": "passed",
-                    "title": "should add two positive numbers",
-                },
-                {
-                    "ancestorTitles": ["Calculator", "add"],
-                    "failureMessages": ["Expected: 10, Received: 5"],
-                    "fullName": "Calculator add should fail with wrong expectation",
-                    "location": None,
-                    "status": "failed",
-                    "title": "should fail with wrong expectation",
-                },
-                {
-                    "ancestorTitles": ["Calculator", "subtract"],
-                    "failureMessages": [],
-                    "fullName": "Calculator subtract should subtract two numbers",
-                    "location": None,
-                    "status": "passed",
-                    "title": "should subtract two numbers",
-                },
+            **_JEST_RESULT_TEMPLATE,
+            "numFailedTestSuites": 1,
+            "numFailedTests": 2,
+            "numPassedTests": 2,
+            "numTotalTests": 4,
+            "success": False,
+            "testResults": [
                 {
-                    "ancestorTitles": ["Calculator", "divide"],
-                    "failureMessages": ["Expected: 'error', Received: Error"],
-                    "fullName": "Calculator divide should handle invalid test syntax",
-                    "location": None,
+                    **_TEST_FILE_RESULT_TEMPLATE,
+                    "assertionResults": [
+                        _calculator_assertion(
+                            "add", "should add two positive numbers"
+                        ),
+                        _calculator_assertion(
+                            "add",
+                            "should fail with wrong expectation",
+                            "Expected: 10, Received: 5",
+                        ),
+                        _calculator_assertion(
+                            "subtract", "should subtract two numbers"
+                        ),
+                        _calculator_assertion(
+                            "divide",
+                            "should handle invalid test syntax",
+                            "Expected: 'error', Received: Error",
+                        ),
+                    ],
                     "status": "failed",
-                    "title": "should handle invalid test syntax",
-                },
+                }
             ],
-            "endTime": 1638360000000,
-            "message": "",
-            "name": "/tmp/test/source.test.ts",
-            "startTime": 1638360000000,
-            "status": "failed",
-            "summary": "",
         }
-    ],
-}
+    )
+
+
+@cache
+def _mock_coverage_report() -> Mapping[str, Any]:
+    return freeze(
+        {
+            "total": {
+                "lines": {"total": 25, "covered": 20, "skipped": 0, "pct": 80.0},
+                "functions": {"total": 5, "covered": 4, "skipped": 0, "pct": 80.0},
+                "statements": {"total": 28, "covered": 22, "skipped": 0, "pct": 78.57},
+                "branches": {"total": 8, "covered": 6, "skipped": 0, "pct": 75.0},
+            }
+        }
+    )
+
 
-MOCK_COVERAGE_REPORT = {
-    "total": {
-        "lines": {"total": 25, "covered": 20, "skipped": 0, "pct": 80.0},
-        "functions": {"total": 5, "covered": 4, "skipped": 0, "pct": 80.0},
-        "statements": {"total": 28, "covered": 22, "skipped": 0, "pct": 78.57},
-        "branches": {"total": 8, "covered": 6, "skipped": 0, "pct": 75.0},
+# Jest configuration samples; the variants extend the shared base settings
+_JEST_CONFIG_BASE = freeze(
+    {
+        "preset": "ts-jest",
+        "testEnvironment": "node",
+        "collectCoverage": True,
+        "coverageReporters": ["json", "text"],
+        "testTimeout": 10000,
     }
-}
+)
 
-# Jest configuration samples
-JEST_CONFIG_BASIC = {
-    "preset": "ts-jest",
-    "testEnvironment": "node",
-    "collectCoverage": True,
-    "coverageReporters": ["json", "text"],
-    "testTimeout": 10000,
-    "setupFilesAfterEnv": [],
-}
 
-JEST_CONFIG_PARALLEL = {
-    "preset": "ts-jest",
-    "testEnvironment": "node",
-    "collectCoverage": True,
-    "coverageReporters": ["json", "text"],
-    "testTimeout": 10000,
-    "maxWorkers": 2,
-    "setupFilesAfterEnv": [],
-}
+@cache
+def _jest_config_basic() -> Mapping[str, Any]:
+    return freeze({**_JEST_CONFIG_BASE, "setupFilesAfterEnv": []})
 
-JEST_CONFIG_COVERAGE_THRESHOLD = {
-    "preset": "ts-jest",
-    "testEnvironment": "node",
-    "collectCoverage": True,
-    "coverageReporters": ["json", "text"],
-    "testTimeout": 10000,
-    "coverageThreshold": {
-        "global": {"branches": 70, "functions": 80, "lines": 80, "statements": 80}
-    },
-}
 
-# Package.json samples
-PACKAGE_JSON_BASIC = {
-    "name": "test-validation",
-    "version": "1.0.0",
-    "scripts": {"test": "jest"},
-    "devDependencies": {
-        "@types/jest": "^29.0.0",
-        "jest": "^29.0.0",
-        "ts-jest": "^29.0.0",
-        "@types/node": "^20.0.0",
-        "typescript": "^5.0.0",
-    },
-}
+@cache
+def _jest_config_parallel() -> Mapping[str, Any]:
+    return freeze({**_JEST_CONFIG_BASE, "maxWorkers": 2, "setupFilesAfterEnv": []})
+
+
+@cache
+def _jest_config_coverage_threshold() -> Mapping[str, Any]:
+    return freeze(
+        {
+            **_JEST_CONFIG_BASE,
+            "coverageThreshold": {
+                "global": {"branches": 70, "functions": 80, "lines": 80, "statements": 80}
+            },
+        }
+    )
 
-PACKAGE_JSON_WITH_DEPS = {
-    "name": "test-validation",
-    "version": "1.0.0",
-    "scripts": {"test": "jest"},
-    "dependencies": {"axios": "^1.0.0"},
-    "devDependencies": {
+
+# Package.json samples; both share the same scripts and devDependencies
+_PACKAGE_JSON_BASE = freeze(
+    {
+        "name": "test-validation",
+        "version": "1.0.0",
+        "scripts": {"test": "jest"},
+    }
+)
+
+_PACKAGE_JSON_DEV_DEPENDENCIES = freeze(
+    {
         "@types/jest": "^29.0.0",
         "jest": "^29.0.0",
         "ts-jest": "^29.0.0",
         "@types/node": "^20.0.0",
         "typescript": "^5.0.0",
-    },
+    }
+)
+
+
+@cache
+def _package_json_basic() -> Mapping[str, Any]:
+    return freeze(
+        {**_PACKAGE_JSON_BASE, "devDependencies": _PACKAGE_JSON_DEV_DEPENDENCIES}
+    )
+
+
+@cache
+def _package_json_with_deps() -> Mapping[str, Any]:
+    return freeze(
+        {
+            **_PACKAGE_JSON_BASE,
+            "dependencies": {"axios": "^1.0.0"},
+            "devDependencies": _PACKAGE_JSON_DEV_DEPENDENCIES,
+        }
+    )
+
+
+def get_mock_jest_success() -> Mapping[str, Any]:
+    """Return the shared read-only Jest success output; thaw() it to mutate."""
+    return _mock_jest_success_output()
+
+
+# Public fixture names and their loaders; each is built on first access
+_LAZY_FIXTURES = {
+    "VALID_CALCULATOR_CODE": _valid_calculator_code,
+    "VALID_CALCULATOR_TESTS": _valid_calculator_tests,
+    "HIGH_COVERAGE_CODE": _high_coverage_code,
+    "HIGH_COVERAGE_TESTS": _high_coverage_tests,
+    "INVALID_TYPESCRIPT_CODE": _invalid_typescript_code,
+    "INVALID_JEST_TESTS": _invalid_jest_tests,
+    "ASYNC_PROCESSOR_CODE": _async_processor_code,
+    "ASYNC_PROCESSOR_TESTS": _async_processor_tests,
+    "MOCK_JEST_SUCCESS_OUTPUT": _mock_jest_success_output,
+    "MOCK_JEST_FAILURE_OUTPUT": _mock_jest_failure_output,
+    "MOCK_COVERAGE_REPORT": _mock_coverage_report,
+    "JEST_CONFIG_BASIC": _jest_config_basic,
+    "JEST_CONFIG_PARALLEL": _jest_config_parallel,
+    "JEST_CONFIG_COVERAGE_THRESHOLD": _jest_config_coverage_threshold,
+    "PACKAGE_JSON_BASIC": _package_json_basic,
+    "PACKAGE_JSON_WITH_DEPS": _package_json_with_deps,
 }
 
 
+def __getattr__(name: str) -> Any:
+    """Build a lazily loaded fixture on first access (PEP 562)."""
+    try:
+        loader = _LAZY_FIXTURES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = loader()
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_FIXTURES))
+
+
+# (metric, total) pairs of the generated coverage report
+_COVERAGE_TOTALS = (
+    ("lines", 100),
+    ("functions", 10),
+    ("statements", 120),
+    ("branches", 20),
+)
+
+
+def _assertion_results(total_tests: int, failed_tests: int) -> list:
+    """Build the assertion results of a generated Jest run"""
+    failure_messages = ["Mock failure"] if failed_tests > 0 else []
+    return [
+        {
+            **(
+                _FAILED_ASSERTION_PROTO if i < failed_tests else _PASSED_ASSERTION_PROTO
+            ),
+            "ancestorTitles": ["TestSuite"],
+            "failureMessages": list(failure_messages),
+            "fullName": f"TestSuite test {i + 1}",
+            "title": f"test {i + 1}",
+        }
+        for i in range(total_tests)
+    ]
+
+
+@lru_cache(maxsize=256)
+def _frozen_assertion_results(total_tests: int, failed_tests: int) -> tuple:
+    """Shared read-only assertion results, one per (total, failed) pair"""
+    return freeze(_assertion_results(total_tests, failed_tests))
+
+
 # Helper functions for creating test data
 def create_mock_jest_result(
     success: bool = True,
@@ -463,42 +352,32 @@ def create_mock_jest_result(
     passed_tests: int = 4,
     failed_tests: int = 0,
     coverage_pct: float = 85.0,
+    mutable: bool = True,
 ) -> Dict[str, Any]:
-    """Create a mock Jest test result"""
-    return {
-        "numFailedTestSuites": 1 if failed_tests > 0 else 0,
-        "numFailedTests": failed_tests,
-        "numPassedTestSuites": 1 if passed_tests > 0 else 0,
-        "numPassedTests": passed_tests,
-        "numPendingTestSuites": 0,
-        "numPendingTests": 0,
-        "numRuntimeErrorTestSuites": 0,
-        "numTodoTests": 0,
-        "numTotalTestSuites": 1,
-        "numTotalTests": total_tests,
-        "success": success,
-        "testResults": [
-            {
-                "assertionResults": [
-                    {
-                        "ancestorTitles": ["TestSuite"],
-                        "failureMessages": ["Mock failure"] if failed_tests > 0 else [],
-                        "fullName": f"TestSuite test {i + 1}",
-                        "location": None,
-                        "status": "failed" if i < failed_tests else "passed",
-                        "title": f"test {i + 1}",
-                    }
-                    for i in range(total_tests)
-                ],
-                "endTime": 1638360000000,
-                "message": "",
-                "name": "/tmp/test/source.test.ts",
-                "startTime": 1638360000000,
-                "status": "failed" if failed_tests > 0 else "passed",
-                "summary": "",
-            }
-        ],
-    }
+    """Create a mock Jest test result
+
+    With mutable=False the assertion results are a cached, shared tuple of
+    read-only mappings instead of a freshly built list.
+    """
+    result = {**_JEST_RESULT_TEMPLATE}
+    result["numFailedTestSuites"] = 1 if failed_tests > 0 else 0
+    result["numFailedTests"] = failed_tests
+    result["numPassedTestSuites"] = 1 if passed_tests > 0 else 0
+    result["numPassedTests"] = passed_tests
+    result["numTotalTests"] = total_tests
+    result["success"] = success
+    result["testResults"] = [
+        {
+            **_TEST_FILE_RESULT_TEMPLATE,
+            "assertionResults": (
+                _assertion_results(total_tests, failed_tests)
+                if mutable
+                else _frozen_assertion_results(total_tests, failed_tests)
+            ),
+            "status": "failed" if failed_tests > 0 else "passed",
+        }
+    ]
+    return result
 
 
 def create_mock_coverage_report(
@@ -508,31 +387,33 @@ def create_mock_coverage_report(
     branches_pct: float = 75.0,
 ) -> Dict[str, Any]:
     """Create a mock coverage report"""
+    pcts = (lines_pct, functions_pct, statements_pct, branches_pct)
     return {
         "total": {
-            "lines": {
-                "total": 100,
-                "covered": int(100 * lines_pct / 100),
+            metric: {
+                "total": total,
+                "covered": int(total * pct / 100),
                 "skipped": 0,
-                "pct": lines_pct,
-            },
-            "functions": {
-                "total": 10,
-                "covered": int(10 * functions_pct / 100),
-                "skipped": 0,
-                "pct": functions_pct,
-            },
-            "statements": {
-                "total": 120,
-                "covered": int(120 * statements_pct / 100),
-                "skipped": 0,
-                "pct": statements_pct,
-            },
-            "branches": {
-                "total": 20,
-                "covered": int(20 * branches_pct / 100),
-                "skipped": 0,
-                "pct": branches_pct,
-            },
+                "pct": pct,
+            }
+            for (metric, total), pct in zip(_COVERAGE_TOTALS, pcts)
         }
     }
+
+
+@lru_cache(maxsize=64)
+def get_mock_coverage_report(
+    lines_pct: float = 85.0,
+    functions_pct: float = 90.0,
+    statements_pct: float = 82.0,
+    branches_pct: float = 75.0,
+) -> Mapping[str, Any]:
+    """Return a shared read-only coverage report; thaw() it to mutate"""
+    return freeze(
+        create_mock_coverage_report(
+            lines_pct, functions_pct, statements_pct, branches_pct
+        )
+    )
+
+
+_LAZY_FIXTURES["DEFAULT_COVERAGE_REPORT"] = get_mock_coverage_report
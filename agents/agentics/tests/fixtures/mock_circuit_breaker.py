@@ -7,8 +7,44 @@ from unittest.mock import MagicMock, patch
 from src.circuit_breaker import CircuitBreaker
 
 
-def create_mock_circuit_breaker():
-    """Create a mock circuit breaker that always allows calls through."""
+class _FakeCircuitBreaker:
+    """Pass-through circuit breaker without MagicMock's spec introspection."""
+
+    __slots__ = ("name", "state", "failure_count", "success_count")
+
+    def __init__(self, name="mock_circuit_breaker"):
+        self.name = name
+        self.state = "closed"
+        self.failure_count = 0
+        self.success_count = 0
+
+    def call(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    async def call_async(self, func, *args, **kwargs):
+        return await func(*args, **kwargs)
+
+    def get_status(self):
+        return {
+            "name": self.name,
+            "state": self.state,
+            "failure_count": self.failure_count,
+            "success_count": self.success_count,
+            "last_failure": None,
+            "next_attempt": None,
+        }
+
+
+def create_mock_circuit_breaker(*args, as_mock=False, **kwargs):
+    """Create a mock circuit breaker that always allows calls through.
+
+    Arguments meant for get_circuit_breaker are accepted and ignored. The
+    default is a new slotted stub per call; as_mock=True returns a
+    MagicMock(spec=CircuitBreaker) for tests that assert on .call.
+    """
+    if not as_mock:
+        return _FakeCircuitBreaker()
+
     mock_cb = MagicMock(spec=CircuitBreaker)
     mock_cb.call.side_effect = lambda func, *args, **kwargs: func(*args, **kwargs)
     mock_cb.state = "closed"
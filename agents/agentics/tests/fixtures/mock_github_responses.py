@@ -3,10 +3,93 @@ Standardized mock GitHub responses for consistent testing.
 These mocks provide realistic GitHub API responses to prevent LLM parsing issues.
 """
 
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from unittest.mock import MagicMock
 import json
 
 
+# Issue bodies of the canned ticket mocks, built once at import
+_WELL_STRUCTURED_BODY = """# Implement Timestamp-based UUID Generator in Obsidian
+
+## Description
+Add a command to Obsidian that generates a UUID based on the current timestamp and inserts it into the active note at the cursor position. This feature will allow users to quickly create unique identifiers for linking, referencing, or organizing content within their notes.
+
+## Requirements
+- The command must be accessible via Obsidian's command palette.
+- It should generate a UUID using the current timestamp, following the UUID v7 standard.
+- The generated UUID must be inserted at the current cursor position in the active note.
+- If no note is active when the command is executed, an appropriate error message should be displayed.
+
+## Acceptance Criteria
+- The command is visible in Obsidian's command palette when searched.
+- When the command is executed with an active note, a valid UUID v7 is generated and inserted at the cursor position.
+- The generated UUID is unique and correctly formatted according to the UUID v7 standard.
+- If no note is active when the command is executed, an error message is displayed to the user.
+
+## Implementation Notes
+This should integrate with the existing TimestampPlugin class and follow the established patterns for command registration and error handling."""
+
+_UNCLEAR_BODY = """# Do something
+
+## Description
+Make it better.
+
+## Requirements
+- It should work.
+
+## Acceptance Criteria
+- It works."""
+
+_MALFORMED_BODY = """# Title Missing Closing Bracket
+## Description
+Add a feature with mismatched brackets: { { {.
+## Requirements
+- Do stuff with errors
+## Acceptance Criteria
+- It should somehow work"""
+
+_LARGE_BODY = (
+    "# Large Complex Ticket\n"
+    + "Description " * 500
+    + "\n\n## Requirements\n- Req1\n- Req2\n- Req3\n\n## Acceptance Criteria\n- AC1\n- AC2\n- AC3"
+)
+
+# Sub-objects shared by every webhook payload
+_WEBHOOK_USER = MappingProxyType({"login": "testuser", "id": 12345})
+_WEBHOOK_REPOSITORY = MappingProxyType(
+    {
+        "full_name": "test/repo",
+        "name": "repo",
+        "owner": MappingProxyType({"login": "testuser"}),
+    }
+)
+
+
+@lru_cache(maxsize=128)
+def _issue_url(repo, number):
+    """Return the interned html_url of an issue, shared by its mocks."""
+    return sys.intern(f"https://github.com/{repo}/issues/{number}")
+
+
+@lru_cache(maxsize=128)
+def _repo_parts(full_name):
+    """Split "owner/name" into (owner, name); a bare name has no owner."""
+    owner, _, name = full_name.rpartition("/")
+    return owner, name
+
+
+def _create_user_mock(login):
+    """Create a GitHub user mock."""
+    mock_user = MagicMock()
+    mock_user.login = login
+    mock_user.id = 12345
+    mock_user.type = "User"
+    return mock_user
+
+
 def create_realistic_github_issue_mock(
     title="Test Issue",
     body="Test body",
@@ -18,15 +101,12 @@ def create_realistic_github_issue_mock(
     """Create a realistic GitHub issue mock with all expected attributes."""
 
     # Mock user
-    mock_user = MagicMock()
-    mock_user.login = user
-    mock_user.id = 12345
-    mock_user.type = "User"
+    mock_user = _create_user_mock(user)
 
     # Mock repository
     mock_repo = MagicMock()
     mock_repo.full_name = repo
-    mock_repo.name = repo.split("/")[1]
+    mock_repo.name = _repo_parts(repo)[1]
     mock_repo.owner = mock_user
 
     # Mock issue with comprehensive attributes
@@ -43,7 +123,7 @@ def create_realistic_github_issue_mock(
     mock_issue.assignees = []
     mock_issue.milestone = None
     mock_issue.comments = 0
-    mock_issue.html_url = f"https://github.com/{repo}/issues/{number}"
+    mock_issue.html_url = _issue_url(repo, number)
     mock_issue.repository = mock_repo
 
     # Mock repository methods
@@ -54,61 +134,24 @@ def create_realistic_github_issue_mock(
 
 def create_well_structured_ticket_mock():
     """Create a mock for a well-structured GitHub issue."""
-    body = """# Implement Timestamp-based UUID Generator in Obsidian
-
-## Description
-Add a command to Obsidian that generates a UUID based on the current timestamp and inserts it into the active note at the cursor position. This feature will allow users to quickly create unique identifiers for linking, referencing, or organizing content within their notes.
-
-## Requirements
-- The command must be accessible via Obsidian's command palette.
-- It should generate a UUID using the current timestamp, following the UUID v7 standard.
-- The generated UUID must be inserted at the current cursor position in the active note.
-- If no note is active when the command is executed, an appropriate error message should be displayed.
-
-## Acceptance Criteria
-- The command is visible in Obsidian's command palette when searched.
-- When the command is executed with an active note, a valid UUID v7 is generated and inserted at the cursor position.
-- The generated UUID is unique and correctly formatted according to the UUID v7 standard.
-- If no note is active when the command is executed, an error message is displayed to the user.
-
-## Implementation Notes
-This should integrate with the existing TimestampPlugin class and follow the established patterns for command registration and error handling."""
-
     return create_realistic_github_issue_mock(
         title="Implement Timestamp-based UUID Generator in Obsidian",
-        body=body,
+        body=_WELL_STRUCTURED_BODY,
         number=1,
     )
 
 
 def create_unclear_ticket_mock():
     """Create a mock for an unclear/vague GitHub issue."""
-    body = """# Do something
-
-## Description
-Make it better.
-
-## Requirements
-- It should work.
-
-## Acceptance Criteria
-- It works."""
-
-    return create_realistic_github_issue_mock(title="Do something", body=body, number=2)
+    return create_realistic_github_issue_mock(
+        title="Do something", body=_UNCLEAR_BODY, number=2
+    )
 
 
 def create_malformed_ticket_mock():
     """Create a mock for a malformed GitHub issue."""
-    body = """# Title Missing Closing Bracket
-## Description
-Add a feature with mismatched brackets: { { {.
-## Requirements
-- Do stuff with errors
-## Acceptance Criteria
-- It should somehow work"""
-
     return create_realistic_github_issue_mock(
-        title="Title Missing Closing Bracket", body=body, number=3
+        title="Title Missing Closing Bracket", body=_MALFORMED_BODY, number=3
     )
 
 
@@ -119,14 +162,8 @@ def create_empty_ticket_mock():
 
 def create_large_ticket_mock():
     """Create a mock for a large/complex GitHub issue."""
-    body = (
-        "# Large Complex Ticket\n"
-        + "Description " * 500
-        + "\n\n## Requirements\n- Req1\n- Req2\n- Req3\n\n## Acceptance Criteria\n- AC1\n- AC2\n- AC3"
-    )
-
     return create_realistic_github_issue_mock(
-        title="Large Complex Ticket", body=body, number=5
+        title="Large Complex Ticket", body=_LARGE_BODY, number=5
     )
 
 
@@ -168,14 +205,15 @@ def create_github_client_mock():
     mock_client.get_repo.return_value = mock_repo
 
     # Mock issue retrieval based on number
+    issues = {
+        1: well_structured_issue,
+        2: unclear_issue,
+        3: malformed_issue,
+        4: empty_issue,
+        5: large_issue,
+    }
+
     def mock_get_issue(number):
-        issues = {
-            1: well_structured_issue,
-            2: unclear_issue,
-            3: malformed_issue,
-            4: empty_issue,
-            5: large_issue,
-        }
         return issues.get(number, well_structured_issue)
 
     mock_repo.get_issue.side_effect = mock_get_issue
@@ -263,91 +301,98 @@ def create_github_client_with_errors():
     return mock_client
 
 
-def create_github_paginated_responses():
-    """Create mock responses for paginated GitHub API calls."""
+@dataclass(slots=True, frozen=True)
+class _IssueStub:
+    """Read-only stand-in for a listed issue."""
+
+    number: int
+    title: str
+    state: str
+
+
+def create_github_paginated_responses(as_mock=False):
+    """Create mock responses for paginated GitHub API calls.
+
+    The listed issues are frozen slotted stubs, new on every call; pass
+    as_mock=True for MagicMock issues that can be asserted on.
+    """
+    issue_type = MagicMock if as_mock else _IssueStub
+
     # Mock paginated issues
-    issues_page_1 = [
-        MagicMock(number=1, title="Issue 1", state="open"),
-        MagicMock(number=2, title="Issue 2", state="closed"),
-        MagicMock(number=3, title="Issue 3", state="open"),
-    ]
+    issues_page_1 = (
+        issue_type(number=1, title="Issue 1", state="open"),
+        issue_type(number=2, title="Issue 2", state="closed"),
+        issue_type(number=3, title="Issue 3", state="open"),
+    )
+
+    issues_page_2 = (
+        issue_type(number=4, title="Issue 4", state="open"),
+        issue_type(number=5, title="Issue 5", state="closed"),
+    )
 
-    issues_page_2 = [
-        MagicMock(number=4, title="Issue 4", state="open"),
-        MagicMock(number=5, title="Issue 5", state="closed"),
-    ]
+    all_issues = issues_page_1 + issues_page_2
+    closed_issues = (issues_page_2[1],)  # Only closed issues
 
     # Mock repository with pagination
     mock_repo = MagicMock()
     mock_repo.full_name = "test/repo"
     mock_repo.name = "repo"
 
-    # Mock paginated get_issues method
+    # Mock paginated get_issues method; each call gets its own list
     def mock_get_issues(state="open", sort="created", direction="desc", since=None):
-        if state == "open":
-            return issues_page_1 + issues_page_2
-        elif state == "closed":
-            return [issues_page_2[1]]  # Only closed issues
-        return issues_page_1 + issues_page_2
+        if state == "closed":
+            return list(closed_issues)
+        return list(all_issues)
 
     mock_repo.get_issues.side_effect = mock_get_issues
 
-    return mock_repo, issues_page_1 + issues_page_2
+    return mock_repo, list(all_issues)
 
 
+@lru_cache(maxsize=None)
 def create_github_webhook_payloads():
-    """Create mock GitHub webhook payloads for testing webhook handling."""
-    issue_opened = {
-        "action": "opened",
-        "issue": {
-            "number": 1,
-            "title": "Test Issue",
-            "body": "Test issue body",
-            "state": "open",
-            "user": {"login": "testuser", "id": 12345},
-        },
-        "repository": {
-            "full_name": "test/repo",
-            "name": "repo",
-            "owner": {"login": "testuser"},
-        },
+    """Create mock GitHub webhook payloads for testing webhook handling.
+
+    The payloads are read-only and shared between callers; use
+    _frozen.thaw() for a mutable deep copy.
+    """
+    issue = {
+        "number": 1,
+        "title": "Test Issue",
+        "body": "Test issue body",
+        "user": _WEBHOOK_USER,
     }
 
-    issue_closed = {
-        "action": "closed",
-        "issue": {
-            "number": 1,
-            "title": "Test Issue",
-            "body": "Test issue body",
-            "state": "closed",
-            "user": {"login": "testuser", "id": 12345},
-        },
-        "repository": {
-            "full_name": "test/repo",
-            "name": "repo",
-            "owner": {"login": "testuser"},
-        },
-    }
-
-    pr_opened = {
-        "action": "opened",
-        "pull_request": {
-            "number": 1,
-            "title": "Test PR",
-            "body": "Test PR body",
-            "state": "open",
-            "user": {"login": "testuser", "id": 12345},
-        },
-        "repository": {
-            "full_name": "test/repo",
-            "name": "repo",
-            "owner": {"login": "testuser"},
-        },
-    }
-
-    return {
-        "issue_opened": issue_opened,
-        "issue_closed": issue_closed,
-        "pr_opened": pr_opened,
-    }
-    return mock_client
+    return MappingProxyType(
+        {
+            "issue_opened": MappingProxyType(
+                {
+                    "action": "opened",
+                    "issue": MappingProxyType({**issue, "state": "open"}),
+                    "repository": _WEBHOOK_REPOSITORY,
+                }
+            ),
+            "issue_closed": MappingProxyType(
+                {
+                    "action": "closed",
+                    "issue": MappingProxyType({**issue, "state": "closed"}),
+                    "repository": _WEBHOOK_REPOSITORY,
+                }
+            ),
+            "pr_opened": MappingProxyType(
+                {
+                    "action": "opened",
+                    "pull_request": MappingProxyType(
+                        {
+                            "number": 1,
+                            "title": "Test PR",
+                            "body": "Test PR body",
+                            "state": "open",
+                            "user": _WEBHOOK_USER,
+                        }
+                    ),
+                    "repository": _WEBHOOK_REPOSITORY,
+                }
+            ),
+        }
+    )
@@ -3,135 +3,105 @@ Standardized mock LLM responses for consistent testing.
 These mocks provide realistic LLM responses to prevent real API calls in unit tests.
 """
 
-from unittest.mock import MagicMock
+from collections.abc import Mapping
+from functools import cache
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock
+import copy
 import json
+import os
 
+try:
+    import orjson
 
-def create_mock_llm_response(response_text: str) -> MagicMock:
-    """Create a mock LLM client that returns a predetermined response."""
-    mock_llm = MagicMock()
-    mock_llm.invoke.return_value = response_text
-    mock_llm.return_value = response_text
-    return mock_llm
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 
-def create_process_llm_mock_responses():
-    """Create mock responses for ProcessLLMAgent tests."""
+# ProcessLLMAgent ticket responses live next to this module and are only
+# read when a test asks for them
+_LLM_RESPONSES_DIR = os.path.join(os.path.dirname(__file__), "llm_responses")
 
-    # Well-structured ticket response
-    well_structured_response = json.dumps(
-        {
-            "title": "# Implement Timestamp-based UUID Generator in Obsidian",
-            "description": "Add a command to Obsidian that generates a UUID (Universally Unique Identifier) based on the current timestamp and inserts it into the active note at the cursor position. This feature will allow users to quickly create unique identifiers for linking, referencing, or organizing content within their notes. The UUID should follow the UUID v7 standard, which is the latest version, offering improved performance and privacy over earlier versions like UUID v1.",
-            "requirements": [
-                "The command must be accessible via Obsidian's command palette.",
-                "It should generate a UUID using the current timestamp, following the UUID v7 standard.",
-                "The generated UUID must be inserted at the current cursor position in the active note.",
-                "If no note is active when the command is executed, an appropriate error message should be displayed.",
-            ],
-            "acceptance_criteria": [
-                "The command is visible in Obsidian's command palette when searched.",
-                "When the command is executed with an active note, a valid UUID v7 is generated and inserted at the cursor position.",
-                "The generated UUID is unique and correctly formatted according to the UUID v7 standard.",
-                "If no note is active when the command is executed, an error message is displayed to the user.",
-            ],
-            "implementation_steps": [
-                "Install the uuid package for UUID v7 generation",
-                "Create a new command in the TimestampPlugin class",
-                "Implement UUID generation logic using current timestamp",
-                "Add cursor position detection and text insertion",
-                "Add error handling for cases when no active note exists",
-            ],
-            "npm_packages": ["uuid"],
-            "manual_implementation_notes": "Ensure the plugin follows Obsidian's plugin development guidelines and handles edge cases gracefully.",
-        }
-    )
 
-    # Sloppy ticket response
-    sloppy_response = json.dumps(
-        {
-            "title": "Implement Timestamp-based UUID Generator in Obsidian",
-            "description": "Add a command to Obsidian that generates a UUID (Universally Unique Identifier) based on the current timestamp and inserts it into the active note at the cursor position. This feature will allow users to quickly create unique identifiers for linking, referencing, or organizing content within their notes. The UUID should follow the UUID v7 standard, which is the latest version, offering improved performance and privacy over earlier versions like UUID v1.",
-            "requirements": [
-                "The command must be accessible via Obsidian's command palette.",
-                "It should generate a UUID using the current timestamp, following the UUID v7 standard.",
-                "The generated UUID must be inserted at the current cursor position in the active note.",
-                "If no note is active when the command is executed, an appropriate error message should be displayed.",
-                "When this is considering done",
-            ],
-            "acceptance_criteria": [
-                "The command is visible in Obsidian's command palette when searched.",
-                "When the command is executed with an active note, a valid UUID v7 is generated and inserted at the cursor position.",
-                "The generated UUID is unique and correctly formatted according to the UUID v7 standard.",
-                "If no note is active when the command is executed, an error message is displayed to the user.",
-            ],
-            "implementation_steps": [],
-            "npm_packages": [],
-            "manual_implementation_notes": "",
-        }
-    )
+@cache
+def _process_llm_tickets():
+    """ProcessLLMAgent tickets keyed by scenario, as parsed from disk."""
+    path = os.path.join(_LLM_RESPONSES_DIR, "process_llm_tickets.json")
+    with open(path, "rb") as f:
+        return MappingProxyType(_loads(f.read()))
 
-    # Long ticket response
-    long_response = json.dumps(
-        {
-            "title": "# Very Long Ticket Title",
-            "description": "Description with lots of details " * 50,
-            "requirements": ["Req1", "Req2"],
-            "acceptance_criteria": ["AC1", "AC2"],
-            "implementation_steps": [],
-            "npm_packages": [],
-            "manual_implementation_notes": "",
-        }
-    )
 
-    # Empty ticket response
-    empty_response = json.dumps(
-        {
-            "title": "Untitled Task",
-            "description": "No description provided",
-            "requirements": [],
-            "acceptance_criteria": [],
-            "implementation_steps": [],
-            "npm_packages": [],
-            "manual_implementation_notes": "",
-        }
-    )
+@cache
+def _process_llm_ticket_json():
+    """Serialized ProcessLLMAgent tickets keyed by scenario.
 
-    # Malformed ticket response
-    malformed_response = json.dumps(
+    Serialized with json.dumps, not orjson, so responses keep the stdlib's
+    separators and ASCII escaping.
+    """
+    return MappingProxyType(
         {
-            "title": "# Title",
-            "description": "Test description",
-            "requirements": ["Req1"],
-            "acceptance_criteria": ["AC1"],
-            "implementation_steps": [],
-            "npm_packages": [],
-            "manual_implementation_notes": "",
+            scenario: json.dumps(ticket)
+            for scenario, ticket in _process_llm_tickets().items()
         }
     )
 
-    # Dict input response
-    dict_response = json.dumps(
+
+class _StubLLM:
+    """Minimal LLM client that always returns the same response."""
+
+    __slots__ = ("_response",)
+
+    def __init__(self, response_text: str):
+        self._response = response_text
+
+    def invoke(self, *args, **kwargs):
+        return self._response
+
+    async def ainvoke(self, *args, **kwargs):
+        return self._response
+
+    def __call__(self, *args, **kwargs):
+        return self._response
+
+
+def create_mock_llm_response(response_text: str, as_mock: bool = False):
+    """Create a mock LLM client that returns a predetermined response.
+
+    Returns a new slotted stub; pass as_mock=True for a MagicMock whose
+    calls can be inspected or reconfigured.
+    """
+    if not as_mock:
+        return _StubLLM(response_text)
+
+    mock_llm = MagicMock()
+    mock_llm.invoke.return_value = response_text
+    mock_llm.return_value = response_text
+    return mock_llm
+
+
+def create_process_llm_mock_responses(as_json: bool = True):
+    """Create mock responses for ProcessLLMAgent tests.
+
+    The mocks answer with JSON strings, as a real LLM would. Pass
+    as_json=False to have them answer with the ticket dicts themselves;
+    each call gets its own copies, so agents may modify them.
+    """
+    if not as_json:
+        return MappingProxyType(
+            {
+                scenario: _StubLLM(copy.deepcopy(ticket))
+                for scenario, ticket in _process_llm_tickets().items()
+            }
+        )
+
+    return MappingProxyType(
         {
-            "title": "Test Ticket",
-            "description": "Test description",
-            "requirements": ["Req1"],
-            "acceptance_criteria": ["AC1"],
-            "implementation_steps": [],
-            "npm_packages": [],
-            "manual_implementation_notes": "",
+            scenario: create_mock_llm_response(response)
+            for scenario, response in _process_llm_ticket_json().items()
         }
     )
 
-    return {
-        "well_structured": create_mock_llm_response(well_structured_response),
-        "sloppy": create_mock_llm_response(sloppy_response),
-        "long": create_mock_llm_response(long_response),
-        "empty": create_mock_llm_response(empty_response),
-        "malformed": create_mock_llm_response(malformed_response),
-        "dict": create_mock_llm_response(dict_response),
-    }
-
 
 def create_code_generator_mock_responses():
     """Create mock responses for CodeGeneratorAgent tests."""
@@ -210,12 +180,14 @@ describe('TimestampPlugin', () => {
 
     mock_llm = MockLLM()
 
-    return {
-        "code_generation": mock_llm,
-        "test_generation": create_mock_llm_response(combined_response),
-        "vague": create_mock_llm_response(vague_response),
-        "feedback": create_mock_llm_response(feedback_response),
-    }
+    return MappingProxyType(
+        {
+            "code_generation": mock_llm,
+            "test_generation": create_mock_llm_response(combined_response),
+            "vague": create_mock_llm_response(vague_response),
+            "feedback": create_mock_llm_response(feedback_response),
+        }
+    )
 
 
 def create_mock_prompt_template():
@@ -225,134 +197,185 @@ def create_mock_prompt_template():
     return mock_template
 
 
+# Chunks yielded by the streaming LLM mock
+_STREAM_CHUNKS = (
+    "This is the first chunk of response. ",
+    "Continuing with more content here. ",
+    "Adding some technical details. ",
+    "Finally, concluding the response.",
+)
+
+
 def create_streaming_llm_mock():
     """Create a mock LLM client that supports streaming responses."""
     mock_llm = MagicMock()
 
     def mock_stream(prompt):
         """Mock streaming response that yields chunks."""
-        response_chunks = [
-            "This is the first chunk of response. ",
-            "Continuing with more content here. ",
-            "Adding some technical details. ",
-            "Finally, concluding the response.",
-        ]
-        for chunk in response_chunks:
-            yield chunk
+        return iter(_STREAM_CHUNKS)
 
     mock_llm.stream.side_effect = mock_stream
     mock_llm.astream = AsyncMock(side_effect=mock_stream)
     return mock_llm
 
 
+# (scenario, exception type, invoke message, stream message) per LLM failure
+_LLM_ERROR_SCENARIOS = (
+    ("timeout", TimeoutError, "Request timed out", "Streaming request timed out"),
+    (
+        "connection",
+        ConnectionError,
+        "Failed to connect to Ollama server",
+        "Failed to connect to Ollama server",
+    ),
+    (
+        "model_not_found",
+        ValueError,
+        "model 'nonexistent-model' not found",
+        "model 'nonexistent-model' not found",
+    ),
+    (
+        "rate_limit",
+        Exception,
+        "Rate limit exceeded. Please try again later.",
+        "Rate limit exceeded. Please try again later.",
+    ),
+    ("invalid_prompt", ValueError, "Invalid prompt format", "Invalid prompt format"),
+)
+
+
+def _create_error_mock(invoke_error, stream_error):
+    """Create a mock LLM client whose invoke and stream raise the given errors."""
+    error_mock = MagicMock()
+    error_mock.invoke.side_effect = invoke_error
+    error_mock.stream.side_effect = stream_error
+    return error_mock
+
+
 def create_llm_error_scenarios():
     """Create mock LLM clients that simulate various error conditions."""
+    return {
+        name: _create_error_mock(error_type(invoke_message), error_type(stream_message))
+        for name, error_type, invoke_message, stream_message in _LLM_ERROR_SCENARIOS
+    }
 
-    # Timeout error
-    timeout_mock = MagicMock()
-    timeout_mock.invoke.side_effect = TimeoutError("Request timed out")
-    timeout_mock.stream.side_effect = TimeoutError("Streaming request timed out")
 
-    # Connection error
-    connection_mock = MagicMock()
-    connection_mock.invoke.side_effect = ConnectionError(
-        "Failed to connect to Ollama server"
-    )
-    connection_mock.stream.side_effect = ConnectionError(
-        "Failed to connect to Ollama server"
-    )
+# Batch scenarios and the responses each one returns
+_BATCH_PAYLOADS = {
+    "single_prompt": ("Response to single prompt",),
+    "multiple_prompts": (
+        "Response to first prompt",
+        "Response to second prompt",
+        "Response to third prompt",
+    ),
+    "empty_prompt": ("",),
+    "long_prompt": (
+        "This is a very long response that contains multiple sentences and paragraphs of content to test how the system handles verbose LLM outputs."
+        * 10,
+    ),
+}
+
+
+def _create_batch_mock(responses):
+    responses = list(responses)
+    mock_llm = MagicMock()
+    mock_llm.batch_invoke.return_value = responses
+    mock_llm.abatch_invoke = AsyncMock(return_value=responses)
+    return mock_llm
 
-    # Model not found error
-    model_not_found_mock = MagicMock()
-    model_not_found_mock.invoke.side_effect = ValueError(
-        "model 'nonexistent-model' not found"
-    )
-    model_not_found_mock.stream.side_effect = ValueError(
-        "model 'nonexistent-model' not found"
-    )
 
-    # Rate limiting error
-    rate_limit_mock = MagicMock()
-    rate_limit_mock.invoke.side_effect = Exception(
-        "Rate limit exceeded. Please try again later."
-    )
-    rate_limit_mock.stream.side_effect = Exception(
-        "Rate limit exceeded. Please try again later."
-    )
+class _LazyBatchMocks(Mapping):
+    """Batch mocks keyed by scenario, each built on first access."""
 
-    # Invalid prompt error
-    invalid_prompt_mock = MagicMock()
-    invalid_prompt_mock.invoke.side_effect = ValueError("Invalid prompt format")
-    invalid_prompt_mock.stream.side_effect = ValueError("Invalid prompt format")
+    __slots__ = ("_mocks",)
 
-    return {
-        "timeout": timeout_mock,
-        "connection": connection_mock,
-        "model_not_found": model_not_found_mock,
-        "rate_limit": rate_limit_mock,
-        "invalid_prompt": invalid_prompt_mock,
-    }
+    def __init__(self):
+        self._mocks = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._mocks[key]
+        except KeyError:
+            mock_llm = self._mocks[key] = _create_batch_mock(_BATCH_PAYLOADS[key])
+            return mock_llm
+
+    def __iter__(self):
+        return iter(_BATCH_PAYLOADS)
+
+    def __len__(self):
+        return len(_BATCH_PAYLOADS)
 
 
 def create_llm_batch_responses():
-    """Create mock responses for batch processing scenarios."""
-    batch_responses = {
-        "single_prompt": ["Response to single prompt"],
-        "multiple_prompts": [
-            "Response to first prompt",
-            "Response to second prompt",
-            "Response to third prompt",
-        ],
-        "empty_prompt": [""],
-        "long_prompt": [
-            "This is a very long response that contains multiple sentences and paragraphs of content to test how the system handles verbose LLM outputs."
-            * 10
-        ],
-    }
+    """Create mock responses for batch processing scenarios.
 
-    def create_batch_mock(responses):
-        mock_llm = MagicMock()
-        mock_llm.batch_invoke.return_value = responses
-        mock_llm.abatch_invoke = AsyncMock(return_value=responses)
-        return mock_llm
+    Mocks are only built for the scenarios a test actually looks up.
+    """
+    return _LazyBatchMocks()
 
-    return {
-        key: create_batch_mock(responses) for key, responses in batch_responses.items()
-    }
 
+class _MemoryLLM:
+    """LLM stub that records each exchange in its conversation history."""
 
-def create_llm_with_memory():
-    """Create a mock LLM that maintains conversation memory."""
-    mock_llm = MagicMock()
-    conversation_history = []
+    __slots__ = ("history",)
+
+    def __init__(self):
+        self.history = []
 
-    def mock_invoke_with_memory(prompt):
-        conversation_history.append(f"User: {prompt}")
+    def invoke(self, prompt):
+        history = self.history
+        history.append(f"User: {prompt}")
         # Generate response based on history
-        response = (
-            f"Response to: {prompt} (History length: {len(conversation_history)})"
-        )
-        conversation_history.append(f"Assistant: {response}")
+        response = f"Response to: {prompt} (History length: {len(history)})"
+        history.append(f"Assistant: {response}")
         return response
 
-    mock_llm.invoke.side_effect = mock_invoke_with_memory
-    mock_llm.get_conversation_history = lambda: conversation_history.copy()
-    mock_llm.clear_history = lambda: conversation_history.clear()
+    # Snapshots are immutable tuples, optionally of only the last n entries;
+    # tests that only check growth can use get_history_len instead.
+    def get_conversation_history(self, n=None):
+        return tuple(self.history if n is None else self.history[-n:])
+
+    def get_history_len(self):
+        return len(self.history)
 
+    def clear_history(self):
+        self.history.clear()
+
+
+def create_llm_with_memory(as_mock: bool = False):
+    """Create a mock LLM that maintains conversation memory.
+
+    Returns a new slotted stub with its own history on every call; pass
+    as_mock=True for a MagicMock whose invoke calls can be asserted on.
+    """
+    memory_llm = _MemoryLLM()
+    if not as_mock:
+        return memory_llm
+
+    mock_llm = MagicMock()
+    mock_llm.invoke.side_effect = memory_llm.invoke
+    mock_llm.get_conversation_history = memory_llm.get_conversation_history
+    mock_llm.get_history_len = memory_llm.get_history_len
+    mock_llm.clear_history = memory_llm.clear_history
     return mock_llm
 
 
+_IMAGE_RESPONSE = (
+    "I can see an image in your input. It appears to be a technical diagram."
+)
+
+
 def create_multimodal_llm_mock():
     """Create a mock LLM that handles multimodal inputs (text + images, etc.)."""
     mock_llm = MagicMock()
 
     def mock_invoke_multimodal(inputs):
-        if isinstance(inputs, dict) and "image" in inputs:
-            return "I can see an image in your input. It appears to be a technical diagram."
-        elif isinstance(inputs, dict) and "text" in inputs:
-            return f"Processing text input: {inputs['text'][:50]}..."
-        else:
-            return "Standard text response"
+        if isinstance(inputs, dict):
+            if "image" in inputs:
+                return _IMAGE_RESPONSE
+            if "text" in inputs:
+                return f"Processing text input: {inputs['text'][:50]}..."
+        return "Standard text response"
 
     mock_llm.invoke.side_effect = mock_invoke_multimodal
     mock_llm.ainvoke = AsyncMock(side_effect=mock_invoke_multimodal)
@@ -360,19 +383,23 @@ def create_multimodal_llm_mock():
     return mock_llm
 
 
+def _approx_token_count(text):
+    """Rough token estimation: one token per space-separated word."""
+    return text.count(" ") + 1 if text else 0
+
+
 def create_llm_with_token_limits():
     """Create a mock LLM that enforces token limits."""
     mock_llm = MagicMock()
 
     def mock_invoke_with_limits(prompt):
-        token_count = len(prompt.split())  # Rough token estimation
+        token_count = _approx_token_count(prompt)
         if token_count > 100:
             raise ValueError("Input exceeds maximum token limit of 100")
         return f"Response to {token_count} tokens"
 
     mock_llm.invoke.side_effect = mock_invoke_with_limits
     mock_llm.max_tokens = 100
-    mock_llm.count_tokens = lambda text: len(text.split())
+    mock_llm.count_tokens = _approx_token_count
 
     return mock_llm
-    return mock_template
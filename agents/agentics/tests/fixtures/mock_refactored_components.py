@@ -4,19 +4,29 @@ Provides mocks for all new architecture components including AgentComposer,
 ComposableWorkflows, immutable state management, and collaborative generation.
 """
 
-from unittest.mock import MagicMock, patch, AsyncMock
+from collections.abc import Mapping
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from unittest.mock import MagicMock, Mock, patch, AsyncMock
+import importlib
 import json
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field
+import sys
+from types import MappingProxyType
+from typing import Any, List, Optional
+from dataclasses import dataclass, field, replace
 from langchain_core.runnables import Runnable
 from langchain.tools import Tool
 
+from ._frozen import freeze
+
 # Import the actual classes to mock
 from src.agent_composer import AgentComposer, WorkflowConfig
 from src.composable_workflows import ComposableWorkflows
+from src.config import LLMConfig
 from src.state import CodeGenerationState
 from src.models import CodeSpec, TestSpecification, ValidationResults
 from src.collaborative_generator import CollaborativeGenerator
+from src.services import GitHubClient, OllamaClient, ServiceManager
 from src.monitoring import (
     MetricsStore,
     StructuredLogger,
@@ -29,19 +39,23 @@ from src.circuit_breaker import CircuitBreaker, ServiceHealthMonitor as HealthMo
 # ===== CONFIGURATION AND ENVIRONMENT MOCKS =====
 
 
+# LLMConfig is a frozen dataclass of scalars, so one instance can be shared
+_MOCK_LLM_CONFIG = LLMConfig(
+    model="llama3.2:3b",
+    base_url="http://localhost:11434",
+    temperature=0.7,
+    top_p=0.9,
+    top_k=40,
+    min_p=0.05,
+    presence_penalty=0.0,
+    num_ctx=4096,
+    num_predict=1024,
+)
+
+
 def create_mock_llm_config():
     """Create mock LLM configuration."""
-    mock_config = MagicMock()
-    mock_config.model = "llama3.2:3b"
-    mock_config.base_url = "http://localhost:11434"
-    mock_config.temperature = 0.7
-    mock_config.top_p = 0.9
-    mock_config.top_k = 40
-    mock_config.min_p = 0.05
-    mock_config.presence_penalty = 0.0
-    mock_config.num_ctx = 4096
-    mock_config.num_predict = 1024
-    return mock_config
+    return _MOCK_LLM_CONFIG
 
 
 def create_mock_config():
@@ -96,12 +110,15 @@ def create_mock_github_client():
     return mock_client
 
 
-def create_mock_service_manager():
-    """Create mock service manager with all clients."""
+def create_mock_service_manager(ollama_reasoning=None, ollama_code=None, github=None):
+    """Create mock service manager with all clients.
+
+    Client mocks that are not passed in are created.
+    """
     mock_manager = MagicMock(spec=ServiceManager)
-    mock_manager.ollama_reasoning = create_mock_ollama_client()
-    mock_manager.ollama_code = create_mock_ollama_client()
-    mock_manager.github = create_mock_github_client()
+    mock_manager.ollama_reasoning = ollama_reasoning or create_mock_ollama_client()
+    mock_manager.ollama_code = ollama_code or create_mock_ollama_client()
+    mock_manager.github = github or create_mock_github_client()
     mock_manager.check_services_health = AsyncMock(
         return_value={
             "ollama_reasoning": True,
@@ -116,23 +133,30 @@ def create_mock_service_manager():
 
 # ===== CIRCUIT BREAKER AND HEALTH MONITOR MOCKS =====
 
+# These and the monitoring mocks below are plain Mocks: nothing uses them as
+# context managers, containers or numbers, so MagicMock's dunder setup is
+# wasted on them.
+
 
-def create_mock_circuit_breaker():
-    """Create mock circuit breaker that always allows calls."""
-    mock_cb = MagicMock(spec=CircuitBreaker)
+def create_mock_circuit_breaker(name: str = "mock_circuit_breaker", **kwargs):
+    """Create mock circuit breaker that always allows calls.
+
+    Accepts get_circuit_breaker's arguments so it can stand in for it.
+    """
+    mock_cb = Mock(spec=CircuitBreaker)
     mock_cb.call.side_effect = lambda func, *args, **kwargs: func(*args, **kwargs)
     mock_cb.state = "closed"
     mock_cb.failure_count = 0
-    mock_cb.name = "mock_circuit_breaker"
+    mock_cb.name = name
     return mock_cb
 
 
 def create_mock_health_monitor():
     """Create mock health monitor."""
-    mock_monitor = MagicMock(spec=HealthMonitor)
+    mock_monitor = Mock(spec=HealthMonitor)
     mock_monitor.is_service_healthy.return_value = True
     mock_monitor.register_service.return_value = None
-    mock_monitor.check_health.return_value = True
+    mock_monitor.check_service_health.return_value = True
     return mock_monitor
 
 
@@ -155,22 +179,61 @@ def patch_health_monitor():
 # ===== WORKFLOW AND AGENT MOCKS =====
 
 
+def _agent_process(marker: str, input, config=None):
+    """Mark dict input as processed; other input, such as state, passes through."""
+    if isinstance(input, dict):
+        # Copy rather than update so the caller's dict is left untouched
+        return {**input, marker: True}
+    return input
+
+
 def create_mock_agent(name: str = "mock_agent"):
     """Create mock agent that implements Runnable interface."""
     mock_agent = MagicMock(spec=Runnable)
     mock_agent.name = name
+    mock_agent.invoke.side_effect = partial(_agent_process, f"{name}_processed")
+    return mock_agent
 
-    def mock_invoke(input, config=None):
-        # Return modified input with agent processing marker
-        if isinstance(input, dict):
-            return {**input, f"{name}_processed": True}
-        elif hasattr(input, "__dict__"):
-            # For CodeGenerationState or similar dataclasses
-            return input
-        return input
 
-    mock_agent.invoke.side_effect = mock_invoke
-    return mock_agent
+# Agents registered on the mock AgentComposer
+_AGENT_NAMES = (
+    "fetch_issue",
+    "ticket_clarity",
+    "implementation_planner",
+    "code_extractor",
+    "collaborative_generator",
+    "code_integrator",
+    "post_test_runner",
+    "code_reviewer",
+    "output_result",
+)
+
+
+class _LazyAgents(Mapping):
+    """Mock agents keyed by name, each built on first access."""
+
+    __slots__ = ("_agents",)
+
+    def __init__(self):
+        self._agents = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._agents[name]
+        except KeyError:
+            if name not in _AGENT_NAMES:
+                raise
+            agent = self._agents[name] = create_mock_agent(name)
+            return agent
+
+    def __contains__(self, name):
+        return name in _AGENT_NAMES
+
+    def __iter__(self):
+        return iter(_AGENT_NAMES)
+
+    def __len__(self):
+        return len(_AGENT_NAMES)
 
 
 def create_mock_agent_composer():
@@ -178,24 +241,13 @@ def create_mock_agent_composer():
     mock_composer = MagicMock(spec=AgentComposer)
 
     # Mock agents registry
-    mock_agents = {
-        "fetch_issue": create_mock_agent("fetch_issue"),
-        "ticket_clarity": create_mock_agent("ticket_clarity"),
-        "implementation_planner": create_mock_agent("implementation_planner"),
-        "code_extractor": create_mock_agent("code_extractor"),
-        "collaborative_generator": create_mock_agent("collaborative_generator"),
-        "code_integrator": create_mock_agent("code_integrator"),
-        "post_test_runner": create_mock_agent("post_test_runner"),
-        "code_reviewer": create_mock_agent("code_reviewer"),
-        "output_result": create_mock_agent("output_result"),
-    }
+    mock_agents = _LazyAgents()
     mock_composer.agents = mock_agents
 
     # Mock tools registry
-    mock_tools = [
-        MagicMock(spec=Tool, name="mcp_context_search"),
-        MagicMock(spec=Tool, name="mcp_memory_store"),
-    ]
+    mock_tools = [MagicMock(spec=Tool), MagicMock(spec=Tool)]
+    mock_tools[0].name = "mcp_context_search"
+    mock_tools[1].name = "mcp_memory_store"
     mock_composer.tools = {tool.name: tool for tool in mock_tools}
 
     # Mock workflows registry
@@ -227,8 +279,12 @@ def create_mock_agent_composer():
     return mock_composer
 
 
-def create_mock_composable_workflows():
-    """Create mock ComposableWorkflows with all sub-workflows."""
+def create_mock_composable_workflows(separate_llms: bool = False):
+    """Create mock ComposableWorkflows with all sub-workflows.
+
+    llm_reasoning and llm_code are the same Ollama client mock unless
+    separate_llms=True, for tests that tell the two apart.
+    """
     mock_workflows = MagicMock(spec=ComposableWorkflows)
 
     # Mock individual workflows
@@ -248,7 +304,9 @@ def create_mock_composable_workflows():
 
     # Mock service clients
     mock_workflows.llm_reasoning = create_mock_ollama_client()
-    mock_workflows.llm_code = create_mock_ollama_client()
+    mock_workflows.llm_code = (
+        create_mock_ollama_client() if separate_llms else mock_workflows.llm_reasoning
+    )
     mock_workflows.github_client = create_mock_github_client()
 
     # Mock processing method
@@ -285,9 +343,12 @@ def create_mock_validation_results():
     return ValidationResults(success=True, errors=[], warnings=["Minor style issue"])
 
 
-def create_mock_code_generation_state():
-    """Create mock CodeGenerationState with realistic data."""
-    return CodeGenerationState(
+def create_mock_code_generation_state(**overrides) -> CodeGenerationState:
+    """Create mock CodeGenerationState with realistic data.
+
+    Keyword overrides replace individual fields.
+    """
+    state = CodeGenerationState(
         issue_url="https://github.com/test/repo/issues/1",
         ticket_content="# Test Issue\n\nTest description",
         title="Test Issue",
@@ -309,6 +370,7 @@ def create_mock_code_generation_state():
         method_name="test",
         command_id="test-command",
     )
+    return replace(state, **overrides) if overrides else state
 
 
 # ===== COLLABORATIVE GENERATOR MOCKS =====
@@ -343,7 +405,7 @@ def create_mock_collaborative_generator():
 
 def create_mock_metrics_store():
     """Create mock MetricsStore."""
-    mock_store = MagicMock(spec=MetricsStore)
+    mock_store = Mock(spec=MetricsStore)
     mock_store.increment_counter.return_value = None
     mock_store.record_timer.return_value = None
     mock_store.set_gauge.return_value = None
@@ -357,10 +419,10 @@ def create_mock_metrics_store():
     return mock_store
 
 
-def create_mock_structured_logger():
+def create_mock_structured_logger(name: str = "mock_logger"):
     """Create mock StructuredLogger."""
-    mock_logger = MagicMock(spec=StructuredLogger)
-    mock_logger.name = "mock_logger"
+    mock_logger = Mock(spec=StructuredLogger)
+    mock_logger.name = name
     mock_logger.info.return_value = None
     mock_logger.error.return_value = None
     mock_logger.warning.return_value = None
@@ -370,7 +432,7 @@ def create_mock_structured_logger():
 
 def create_mock_workflow_tracker():
     """Create mock WorkflowTracker."""
-    mock_tracker = MagicMock(spec=WorkflowTracker)
+    mock_tracker = Mock(spec=WorkflowTracker)
     mock_tracker.start_workflow.return_value = None
     mock_tracker.update_workflow_step.return_value = None
     mock_tracker.complete_workflow.return_value = None
@@ -404,9 +466,9 @@ def create_mock_performance_monitor():
 # ===== TEST DATA FIXTURES =====
 
 
-def create_well_formed_ticket_data():
-    """Create test data for a well-formed GitHub issue."""
-    return {
+# Ticket data is frozen and shared; use _frozen.thaw() for a mutable deep copy
+WELL_FORMED_TICKET = freeze(
+    {
         "url": "https://github.com/test/repo/issues/1",
         "title": "Implement UUID Generator",
         "description": "Add UUID generation functionality",
@@ -423,11 +485,10 @@ def create_well_formed_ticket_data():
         "expected_code": "export class UUIDPlugin { generateUUID() { /* implementation */ } }",
         "expected_tests": "describe('UUIDPlugin', () => { it('generates UUID', () => { /* test */ }); });",
     }
+)
 
-
-def create_malformed_ticket_data():
-    """Create test data for a malformed GitHub issue."""
-    return {
+MALFORMED_TICKET = freeze(
+    {
         "url": "https://github.com/test/repo/issues/2",
         "title": "",
         "description": "",
@@ -436,11 +497,10 @@ def create_malformed_ticket_data():
         "expected_code": None,
         "expected_tests": None,
     }
+)
 
-
-def create_complex_ticket_data():
-    """Create test data for a complex multi-step GitHub issue."""
-    return {
+COMPLEX_TICKET = freeze(
+    {
         "url": "https://github.com/test/repo/issues/3",
         "title": "Implement Advanced Code Analysis",
         "description": "Complex code analysis with multiple components",
@@ -459,6 +519,22 @@ def create_complex_ticket_data():
         "expected_code": "export class CodeAnalyzer { analyze() { /* complex implementation */ } }",
         "expected_tests": "describe('CodeAnalyzer', () => { it('analyzes code', () => { /* complex tests */ }); });",
     }
+)
+
+
+def create_well_formed_ticket_data():
+    """Create test data for a well-formed GitHub issue."""
+    return WELL_FORMED_TICKET
+
+
+def create_malformed_ticket_data():
+    """Create test data for a malformed GitHub issue."""
+    return MALFORMED_TICKET
+
+
+def create_complex_ticket_data():
+    """Create test data for a complex multi-step GitHub issue."""
+    return COMPLEX_TICKET
 
 
 def create_validation_failure_scenarios():
@@ -488,6 +564,8 @@ def create_validation_failure_scenarios():
 class MockStateManager:
     """Manager for resetting global mock state between tests."""
 
+    __slots__ = ("originals", "mocks")
+
     def __init__(self):
         self.originals = {}
         self.mocks = {}
@@ -495,11 +573,16 @@ class MockStateManager:
     def register_mock(self, target: str, mock):
         """Register a mock for later restoration."""
         if target not in self.originals:
-            # Store original if not already stored
-            try:
-                self.originals[target] = __import__(target, fromlist=[""])
-            except ImportError:
-                self.originals[target] = None
+            # Store original if not already stored; most targets are
+            # already imported, so only fall back to importing them
+            original = sys.modules.get(target)
+            if original is None:
+                try:
+                    original = importlib.import_module(target)
+                except ImportError:
+                    # Attribute targets such as "pkg.module.Class"
+                    pass
+            self.originals[target] = original
 
         self.mocks[target] = mock
 
@@ -543,90 +626,91 @@ def cleanup_test_mocks():
 # ===== CONTEXT MANAGERS FOR COMPREHENSIVE MOCKING =====
 
 
-def create_comprehensive_mock_context():
-    """Create context manager that patches all major components."""
-    from contextlib import contextmanager
-
-    @contextmanager
-    def comprehensive_mock_context():
-        """Context manager providing comprehensive mocking for refactored components."""
-        mocks = {
-            "src.agent_composer.AgentComposer": patch(
-                "src.agent_composer.AgentComposer",
-                return_value=create_mock_agent_composer(),
-            ),
-            "src.composable_workflows.ComposableWorkflows": patch(
-                "src.composable_workflows.ComposableWorkflows",
-                return_value=create_mock_composable_workflows(),
-            ),
-            "src.services.ServiceManager": patch(
-                "src.services.ServiceManager",
-                return_value=create_mock_service_manager(),
-            ),
-            "src.circuit_breaker.get_circuit_breaker": patch(
-                "src.circuit_breaker.get_circuit_breaker",
-                side_effect=create_mock_circuit_breaker,
-            ),
-            "src.circuit_breaker.get_health_monitor": patch(
-                "src.circuit_breaker.get_health_monitor",
-                return_value=create_mock_health_monitor(),
-            ),
-            "src.monitoring.get_monitor": patch(
-                "src.monitoring.get_monitor",
-                return_value=create_mock_performance_monitor(),
-            ),
-            "src.monitoring.structured_log": patch(
-                "src.monitoring.structured_log",
-                side_effect=create_mock_structured_logger,
-            ),
-        }
+# Patches applied by the comprehensive mock context, as (target, patch
+# keyword, factory). Return values are built when the context is entered;
+# side-effect factories run on each call of the patched target.
+_COMPREHENSIVE_PATCHES = (
+    ("src.agent_composer.AgentComposer", "return_value", create_mock_agent_composer),
+    (
+        "src.composable_workflows.ComposableWorkflows",
+        "return_value",
+        create_mock_composable_workflows,
+    ),
+    ("src.services.ServiceManager", "return_value", create_mock_service_manager),
+    (
+        "src.circuit_breaker.get_circuit_breaker",
+        "side_effect",
+        create_mock_circuit_breaker,
+    ),
+    (
+        "src.circuit_breaker.get_health_monitor",
+        "return_value",
+        create_mock_health_monitor,
+    ),
+    ("src.monitoring.get_monitor", "return_value", create_mock_performance_monitor),
+    ("src.monitoring.structured_log", "side_effect", create_mock_structured_logger),
+)
 
-        # Start all patches
-        started_mocks = []
-        try:
-            for target, patcher in mocks.items():
-                started_mocks.append(patcher.start())
-            yield
-        finally:
-            # Stop all patches in reverse order
-            for mock in reversed(started_mocks):
-                mock.stop()
 
-    return comprehensive_mock_context()
+@contextmanager
+def _comprehensive_mock_context():
+    """Context manager providing comprehensive mocking for refactored components."""
+    with ExitStack() as stack:
+        for target, kind, factory in _COMPREHENSIVE_PATCHES:
+            value = factory if kind == "side_effect" else factory()
+            stack.enter_context(patch(target, **{kind: value}))
+        yield
+
+
+def create_comprehensive_mock_context():
+    """Create context manager that patches all major components."""
+    return _comprehensive_mock_context()
 
 
 # ===== UTILITY FUNCTIONS =====
 
 
-def create_mock_response_for_scenario(scenario: str) -> Dict[str, Any]:
-    """Create appropriate mock responses based on test scenario."""
-    scenarios = {
-        "success": {
-            "generated_code": "export class SuccessClass { success() { return true; } }",
-            "generated_tests": "describe('SuccessClass', () => { it('succeeds', () => { expect(true).toBe(true); }); });",
-            "validation_results": {"success": True, "errors": [], "warnings": []},
-        },
-        "failure": {
-            "generated_code": "export class FailureClass { fail() { throw new Error('fail'); } }",
-            "generated_tests": "describe('FailureClass', () => { it('fails', () => { expect(() => { throw new Error(); }).toThrow(); }); });",
-            "validation_results": {
-                "success": False,
-                "errors": ["Test failure"],
-                "warnings": [],
-            },
-        },
-        "partial": {
-            "generated_code": "export class PartialClass { partial() { return 'partial'; } }",
-            "generated_tests": "",  # Missing tests
-            "validation_results": {
-                "success": False,
-                "errors": ["Missing tests"],
-                "warnings": [],
-            },
-        },
+_SUCCESS_RESPONSE = MappingProxyType(
+    {
+        "generated_code": "export class SuccessClass { success() { return true; } }",
+        "generated_tests": "describe('SuccessClass', () => { it('succeeds', () => { expect(true).toBe(true); }); });",
+        "validation_results": MappingProxyType(
+            {"success": True, "errors": (), "warnings": ()}
+        ),
     }
+)
+
+_SCENARIO_RESPONSES = MappingProxyType(
+    {
+        "success": _SUCCESS_RESPONSE,
+        "failure": MappingProxyType(
+            {
+                "generated_code": "export class FailureClass { fail() { throw new Error('fail'); } }",
+                "generated_tests": "describe('FailureClass', () => { it('fails', () => { expect(() => { throw new Error(); }).toThrow(); }); });",
+                "validation_results": MappingProxyType(
+                    {"success": False, "errors": ("Test failure",), "warnings": ()}
+                ),
+            }
+        ),
+        "partial": MappingProxyType(
+            {
+                "generated_code": "export class PartialClass { partial() { return 'partial'; } }",
+                "generated_tests": "",  # Missing tests
+                "validation_results": MappingProxyType(
+                    {"success": False, "errors": ("Missing tests",), "warnings": ()}
+                ),
+            }
+        ),
+    }
+)
+
+
+def create_mock_response_for_scenario(scenario: str) -> Mapping[str, Any]:
+    """Create appropriate mock responses based on test scenario.
 
-    return scenarios.get(scenario, scenarios["success"])
+    Responses are read-only and shared; unknown scenarios get the success one.
+    """
+    return _SCENARIO_RESPONSES.get(scenario, _SUCCESS_RESPONSE)
 
 
 def assert_mock_called_with_expected(mock, expected_calls):
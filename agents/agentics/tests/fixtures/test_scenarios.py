@@ -5,21 +5,22 @@ This module provides common test scenarios that can be used across different
 test files to ensure consistent testing patterns and reduce code duplication.
 """
 
+from functools import cache
 from unittest.mock import patch, MagicMock, AsyncMock
 from typing import Dict, Any, List, Optional
 import pytest
 
-from .mock_github_responses import (
+from .mock_llm_responses import (
+    create_process_llm_mock_responses,
+    create_code_generator_mock_responses,
+)
+from .mock_refactored_components import (
     create_well_formed_ticket_data,
     create_malformed_ticket_data,
     create_complex_ticket_data,
     create_validation_failure_scenarios,
+    create_mock_service_manager,
 )
-from .mock_llm_responses import (
-    create_process_llm_mock_responses,
-    create_code_generator_mock_responses,
-)
-from .mock_refactored_components import create_mock_service_manager
 
 
 class TestScenario:
@@ -28,17 +29,29 @@ class TestScenario:
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
+        self._mocks: Optional[Dict[str, Any]] = None
 
     def setup(self):
         """Set up the test scenario."""
-        pass
+        self._mocks = self._build_mocks()
 
     def teardown(self):
         """Clean up after the test scenario."""
-        pass
+        # Drop the mocks so call history doesn't carry over to the next test
+        self._mocks = None
 
     def get_mocks(self) -> Dict[str, Any]:
-        """Get the mocks for this scenario."""
+        """Get the mocks for this scenario.
+
+        Between setup and teardown every call returns the same mocks;
+        otherwise each call builds a fresh set, since scenarios are shared.
+        """
+        if self._mocks is None:
+            return self._build_mocks()
+        return self._mocks
+
+    def _build_mocks(self) -> Dict[str, Any]:
+        """Build the mocks for this scenario."""
         return {}
 
 
@@ -52,8 +65,8 @@ class GitHubIssueProcessingScenario(TestScenario):
         )
         self.ticket_type = ticket_type
 
-    def get_mocks(self):
-        """Get mocks for GitHub issue processing."""
+    def _build_mocks(self):
+        """Build mocks for GitHub issue processing."""
         ticket_data = {
             "well_formed": create_well_formed_ticket_data(),
             "malformed": create_malformed_ticket_data(),
@@ -77,8 +90,8 @@ class CodeGenerationScenario(TestScenario):
         )
         self.complexity = complexity
 
-    def get_mocks(self):
-        """Get mocks for code generation."""
+    def _build_mocks(self):
+        """Build mocks for code generation."""
         return {
             "llm_responses": create_code_generator_mock_responses(),
             "service_manager": create_mock_service_manager(),
@@ -96,8 +109,8 @@ class ErrorHandlingScenario(TestScenario):
         )
         self.error_type = error_type
 
-    def get_mocks(self):
-        """Get mocks for error handling."""
+    def _build_mocks(self):
+        """Build mocks for error handling."""
         error_mocks = {
             "service_failure": self._create_service_failure_mocks(),
             "network_timeout": self._create_network_timeout_mocks(),
@@ -166,8 +179,8 @@ class PerformanceScenario(TestScenario):
         )
         self.load_level = load_level
 
-    def get_mocks(self):
-        """Get mocks for performance testing."""
+    def _build_mocks(self):
+        """Build mocks for performance testing."""
         from .mock_llm_responses import create_llm_batch_responses
 
         return {
@@ -186,8 +199,8 @@ class IntegrationScenario(TestScenario):
         )
         self.integration_type = integration_type
 
-    def get_mocks(self):
-        """Get mocks for integration testing."""
+    def _build_mocks(self):
+        """Build mocks for integration testing."""
         return {
             "service_manager": create_mock_service_manager(),
             "github_client": create_well_formed_ticket_data(),
@@ -195,45 +208,67 @@ class IntegrationScenario(TestScenario):
         }
 
 
-# Predefined test scenarios
-WELL_FORMED_ISSUE_SCENARIO = GitHubIssueProcessingScenario("well_formed")
-MALFORMED_ISSUE_SCENARIO = GitHubIssueProcessingScenario("malformed")
-COMPLEX_ISSUE_SCENARIO = GitHubIssueProcessingScenario("complex")
-
-SIMPLE_CODE_GENERATION = CodeGenerationScenario("simple")
-COMPLEX_CODE_GENERATION = CodeGenerationScenario("complex")
-
-SERVICE_FAILURE_ERROR = ErrorHandlingScenario("service_failure")
-NETWORK_TIMEOUT_ERROR = ErrorHandlingScenario("network_timeout")
-RATE_LIMITING_ERROR = ErrorHandlingScenario("rate_limiting")
-AUTHENTICATION_ERROR = ErrorHandlingScenario("authentication")
+# Predefined test scenarios by name, as (scenario class, argument). Each one is
+# built on first lookup and then shared.
+_SCENARIOS = {
+    "well_formed_issue": (GitHubIssueProcessingScenario, "well_formed"),
+    "malformed_issue": (GitHubIssueProcessingScenario, "malformed"),
+    "complex_issue": (GitHubIssueProcessingScenario, "complex"),
+    "simple_code_gen": (CodeGenerationScenario, "simple"),
+    "complex_code_gen": (CodeGenerationScenario, "complex"),
+    "service_failure": (ErrorHandlingScenario, "service_failure"),
+    "network_timeout": (ErrorHandlingScenario, "network_timeout"),
+    "rate_limiting": (ErrorHandlingScenario, "rate_limiting"),
+    "auth_error": (ErrorHandlingScenario, "authentication"),
+    "normal_performance": (PerformanceScenario, "normal"),
+    "high_performance": (PerformanceScenario, "high"),
+    "full_integration": (IntegrationScenario, "full_workflow"),
+    "partial_integration": (IntegrationScenario, "partial"),
+}
 
-NORMAL_LOAD_PERFORMANCE = PerformanceScenario("normal")
-HIGH_LOAD_PERFORMANCE = PerformanceScenario("high")
 
-FULL_WORKFLOW_INTEGRATION = IntegrationScenario("full_workflow")
-PARTIAL_INTEGRATION = IntegrationScenario("partial")
+@cache
+def _build_scenario(name: str) -> TestScenario:
+    scenario_class, argument = _SCENARIOS[name]
+    return scenario_class(argument)
 
 
 def get_scenario_by_name(name: str) -> Optional[TestScenario]:
     """Get a test scenario by name."""
-    scenarios = {
-        "well_formed_issue": WELL_FORMED_ISSUE_SCENARIO,
-        "malformed_issue": MALFORMED_ISSUE_SCENARIO,
-        "complex_issue": COMPLEX_ISSUE_SCENARIO,
-        "simple_code_gen": SIMPLE_CODE_GENERATION,
-        "complex_code_gen": COMPLEX_CODE_GENERATION,
-        "service_failure": SERVICE_FAILURE_ERROR,
-        "network_timeout": NETWORK_TIMEOUT_ERROR,
-        "rate_limiting": RATE_LIMITING_ERROR,
-        "auth_error": AUTHENTICATION_ERROR,
-        "normal_performance": NORMAL_LOAD_PERFORMANCE,
-        "high_performance": HIGH_LOAD_PERFORMANCE,
-        "full_integration": FULL_WORKFLOW_INTEGRATION,
-        "partial_integration": PARTIAL_INTEGRATION,
-    }
-
-    return scenarios.get(name)
+    if name not in _SCENARIOS:
+        return None
+    return _build_scenario(name)
+
+
+# Module-level names of the predefined scenarios, resolved lazily
+_SCENARIO_CONSTANTS = {
+    "WELL_FORMED_ISSUE_SCENARIO": "well_formed_issue",
+    "MALFORMED_ISSUE_SCENARIO": "malformed_issue",
+    "COMPLEX_ISSUE_SCENARIO": "complex_issue",
+    "SIMPLE_CODE_GENERATION": "simple_code_gen",
+    "COMPLEX_CODE_GENERATION": "complex_code_gen",
+    "SERVICE_FAILURE_ERROR": "service_failure",
+    "NETWORK_TIMEOUT_ERROR": "network_timeout",
+    "RATE_LIMITING_ERROR": "rate_limiting",
+    "AUTHENTICATION_ERROR": "auth_error",
+    "NORMAL_LOAD_PERFORMANCE": "normal_performance",
+    "HIGH_LOAD_PERFORMANCE": "high_performance",
+    "FULL_WORKFLOW_INTEGRATION": "full_integration",
+    "PARTIAL_INTEGRATION": "partial_integration",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Build a predefined scenario on first access (PEP 562)."""
+    try:
+        scenario_name = _SCENARIO_CONSTANTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return _build_scenario(scenario_name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SCENARIO_CONSTANTS))
 
 
 @pytest.fixture(
@@ -0,0 +1,30 @@
+
+import { AsyncProcessor } from './source';
+
+describe('AsyncProcessor', () => {
+    let processor: AsyncProcessor;
+
+    beforeEach(() => {
+        processor = new AsyncProcessor();
+    });
+
+    describe('processData', () => {
+        it('should process data asynchronously', async () => {
+            const result = await processor.processData('hello');
+            expect(result).toBe('HELLO');
+        });
+
+        it('should handle empty string', async () => {
+            const result = await processor.processData('');
+            expect(result).toBe('');
+        });
+    });
+
+    describe('processMultiple', () => {
+        it('should process multiple items in parallel', async () => {
+            const items = ['hello', 'world', 'test'];
+            const results = await processor.processMultiple(items);
+            expect(results).toEqual(['HELLO', 'WORLD', 'TEST']);
+        });
+    });
+});
@@ -0,0 +1,16 @@
+
+export class AsyncProcessor {
+    async delay(ms: number): Promise<void> {
+        return new Promise(resolve => setTimeout(resolve, ms));
+    }
+
+    async processData(data: string): Promise<string> {
+        await this.delay(100);
+        return data.toUpperCase();
+    }
+
+    async processMultiple(items: string[]): Promise<string[]> {
+        const promises = items.map(item => this.processData(item));
+        return Promise.all(promises);
+    }
+}
@@ -0,0 +1,42 @@
+
+import { Calculator } from './source';
+
+describe('Calculator', () => {
+    let calculator: Calculator;
+
+    beforeEach(() => {
+        calculator = new Calculator();
+    });
+
+    describe('add', () => {
+        it('should add two positive numbers', () => {
+            expect(calculator.add(2, 3)).toBe(5);
+        });
+
+        it('should add positive and negative numbers', () => {
+            expect(calculator.add(5, -3)).toBe(2);
+        });
+    });
+
+    describe('subtract', () => {
+        it('should subtract two numbers', () => {
+            expect(calculator.subtract(5, 3)).toBe(2);
+        });
+    });
+
+    describe('multiply', () => {
+        it('should multiply two numbers', () => {
+            expect(calculator.multiply(3, 4)).toBe(12);
+        });
+    });
+
+    describe('divide', () => {
+        it('should divide two numbers', () => {
+            expect(calculator.divide(10, 2)).toBe(5);
+        });
+
+        it('should throw error when dividing by zero', () => {
+            expect(() => calculator.divide(10, 0)).toThrow('Division by zero');
+        });
+    });
+});
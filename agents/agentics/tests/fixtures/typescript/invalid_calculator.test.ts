@@ -0,0 +1,28 @@
+
+import { Calculator } from './source';
+
+describe('Calculator', () => {
+    let calculator: Calculator;
+
+    beforeEach(() => {
+        calculator = new Calculator();
+    });
+
+    describe('add', () => {
+        it('should add two numbers', () => {
+            expect(calculator.add(2, 3)).toBe(5);  // Valid
+
+        it('should fail with invalid syntax', () => {  // Missing closing paren
+            expect(calculator.add(2, 3)).toBe(6);  // Wrong expectation
+        });
+    });
+
+    describe('divide', () => {
+        it('should throw error when dividing by zero', () => {
+            expect(() => calculator.divide(10, 0)).toThrow('Division by zero');  // Valid
+
+        it('should handle invalid test syntax', () => {  // Missing closing paren
+            expect(calculator.divide(10, 0)).toBe('error');  // Wrong type
+        });
+    });
+});
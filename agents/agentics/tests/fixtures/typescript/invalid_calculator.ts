@@ -0,0 +1,18 @@
+
+export class InvalidCalculator {
+    add(a: number, b: number): number {
+        return a + b;  // Valid
+
+    subtract(a: number, b: number): number {  // Missing closing brace
+        return a - b
+
+    multiply(a: number, b: number): number {
+        return a * b;  // Valid
+    }
+
+    divide(a: number, b: number): number {
+        if (b === 0) {
+            throw new Error('Division by zero');
+        return a / b;  // Missing closing brace
+    }
+}
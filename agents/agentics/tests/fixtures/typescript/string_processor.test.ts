@@ -0,0 +1,60 @@
+
+import { StringProcessor } from './source';
+
+describe('StringProcessor', () => {
+    let processor: StringProcessor;
+
+    beforeEach(() => {
+        processor = new StringProcessor();
+    });
+
+    describe('process', () => {
+        it('should return empty string for null input', () => {
+            expect(processor.process(null)).toBe('');
+        });
+
+        it('should return empty string for undefined input', () => {
+            expect(processor.process(undefined)).toBe('');
+        });
+
+        it('should return empty string for empty input', () => {
+            expect(processor.process('')).toBe('');
+        });
+
+        it('should trim and uppercase normal input', () => {
+            expect(processor.process('  hello world  ')).toBe('HELLO WORLD');
+        });
+    });
+
+    describe('validateEmail', () => {
+        it('should return false for null input', () => {
+            expect(processor.validateEmail(null as any)).toBe(false);
+        });
+
+        it('should return false for empty string', () => {
+            expect(processor.validateEmail('')).toBe(false);
+        });
+
+        it('should return false for invalid email', () => {
+            expect(processor.validateEmail('invalid-email')).toBe(false);
+        });
+
+        it('should return true for valid email', () => {
+            expect(processor.validateEmail('test@example.com')).toBe(true);
+        });
+    });
+
+    describe('calculateLength', () => {
+        it('should return 0 for null input', () => {
+            expect(processor.calculateLength(null as any)).toBe(0);
+        });
+
+        it('should return 0 for empty string', () => {
+            expect(processor.calculateLength('')).toBe(0);
+        });
+
+        it('should return correct length for normal string', () => {
+            expect(processor.calculateLength('hello')).toBe(5);
+        });
+    });
+});
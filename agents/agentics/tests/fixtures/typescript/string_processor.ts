@@ -0,0 +1,27 @@
+
+export class StringProcessor {
+    process(input: string | null | undefined): string {
+        if (input === null || input === undefined) {
+            return '';
+        }
+
+        if (input.length === 0) {
+            return '';
+        }
+
+        return input.trim().toUpperCase();
+    }
+
+    validateEmail(email: string): boolean {
+        if (!email || email.length === 0) {
+            return false;
+        }
+
+        const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+        return emailRegex.test(email);
+    }
+
+    calculateLength(input: string): number {
+        return input ? input.length : 0;
+    }
+}
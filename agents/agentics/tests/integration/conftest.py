@@ -138,6 +138,7 @@ These integration tests use real services and require proper environment setup:
 import pytest
 import os
 import subprocess
+from types import MappingProxyType
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -280,16 +281,23 @@ def backup_and_restore_project_files():
         shutil.rmtree(node_modules_path, ignore_errors=True)
 
 
-@pytest.fixture(scope="session")
-def integration_config():
-    """Provide integration test configuration."""
-    return {
+# Integration settings, read from the environment once at import (after the
+# .env file above is loaded) and shared read-only by every test
+_ENV_SNAPSHOT = MappingProxyType(
+    {
         "github_token": os.getenv("GITHUB_TOKEN"),
         "ollama_host": os.getenv("OLLAMA_HOST", "http://localhost:11434"),
         "test_issue_url": os.getenv("TEST_ISSUE_URL"),
         "test_repo_owner": os.getenv("TEST_REPO_OWNER", "test-owner"),
         "test_repo_name": os.getenv("TEST_REPO_NAME", "test-repo"),
     }
+)
+
+
+@pytest.fixture(scope="session")
+def integration_config():
+    """Provide integration test configuration."""
+    return _ENV_SNAPSHOT
 
 
 
@@ -350,6 +358,7 @@ from langchain_ollama import OllamaLLM
 
 import json
 import logging
+from functools import lru_cache
 from langgraph.checkpoint.memory import MemorySaver
 
 
@@ -445,6 +454,20 @@ def real_ollama_config():
     return config
 
 
+@lru_cache(maxsize=None)
+def _make_ollama_llm(model, base_url, temperature):
+    """Build one OllamaLLM client per (model, base_url, temperature)."""
+    return OllamaLLM(model=model, base_url=base_url, temperature=temperature)
+
+
+@pytest.fixture(scope="session")
+def real_ollama_llm(real_ollama_config):
+    """Real OllamaLLM client for the code model, shared across the session."""
+    return _make_ollama_llm(
+        real_ollama_config.ollama_code_model, real_ollama_config.ollama_host, 0.1
+    )
+
+
 @pytest.fixture(scope="session")
 def checkpointer():
     """MemorySaver checkpointer for langgraph workflows."""
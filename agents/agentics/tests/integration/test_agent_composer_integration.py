@@ -1,7 +1,6 @@
 import pytest
 from dataclasses import asdict
 from typing import List
-from langchain_ollama import OllamaLLM
 
 from src.agent_composer import AgentComposer, WorkflowConfig
 from src.base_agent import BaseAgent
@@ -15,7 +14,7 @@ from src.state import State
 @pytest.mark.asyncio
 @pytest.mark.parametrize("case", ["base+base", "base+tool_agent"])
 async def test_sequential_multi_agent_workflow(
-    case: str, real_ollama_config, temp_project_dir, dummy_state
+    case: str, real_ollama_llm, temp_project_dir, dummy_state
 ):
     composer = AgentComposer()
 
@@ -49,13 +48,8 @@ async def test_sequential_multi_agent_workflow(
         config = WorkflowConfig(agent_names=["agent1", "agent2"], tool_names=[])
         expected_history = ["agent1", "agent2"]
     else:
-        llm = OllamaLLM(
-            model=real_ollama_config.ollama_code_model,
-            base_url=real_ollama_config.ollama_host,
-            temperature=0.1,
-        )
         base_agent = TestBaseAgent("base")
-        tool_agent = TestToolAgent(llm, "tool_agent")
+        tool_agent = TestToolAgent(real_ollama_llm, "tool_agent")
         composer.register_agent("base", base_agent)
         composer.register_agent("tool_agent", tool_agent)
         composer.register_tool("read_file_tool", read_file_tool)
@@ -10,20 +10,14 @@ from src.tools import ToolExecutor, npm_search_tool, npm_list_tool
 class TestPhase4NpmToolsIntegration:
     def test_npm_tools_tool_executor_multiple_calls(self, npm_mock_dir, monkeypatch):
         """Test ToolExecutor processing multiple npm tool calls from AIMessage."""
-        import subprocess
-        original_run = subprocess.run
-        def mock_run(cmd, **kwargs):
+        import src.tools as tools_mod
+        original_run_streaming = tools_mod._run_streaming
+        def mock_run_streaming(cmd, **kwargs):
             # If npm list, return minimal valid output
             if isinstance(cmd, list) and 'list' in cmd:
                 return type("R", (), {"stdout": '{"dependencies": {}}', "returncode": 0, "stderr": ""})()
-            # If npm search, return minimal valid output
-            if isinstance(cmd, list) and 'search' in cmd:
-                return type("R", (), {"stdout": '[{"name": "lodash", "version": "4.17.21", "description": "Lodash modular utilities"}]', "returncode": 0, "stderr": ""})()
-            return original_run(cmd, **kwargs)
-        monkeypatch.setattr(subprocess, "run", mock_run)
-        # Also patch subprocess in the tools module's namespace
-        import src.tools as tools_mod
-        monkeypatch.setattr(tools_mod, "subprocess", subprocess)
+            return original_run_streaming(cmd, **kwargs)
+        monkeypatch.setattr(tools_mod, "_run_streaming", mock_run_streaming)
         
         tools: List[BaseTool] = [npm_search_tool, npm_list_tool]
         executor = ToolExecutor(tools)
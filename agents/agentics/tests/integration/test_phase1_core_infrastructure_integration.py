@@ -12,19 +12,13 @@ from langchain_ollama import OllamaLLM
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_composer_state_toolagent_tools_e2e(
-    temp_project_dir, dummy_state, real_ollama_config
+    temp_project_dir, dummy_state, real_ollama_llm
 ):
     composer = AgentComposer()
 
-    llm = OllamaLLM(
-        model=real_ollama_config.ollama_code_model,
-        base_url=real_ollama_config.ollama_host,
-        temperature=0.1,
-    )
-
     tools = [read_file_tool, write_file_tool, list_files_tool]
 
-    tool_agent = ToolIntegratedAgent(llm, tools, name="tool_agent")
+    tool_agent = ToolIntegratedAgent(real_ollama_llm, tools, name="tool_agent")
 
     composer.register_agent("tool_agent", tool_agent)
     composer.register_tool("read_file_tool", read_file_tool)
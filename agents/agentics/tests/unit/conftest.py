@@ -168,6 +168,22 @@ def mock_llm_batch():
     return create_llm_batch_responses()
 
 
+# Session-scoped variants of the ProcessLLM and CodeGenerator fixtures
+# above, built once per run. They are shared by every test that requests
+# them, so only use them in tests that read responses and never configure
+# or assert on the mocks.
+@pytest.fixture(scope="session")
+def shared_process_llm_responses():
+    """Provide ProcessLLM agent mock responses shared across the session."""
+    return create_process_llm_mock_responses()
+
+
+@pytest.fixture(scope="session")
+def shared_code_generator_responses():
+    """Provide CodeGenerator agent mock responses shared across the session."""
+    return create_code_generator_mock_responses()
+
+
 @pytest.fixture(scope="function")
 def mock_llm_with_memory():
     """Provide an LLM mock with conversation memory."""
@@ -138,7 +138,7 @@ class TestAgenticsApp:
 
         # Should call initialize first
         with patch.object(app, "initialize", new_callable=AsyncMock) as mock_init:
-            with patch("src.agentics.validate_github_url", return_value=True):
+            with patch("src.agentics.validate_github_urls", return_value=[True]):
                 mock_composable_workflows.process_issue.return_value = {"success": True}
 
                 asyncio.run(app.process_issue("https://github.com/test/repo/issues/1"))
@@ -169,12 +169,12 @@ class TestAgenticsApp:
         ):
             asyncio.run(app.process_issue("https://github.com/test/repo/issues/1"))
 
-    @patch("src.agentics.validate_github_url")
+    @patch("src.agentics.validate_github_urls")
     def test_process_issues_batch_validation_error(
         self, mock_validate_url, mock_config
     ):
         """Test process_issues_batch with validation error."""
-        mock_validate_url.side_effect = [True, False]  # First valid, second invalid
+        mock_validate_url.return_value = [True, False]  # First valid, second invalid
 
         app = AgenticsApp(mock_config)
         app._initialized = True
@@ -200,7 +200,7 @@ class TestAgenticsApp:
 
         # Should call initialize first
         with patch.object(app, "initialize", new_callable=AsyncMock) as mock_init:
-            with patch("src.agentics.validate_github_url", return_value=True):
+            with patch("src.agentics.validate_github_urls", return_value=[True]):
                 mock_composable_workflows.process_issue.return_value = {"success": True}
 
                 urls = ["https://github.com/test/repo/issues/1"]
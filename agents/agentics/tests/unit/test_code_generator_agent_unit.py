@@ -5,13 +5,6 @@ from langchain_ollama import OllamaLLM
 from src.code_generator_agent import CodeGeneratorAgent
 from src.config import AgenticsConfig
 from src.state import State
-from tests.fixtures.mock_llm_responses import create_code_generator_mock_responses
-
-
-@pytest.fixture
-def mock_code_generator_llm():
-    """Provide mock LLM responses for CodeGeneratorAgent tests."""
-    return create_code_generator_mock_responses()
 
 
 @patch.dict(os.environ, {"PROJECT_ROOT": "/tmp/test"})
@@ -19,9 +12,9 @@ def mock_code_generator_llm():
     "src.code_generator_agent.npm_list_tool",
     return_value='{"dependencies": {"uuid": "1.0.0"}}',
 )
-def test_code_generator_agent_process_with_requirements(mock_npm_list, mock_code_generator_llm):
+def test_code_generator_agent_process_with_requirements(mock_npm_list, shared_code_generator_responses):
     """Test CodeGeneratorAgent process with requirements using mock LLM."""
-    agent = CodeGeneratorAgent(mock_code_generator_llm["code_generation"])
+    agent = CodeGeneratorAgent(shared_code_generator_responses["code_generation"])
     state = State(
         result={
             "title": "Add UUID Generator",
@@ -73,10 +66,10 @@ def test_code_generator_agent_process_with_requirements(mock_npm_list, mock_code
 @patch.dict(os.environ, {"PROJECT_ROOT": "/tmp/test"})
 @patch("src.code_generator_agent.npm_list_tool", return_value='{"dependencies": {}}')
 def test_code_generator_agent_process_vague_ticket(
-    mock_npm_list, mock_code_generator_llm
+    mock_npm_list, shared_code_generator_responses
 ):
     """Test CodeGeneratorAgent skips generation for vague tickets using mock LLM."""
-    agent = CodeGeneratorAgent(mock_code_generator_llm["vague"])
+    agent = CodeGeneratorAgent(shared_code_generator_responses["vague"])
     state = State(
         result={
             "title": "Vague Feature",
@@ -113,10 +106,10 @@ def test_code_generator_agent_process_vague_ticket(
 @patch.dict(os.environ, {"PROJECT_ROOT": "/tmp/test"})
 @patch("src.code_generator_agent.npm_list_tool", return_value='{"dependencies": {}}')
 def test_code_generator_agent_process_empty_requirements(
-    mock_npm_list, mock_code_generator_llm
+    mock_npm_list, shared_code_generator_responses
 ):
     """Test CodeGeneratorAgent with empty requirements but non-empty acceptance criteria."""
-    agent = CodeGeneratorAgent(mock_code_generator_llm["vague"])
+    agent = CodeGeneratorAgent(shared_code_generator_responses["vague"])
     state = State(
         result={
             "title": "Feature with AC only",
@@ -147,11 +140,11 @@ def test_code_generator_agent_process_empty_requirements(
 
 
 @patch.dict(os.environ, {"PROJECT_ROOT": "/tmp/test"})
-def test_code_generator_agent_initialization(mock_code_generator_llm):
+def test_code_generator_agent_initialization(shared_code_generator_responses):
     """Test CodeGeneratorAgent initialization."""
-    agent = CodeGeneratorAgent(mock_code_generator_llm["code_generation"])
+    agent = CodeGeneratorAgent(shared_code_generator_responses["code_generation"])
     assert agent.name == "CodeGenerator"
-    assert agent.llm == mock_code_generator_llm["code_generation"]
+    assert agent.llm == shared_code_generator_responses["code_generation"]
     assert hasattr(agent, "code_generation_chain")
     assert hasattr(agent, "test_generation_chain")
     assert hasattr(agent, "code_correction_chain")
@@ -162,9 +155,9 @@ def test_code_generator_agent_initialization(mock_code_generator_llm):
     "src.code_generator_agent.npm_list_tool",
     return_value='{"dependencies": {"uuid": "1.0.0"}}',
 )
-def test_code_generator_agent_process_with_feedback(mock_npm_list, mock_code_generator_llm):
+def test_code_generator_agent_process_with_feedback(mock_npm_list, shared_code_generator_responses):
     """Test CodeGeneratorAgent process with feedback from previous iteration."""
-    agent = CodeGeneratorAgent(mock_code_generator_llm["code_generation"])
+    agent = CodeGeneratorAgent(shared_code_generator_responses["code_generation"])
     state = State(
         result={
             "title": "Add UUID Generator",
@@ -200,9 +193,9 @@ def test_code_generator_agent_process_with_feedback(mock_npm_list, mock_code_gen
     assert len(result["generated_code"]) > 0
 
 
-def test_code_generator_agent_generated_code_quality(mock_code_generator_llm):
+def test_code_generator_agent_generated_code_quality(shared_code_generator_responses):
     """Test that generated code has basic TypeScript quality using mock LLM."""
-    agent = CodeGeneratorAgent(mock_code_generator_llm["code_generation"])
+    agent = CodeGeneratorAgent(shared_code_generator_responses["code_generation"])
     state = State(
         result={
             "title": "Add Function",
@@ -253,9 +246,9 @@ def test_code_generator_agent_generated_code_quality(mock_code_generator_llm):
     ), "Code should contain TypeScript keywords"
 
 
-def test_code_generator_agent_generated_tests_quality(mock_code_generator_llm):
+def test_code_generator_agent_generated_tests_quality(shared_code_generator_responses):
     """Test that generated tests have basic Jest quality using mock LLM."""
-    agent = CodeGeneratorAgent(mock_code_generator_llm["code_generation"])
+    agent = CodeGeneratorAgent(shared_code_generator_responses["code_generation"])
     state = State(
         result={
             "title": "Add Test",
@@ -292,9 +285,9 @@ def test_code_generator_agent_generated_tests_quality(mock_code_generator_llm):
     assert "plugin" in tests
 
 
-def test_code_generator_agent_chain_error_handling(mock_code_generator_llm):
+def test_code_generator_agent_chain_error_handling(shared_code_generator_responses):
     """Test chain error handling with invalid state using mock LLM."""
-    agent = CodeGeneratorAgent(mock_code_generator_llm["code_generation"])
+    agent = CodeGeneratorAgent(shared_code_generator_responses["code_generation"])
     # Invalid state missing required keys
     state = State(
         result={
@@ -318,9 +311,9 @@ def test_code_generator_agent_chain_error_handling(mock_code_generator_llm):
         )
 
 
-def test_code_generator_agent_langchain_chain_invocation(mock_code_generator_llm):
+def test_code_generator_agent_langchain_chain_invocation(shared_code_generator_responses):
     """Test direct chain invocation for LangChain validation using mock LLM."""
-    agent = CodeGeneratorAgent(mock_code_generator_llm["code_generation"])
+    agent = CodeGeneratorAgent(shared_code_generator_responses["code_generation"])
     # Test code generation chain directly
     test_state = {
         "result": {
@@ -350,9 +343,9 @@ def test_code_generator_agent_langchain_chain_invocation(mock_code_generator_llm
     assert "public" in generated_code or "private" in generated_code
 
 
-def test_code_generator_agent_test_chain_invocation(mock_code_generator_llm):
+def test_code_generator_agent_test_chain_invocation(shared_code_generator_responses):
     """Test test generation chain directly for LangChain validation using mock LLM."""
-    agent = CodeGeneratorAgent(mock_code_generator_llm["code_generation"])
+    agent = CodeGeneratorAgent(shared_code_generator_responses["code_generation"])
     test_state = {
         "result": {
             "title": "Test Chain",
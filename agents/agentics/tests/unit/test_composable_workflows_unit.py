@@ -209,6 +209,27 @@ class TestComposableWorkflowsArchitecture:
             assert result["generated_code"] == "test code"
             assert result["generated_tests"] == "test tests"
 
+    @pytest.mark.asyncio
+    async def test_process_issue_uses_fresh_checkpoint_thread(self, workflows):
+        """Test each run gets its own checkpoint thread that is dropped afterwards."""
+        with patch.object(
+            workflows.full_workflow, "ainvoke", new_callable=AsyncMock
+        ) as mock_ainvoke, patch.object(
+            workflows.checkpointer, "delete_thread"
+        ) as mock_delete:
+            mock_ainvoke.return_value = {"generated_code": "code"}
+
+            for _ in range(2):
+                await workflows.process_issue("https://github.com/test/repo/issues/1")
+
+        thread_ids = [
+            call.args[1]["configurable"]["thread_id"]
+            for call in mock_ainvoke.call_args_list
+        ]
+        assert len(set(thread_ids)) == 2
+        assert all(tid.startswith("workflow_1:") for tid in thread_ids)
+        assert [call.args[0] for call in mock_delete.call_args_list] == thread_ids
+
     def test_checkpointing_integration(self, workflows):
         """Test that LangGraph checkpointer is properly integrated."""
         # Verify checkpointer is MemorySaver instance
@@ -0,0 +1,63 @@
+import json
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.monitoring import structured_log
+
+
+@pytest.fixture
+def root_level():
+    """Set the root logger level for one test and restore it afterwards."""
+    root = logging.getLogger()
+    original = root.level
+    yield root.setLevel
+    root.setLevel(original)
+
+
+def test_disabled_level_skips_payload_serialization(root_level):
+    """Test events below both the logger and root levels are never serialized."""
+    # Given: A structured logger and root logger that only emit warnings
+    root_level(logging.WARNING)
+    monitor = structured_log("test_disabled_level")
+    monitor.setLevel(logging.WARNING)
+    factory = MagicMock(return_value={"big": "payload"})
+
+    # When: Logging info events
+    with patch("src.monitoring.json.dumps") as dumps:
+        monitor.info("event_with_data", data={"url": "https://example.com"})
+        monitor.info("event_with_factory", data_factory=factory)
+
+    # Then: Neither the payload factory nor the JSON encoder ran
+    factory.assert_not_called()
+    dumps.assert_not_called()
+
+
+def test_data_factory_merged_into_emitted_event(caplog):
+    """Test data_factory output is merged with inline data when the event is emitted."""
+    monitor = structured_log("test_data_factory")
+
+    with caplog.at_level(logging.INFO):
+        monitor.info(
+            "factory_event",
+            data={"inline": 1},
+            data_factory=lambda: {"lazy": 2},
+        )
+
+    payloads = [json.loads(record.getMessage()) for record in caplog.records]
+    event = next(p for p in payloads if p["event"] == "factory_event")
+    assert event["inline"] == 1
+    assert event["lazy"] == 2
+
+
+def test_is_enabled_for_considers_root_logger(root_level):
+    """Test events count as enabled when only the root duplicate would emit them."""
+    monitor = structured_log("test_root_enabled")
+    monitor.setLevel(logging.ERROR)
+
+    root_level(logging.INFO)
+    assert monitor.is_enabled_for(logging.INFO)
+
+    root_level(logging.WARNING)
+    assert not monitor.is_enabled_for(logging.INFO)
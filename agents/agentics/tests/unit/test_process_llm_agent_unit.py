@@ -4,10 +4,7 @@ import os
 from unittest.mock import patch
 from src.process_llm_agent import ProcessLLMAgent
 from src.state import State
-from tests.fixtures.mock_llm_responses import (
-    create_process_llm_mock_responses,
-    create_mock_prompt_template,
-)
+from tests.fixtures.mock_llm_responses import create_mock_prompt_template
 
 # Well-structured ticket content
 WELL_STRUCTURED_TICKET = """
@@ -75,13 +72,8 @@ def expected_ticket_json():
         return json.load(f)
 
 
-# Fixtures for mock LLM responses
-@pytest.fixture
-def mock_llm_responses():
-    """Provide mock LLM responses for different test scenarios."""
-    return create_process_llm_mock_responses()
-
-
+# Mock LLM responses come from the session-scoped
+# shared_process_llm_responses fixture in conftest.py
 @pytest.fixture
 def mock_prompt_template():
     """Provide a mock prompt template."""
@@ -89,10 +81,10 @@ def mock_prompt_template():
 
 
 def test_process_llm_agent_well_structured(
-    expected_ticket_json, mock_llm_responses, mock_prompt_template
+    expected_ticket_json, shared_process_llm_responses, mock_prompt_template
 ):
     """Test processing a well-structured ticket with mock LLM."""
-    agent = ProcessLLMAgent(mock_llm_responses["well_structured"], mock_prompt_template)
+    agent = ProcessLLMAgent(shared_process_llm_responses["well_structured"], mock_prompt_template)
     state = State(ticket_content=WELL_STRUCTURED_TICKET)
 
     # When: Processing the ticket with the mock LLM
@@ -121,10 +113,10 @@ def test_process_llm_agent_well_structured(
 
 
 def test_process_llm_agent_sloppy(
-    expected_ticket_json, mock_llm_responses, mock_prompt_template
+    expected_ticket_json, shared_process_llm_responses, mock_prompt_template
 ):
     """Test processing a sloppy ticket with mock LLM."""
-    agent = ProcessLLMAgent(mock_llm_responses["sloppy"], mock_prompt_template)
+    agent = ProcessLLMAgent(shared_process_llm_responses["sloppy"], mock_prompt_template)
     state = State(ticket_content=SLOPPY_TICKET)
 
     # When: Processing the ticket with the mock LLM
@@ -152,9 +144,9 @@ def test_process_llm_agent_sloppy(
     )
 
 
-def test_process_llm_agent_long_ticket(mock_llm_responses, mock_prompt_template):
+def test_process_llm_agent_long_ticket(shared_process_llm_responses, mock_prompt_template):
     """Test processing a long ticket with mock LLM."""
-    agent = ProcessLLMAgent(mock_llm_responses["long"], mock_prompt_template)
+    agent = ProcessLLMAgent(shared_process_llm_responses["long"], mock_prompt_template)
     state = State(ticket_content=LONG_TICKET)
 
     # When: Processing the ticket with the mock LLM
@@ -184,10 +176,10 @@ def test_process_llm_agent_long_ticket(mock_llm_responses, mock_prompt_template)
 
 
 def test_process_llm_agent_invalid_json(
-    expected_ticket_json, mock_llm_responses, mock_prompt_template
+    expected_ticket_json, shared_process_llm_responses, mock_prompt_template
 ):
     """Test handling of invalid JSON response from mock LLM (assuming it could happen)."""
-    agent = ProcessLLMAgent(mock_llm_responses["well_structured"], mock_prompt_template)
+    agent = ProcessLLMAgent(shared_process_llm_responses["well_structured"], mock_prompt_template)
     state = State(ticket_content=WELL_STRUCTURED_TICKET)
 
     # When/Then: Process normally, assuming retries handle invalid JSON
@@ -201,10 +193,10 @@ def test_process_llm_agent_invalid_json(
 
 
 def test_process_llm_agent_invalid_structure(
-    expected_ticket_json, mock_llm_responses, mock_prompt_template
+    expected_ticket_json, shared_process_llm_responses, mock_prompt_template
 ):
     """Test handling of invalid structure from mock LLM."""
-    agent = ProcessLLMAgent(mock_llm_responses["well_structured"], mock_prompt_template)
+    agent = ProcessLLMAgent(shared_process_llm_responses["well_structured"], mock_prompt_template)
     state = State(ticket_content=WELL_STRUCTURED_TICKET)
 
     # When/Then: Process normally, assuming retries handle invalid structure
@@ -218,10 +210,10 @@ def test_process_llm_agent_invalid_structure(
 
 
 def test_process_llm_agent_invalid_types(
-    expected_ticket_json, mock_llm_responses, mock_prompt_template
+    expected_ticket_json, shared_process_llm_responses, mock_prompt_template
 ):
     """Test handling of invalid types from mock LLM."""
-    agent = ProcessLLMAgent(mock_llm_responses["well_structured"], mock_prompt_template)
+    agent = ProcessLLMAgent(shared_process_llm_responses["well_structured"], mock_prompt_template)
     state = State(ticket_content=WELL_STRUCTURED_TICKET)
 
     # When/Then: Process normally, assuming retries handle invalid types
@@ -241,10 +233,10 @@ def test_process_llm_agent_invalid_types(
 
 
 def test_process_llm_agent_retry_success(
-    expected_ticket_json, mock_llm_responses, mock_prompt_template
+    expected_ticket_json, shared_process_llm_responses, mock_prompt_template
 ):
     """Test that the agent succeeds after potential retries with mock LLM."""
-    agent = ProcessLLMAgent(mock_llm_responses["well_structured"], mock_prompt_template)
+    agent = ProcessLLMAgent(shared_process_llm_responses["well_structured"], mock_prompt_template)
     state = State(ticket_content=WELL_STRUCTURED_TICKET)
 
     # When: Processing the ticket with the mock LLM
@@ -272,9 +264,9 @@ def test_process_llm_agent_retry_success(
     )
 
 
-def test_process_llm_agent_dict_input(mock_llm_responses, mock_prompt_template):
+def test_process_llm_agent_dict_input(shared_process_llm_responses, mock_prompt_template):
     # Given: A state with refined_ticket as a dict
-    agent = ProcessLLMAgent(mock_llm_responses["dict"], mock_prompt_template)
+    agent = ProcessLLMAgent(shared_process_llm_responses["dict"], mock_prompt_template)
     state = State(
         refined_ticket={
             "title": "Test Ticket",
@@ -298,8 +290,8 @@ def test_process_llm_agent_dict_input(mock_llm_responses, mock_prompt_template):
 
 
 # New test: Empty ticket content
-def test_process_llm_agent_empty_ticket(mock_llm_responses, mock_prompt_template):
-    agent = ProcessLLMAgent(mock_llm_responses["empty"], mock_prompt_template)
+def test_process_llm_agent_empty_ticket(shared_process_llm_responses, mock_prompt_template):
+    agent = ProcessLLMAgent(shared_process_llm_responses["empty"], mock_prompt_template)
     state = State(ticket_content="")
 
     # When: Processing the ticket with mock LLM
@@ -322,8 +314,8 @@ def test_process_llm_agent_empty_ticket(mock_llm_responses, mock_prompt_template
 
 
 # New test: Malformed ticket causing potential invalid JSON
-def test_process_llm_agent_malformed_ticket(mock_llm_responses, mock_prompt_template):
-    agent = ProcessLLMAgent(mock_llm_responses["malformed"], mock_prompt_template)
+def test_process_llm_agent_malformed_ticket(shared_process_llm_responses, mock_prompt_template):
+    agent = ProcessLLMAgent(shared_process_llm_responses["malformed"], mock_prompt_template)
     state = State(ticket_content="# Title\n{unclosed bracket\n- Req1")
 
     # When: Processing the ticket with mock LLM
@@ -0,0 +1,479 @@
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import src.tools as tools_mod
+from src.tools import (
+    ToolExecutor,
+    check_file_exists_tool,
+    npm_install_tool,
+    npm_list_tool,
+    npm_run_tool,
+    npm_search_batch_tool,
+    npm_search_tool,
+    read_file_tool,
+    write_file_tool,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_npm_caches():
+    """Keep npm results memoized in one test from leaking into the next."""
+    tools_mod._npm_search_cached.cache_clear()
+    tools_mod._NPM_LIST_CACHE.clear()
+    yield
+    tools_mod._npm_search_cached.cache_clear()
+    tools_mod._NPM_LIST_CACHE.clear()
+
+
+def _registry_response(version):
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {"objects": [{"package": {"version": version}}]}
+    return response
+
+
+def test_npm_search_batch_tool_preserves_order_and_dedupes():
+    """Test batch search returns one entry per unique name in caller order."""
+    # Given: A registry where later names respond first
+    versions = {"react": "18.2.0", "jest": "29.7.0", "lodash": "4.17.21"}
+    delays = {"react": 0.05, "jest": 0.0, "lodash": 0.02}
+
+    def fake_get(url, timeout):
+        name = url.split("text=")[1].split("&")[0]
+        time.sleep(delays[name])
+        return _registry_response(versions[name])
+
+    # When: Searching a batch that contains a duplicate
+    with patch.object(tools_mod._NPM_SESSION, "get", side_effect=fake_get) as get:
+        result = npm_search_batch_tool.invoke(
+            {"package_names": ["react", "jest", "react", "lodash"]}
+        )
+
+    # Then: Results follow input order and each name hits the registry once
+    assert json.loads(result) == [
+        {"name": "react", "version": "18.2.0"},
+        {"name": "jest", "version": "29.7.0"},
+        {"name": "lodash", "version": "4.17.21"},
+    ]
+    assert get.call_count == 3
+
+
+def test_npm_search_batch_tool_runs_requests_concurrently():
+    """Test batch search overlaps registry requests instead of serializing them."""
+    # Given: A registry call that blocks until every request is in flight
+    names = ["a", "b", "c", "d"]
+    barrier = threading.Barrier(len(names), timeout=5)
+
+    def fake_get(url, timeout):
+        barrier.wait()
+        return _registry_response("1.0.0")
+
+    # When: Searching the batch
+    with patch.object(tools_mod._NPM_SESSION, "get", side_effect=fake_get):
+        result = npm_search_batch_tool.invoke({"package_names": names})
+
+    # Then: All lookups completed, which requires them to run in parallel
+    assert [entry["name"] for entry in json.loads(result)] == names
+
+
+def test_npm_search_batch_tool_skips_failed_lookups():
+    """Test a failing registry lookup does not drop the rest of the batch."""
+    # Given: One package that errors and one that resolves
+    def fake_get(url, timeout):
+        if "missing" in url:
+            raise ConnectionError("registry unreachable")
+        return _registry_response("2.0.0")
+
+    # When: Searching both
+    with patch.object(tools_mod._NPM_SESSION, "get", side_effect=fake_get):
+        result = npm_search_batch_tool.invoke({"package_names": ["missing", "ok"]})
+
+    # Then: Only the resolved package is reported
+    assert json.loads(result) == [{"name": "ok", "version": "2.0.0"}]
+
+
+def test_npm_search_batch_tool_empty_input():
+    """Test an empty batch returns an empty JSON array without network access."""
+    with patch.object(tools_mod._NPM_SESSION, "get") as get:
+        result = npm_search_batch_tool.invoke({"package_names": []})
+
+    assert json.loads(result) == []
+    get.assert_not_called()
+
+
+def test_check_file_exists_tool_reuses_recent_stat(tmp_path, monkeypatch):
+    """Test repeated existence checks within the TTL stat the file once."""
+    # Given: A file under the project root and a clean stat cache
+    monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+    monkeypatch.setattr(tools_mod, "_STAT_CACHE", tools_mod.OrderedDict())
+    (tmp_path / "main.ts").write_text("export {};")
+
+    # When: Checking existence twice in quick succession
+    with patch.object(tools_mod.os, "stat", wraps=tools_mod.os.stat) as stat_spy:
+        first = check_file_exists_tool.invoke({"file_path": "main.ts"})
+        second = check_file_exists_tool.invoke({"file_path": "main.ts"})
+
+    # Then: Both report the file and only one stat syscall was made
+    assert first is True and second is True
+    assert stat_spy.call_count == 1
+
+
+def test_check_file_exists_tool_rejects_directories_and_missing(tmp_path, monkeypatch):
+    """Test directories and missing paths are not reported as files."""
+    monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+    monkeypatch.setattr(tools_mod, "_STAT_CACHE", tools_mod.OrderedDict())
+    (tmp_path / "src").mkdir()
+
+    assert check_file_exists_tool.invoke({"file_path": "src"}) is False
+    assert check_file_exists_tool.invoke({"file_path": "missing.ts"}) is False
+
+
+def test_write_file_tool_invalidates_cached_missing_stat(tmp_path, monkeypatch):
+    """Test writing a file is visible to an existence check made right after."""
+    # Given: A cached "missing" result for a path
+    monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+    monkeypatch.setattr(tools_mod, "_STAT_CACHE", tools_mod.OrderedDict())
+    assert check_file_exists_tool.invoke({"file_path": "new.ts"}) is False
+
+    # When: Writing the file
+    write_file_tool.invoke({"file_path": "new.ts", "content": "export {};"})
+
+    # Then: The existence check sees the new file
+    assert check_file_exists_tool.invoke({"file_path": "new.ts"}) is True
+
+
+def test_read_file_tool_populates_stat_cache(tmp_path, monkeypatch):
+    """Test a successful read seeds the stat cache for later existence checks."""
+    monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+    monkeypatch.setattr(tools_mod, "_STAT_CACHE", tools_mod.OrderedDict())
+    (tmp_path / "a.ts").write_text("const a = 1;")
+
+    assert read_file_tool.invoke({"file_path": "a.ts"}) == "const a = 1;"
+    with patch.object(tools_mod.os, "stat") as stat_mock:
+        assert check_file_exists_tool.invoke({"file_path": "a.ts"}) is True
+    stat_mock.assert_not_called()
+
+
+def test_tool_executor_skips_input_formatting_when_info_disabled(tmp_path, monkeypatch):
+    """Test tool inputs are not formatted when INFO logging is filtered out."""
+    # Given: An executor whose monitor and the root logger only emit warnings
+    monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+    root = logging.getLogger()
+    original_root_level = root.level
+    executor = ToolExecutor([write_file_tool])
+    original_monitor_level = executor.monitor.level
+    root.setLevel(logging.WARNING)
+    executor.monitor.setLevel(logging.WARNING)
+
+    # When: Executing a tool with a large payload
+    try:
+        with patch.object(
+            tools_mod._TOOL_INPUT_REPR, "repr"
+        ) as repr_spy, patch.object(executor.monitor, "info") as info_spy:
+            executor.execute_tool(
+                "write_file_tool", {"file_path": "big.ts", "content": "x" * 100_000}
+            )
+    finally:
+        root.setLevel(original_root_level)
+        executor.monitor.setLevel(original_monitor_level)
+
+    # Then: Neither the repr nor the info log was produced
+    repr_spy.assert_not_called()
+    info_spy.assert_not_called()
+
+
+def test_tool_executor_truncates_logged_input(tmp_path, monkeypatch):
+    """Test the logged tool input is bounded regardless of payload size."""
+    monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+    executor = ToolExecutor([write_file_tool])
+    executor.monitor.setLevel(logging.INFO)
+
+    with patch.object(executor.monitor, "info") as info_spy:
+        executor.execute_tool(
+            "write_file_tool", {"file_path": "big.ts", "content": "x" * 100_000}
+        )
+
+    logged = info_spy.call_args_list[0].args[0]
+    assert logged.startswith("Executing tool: write_file_tool with input:")
+    assert len(logged) < 1_000
+
+
+def test_tool_executor_reuses_monitor_across_instances():
+    """Test executors built per request share one structured logger."""
+    first = ToolExecutor([read_file_tool])
+    second = ToolExecutor([write_file_tool])
+
+    assert first.monitor is second.monitor
+
+
+def test_tool_executor_unknown_tool_raises():
+    """Test executing an unregistered tool raises ValueError."""
+    executor = ToolExecutor([read_file_tool])
+
+    with pytest.raises(ValueError, match="Tool 'missing_tool' not found"):
+        executor.execute_tool("missing_tool", {})
+
+
+def test_tool_executor_level_change_takes_effect_on_shared_monitor():
+    """Test re-levelling the shared monitor is not masked by isEnabledFor caching."""
+    executor = ToolExecutor([read_file_tool])
+    executor.monitor.setLevel(logging.WARNING)
+    assert not executor.monitor.isEnabledFor(logging.INFO)
+
+    ToolExecutor([read_file_tool])
+
+    assert executor.monitor.isEnabledFor(logging.INFO)
+
+
+def test_npm_search_tool_memoizes_across_calls():
+    """Test repeated searches for a package are served from the module cache."""
+    # Given: A registry that resolves lodash
+    with patch.object(
+        tools_mod._NPM_SESSION, "get", return_value=_registry_response("4.17.21")
+    ) as get:
+        # When: Searching the same package twice
+        first = npm_search_tool.invoke({"package_name": "lodash"})
+        second = npm_search_tool.invoke({"package_name": "lodash"})
+
+    # Then: Only the first call reached the registry
+    assert first == second
+    assert json.loads(first) == [{"name": "lodash", "version": "4.17.21"}]
+    assert get.call_count == 1
+
+
+def test_npm_search_tool_does_not_cache_network_failures():
+    """Test a transient registry failure is retried on the next call."""
+    # Given: A registry that fails once and then recovers
+    with patch.object(
+        tools_mod._NPM_SESSION,
+        "get",
+        side_effect=[ConnectionError("reset"), _registry_response("1.2.3")],
+    ):
+        # When: Searching twice
+        failed = npm_search_tool.invoke({"package_name": "left-pad"})
+        recovered = npm_search_tool.invoke({"package_name": "left-pad"})
+
+    # Then: The failure yields no results and the retry resolves the package
+    assert json.loads(failed) == []
+    assert json.loads(recovered) == [{"name": "left-pad", "version": "1.2.3"}]
+
+
+def test_write_file_tool_creates_directories_once(tmp_path, monkeypatch):
+    """Test repeated writes into one directory only ensure it the first time."""
+    # Given: A fresh project root
+    monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+    monkeypatch.setattr(tools_mod, "_ENSURED_DIRS", set())
+
+    # When: Writing two files into the same new directory
+    with patch.object(tools_mod.os, "makedirs", wraps=tools_mod.os.makedirs) as spy:
+        write_file_tool.invoke({"file_path": "src/a.ts", "content": "const a = 1;"})
+        write_file_tool.invoke({"file_path": "src/b.ts", "content": "const b = 'é';"})
+
+    # Then: The directory was created once and both files round-trip as UTF-8
+    assert spy.call_count == 1
+    assert (tmp_path / "src" / "a.ts").read_text(encoding="utf-8") == "const a = 1;"
+    assert (tmp_path / "src" / "b.ts").read_text(encoding="utf-8") == "const b = 'é';"
+
+
+def test_write_file_tool_truncates_existing_content(tmp_path, monkeypatch):
+    """Test overwriting a longer file leaves no trailing bytes behind."""
+    monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+    (tmp_path / "a.ts").write_text("a much longer original body")
+
+    write_file_tool.invoke({"file_path": "a.ts", "content": "short"})
+
+    assert (tmp_path / "a.ts").read_text() == "short"
+
+
+def test_write_file_tool_recreates_removed_directory(tmp_path, monkeypatch):
+    """Test a directory deleted after being ensured is created again."""
+    # Given: A directory the tool has already ensured, then removed externally
+    monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+    monkeypatch.setattr(tools_mod, "_ENSURED_DIRS", set())
+    write_file_tool.invoke({"file_path": "gen/a.ts", "content": "1"})
+    (tmp_path / "gen" / "a.ts").unlink()
+    (tmp_path / "gen").rmdir()
+
+    # When: Writing into it again
+    result = write_file_tool.invoke({"file_path": "gen/b.ts", "content": "2"})
+
+    # Then: The write succeeds
+    assert result == "Successfully wrote to gen/b.ts"
+    assert (tmp_path / "gen" / "b.ts").read_text() == "2"
+
+
+def test_npm_list_tool_returns_compact_json(monkeypatch):
+    """Test npm_list_tool re-emits npm's JSON without pretty-print whitespace."""
+    # Given: npm list printing an indented dependency tree
+    tree = {"name": "plugin", "dependencies": {"obsidian": {"version": "1.4.0"}}}
+    completed = tools_mod.subprocess.CompletedProcess(
+        ["npm", "list", "--json"], 0, json.dumps(tree, indent=2), ""
+    )
+    monkeypatch.setattr(tools_mod, "_run_streaming", MagicMock(return_value=completed))
+
+    # When: Listing packages
+    result = npm_list_tool.invoke({"depth": 0, "cwd": "/tmp"})
+
+    # Then: The tree is preserved in compact form
+    assert json.loads(result) == tree
+    assert result == '{"name":"plugin","dependencies":{"obsidian":{"version":"1.4.0"}}}'
+
+
+def test_run_streaming_keeps_only_output_tail():
+    """Test large stdout is bounded to the most recent max_bytes."""
+    # Given: A child that prints far more than the buffer limit
+    script = "import sys; sys.stdout.write('a' * 300000 + 'END')"
+
+    # When: Running it with a small tail buffer
+    result = tools_mod._run_streaming(
+        [sys.executable, "-c", script], cwd=".", timeout=30, max_bytes=1024
+    )
+
+    # Then: Only the last 1 KiB is retained
+    assert result.returncode == 0
+    assert len(result.stdout) == 1024
+    assert result.stdout.endswith("aEND")
+
+
+def test_run_streaming_captures_stderr_and_exit_code():
+    """Test stderr and a non-zero exit status are reported."""
+    script = "import sys; sys.stderr.write('boom'); sys.exit(3)"
+
+    result = tools_mod._run_streaming([sys.executable, "-c", script], cwd=".", timeout=30)
+
+    assert result.returncode == 3
+    assert result.stderr == "boom"
+    assert result.stdout == ""
+
+
+def test_run_streaming_kills_process_group_on_timeout():
+    """Test a hung child is killed and TimeoutExpired is raised."""
+    script = "import time; time.sleep(30)"
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        tools_mod._run_streaming([sys.executable, "-c", script], cwd=".", timeout=0.5)
+
+
+def test_run_streaming_does_not_wait_for_detached_grandchild(monkeypatch):
+    """Test a grandchild holding the pipes open does not hang the call."""
+    # Given: A child that exits at once, leaving a detached grandchild that
+    # inherited its stdout and stderr
+    monkeypatch.setattr(tools_mod, "_READER_JOIN_TIMEOUT", 0.5)
+    script = (
+        "import subprocess, sys; "
+        "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(5)'], "
+        "start_new_session=True); "
+        "print('done', flush=True)"
+    )
+
+    # When: Running it
+    started = time.monotonic()
+    result = tools_mod._run_streaming([sys.executable, "-c", script], cwd=".", timeout=30)
+
+    # Then: The call returns after the join timeout with the output so far
+    assert time.monotonic() - started < 4
+    assert result.returncode == 0
+    assert result.stdout == "done\n"
+
+
+def test_npm_list_tool_reads_json_uncapped(monkeypatch):
+    """Test npm list output is not tail-truncated, which would break its JSON."""
+    run = MagicMock(return_value=_npm_list_result({}))
+    monkeypatch.setattr(tools_mod, "_run_streaming", run)
+
+    npm_list_tool.invoke({"cwd": "/tmp/uncapped"})
+
+    assert run.call_args.kwargs["max_bytes"] is None
+
+
+def test_npm_run_tool_reports_timeout(monkeypatch):
+    """Test npm_run_tool turns a timeout into a readable message."""
+    monkeypatch.setattr(
+        tools_mod,
+        "_run_streaming",
+        MagicMock(side_effect=subprocess.TimeoutExpired(["npm", "run", "test"], 30)),
+    )
+
+    result = npm_run_tool.invoke({"script": "test", "cwd": "/tmp"})
+
+    assert result == "npm run test timed out after 30s"
+
+
+def _npm_list_result(tree):
+    return subprocess.CompletedProcess(["npm", "list", "--json"], 0, json.dumps(tree), "")
+
+
+def test_npm_list_tool_caches_until_package_json_changes(tmp_path, monkeypatch):
+    """Test npm list is re-run only when package.json changes."""
+    # Given: A project whose npm list output changes between runs
+    package_json = tmp_path / "package.json"
+    package_json.write_text('{"name": "plugin"}')
+    run = MagicMock(
+        side_effect=[
+            _npm_list_result({"dependencies": {}}),
+            _npm_list_result({"dependencies": {"moment": {}}}),
+        ]
+    )
+    monkeypatch.setattr(tools_mod, "_run_streaming", run)
+
+    # When: Listing twice, then again after package.json is modified
+    first = npm_list_tool.invoke({"cwd": str(tmp_path)})
+    second = npm_list_tool.invoke({"cwd": str(tmp_path)})
+    stat = package_json.stat()
+    os.utime(package_json, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    third = npm_list_tool.invoke({"cwd": str(tmp_path)})
+
+    # Then: The second call is served from cache and the third re-runs npm
+    assert first == second == '{"dependencies":{}}'
+    assert third == '{"dependencies":{"moment":{}}}'
+    assert run.call_count == 2
+
+
+def test_npm_list_tool_cache_is_keyed_on_depth(tmp_path, monkeypatch):
+    """Test different depths are cached independently."""
+    (tmp_path / "package.json").write_text("{}")
+    run = MagicMock(return_value=_npm_list_result({"dependencies": {}}))
+    monkeypatch.setattr(tools_mod, "_run_streaming", run)
+
+    npm_list_tool.invoke({"depth": 0, "cwd": str(tmp_path)})
+    npm_list_tool.invoke({"depth": 2, "cwd": str(tmp_path)})
+
+    assert run.call_count == 2
+
+
+def test_npm_list_tool_does_not_cache_failures(tmp_path, monkeypatch):
+    """Test a failed npm list is retried rather than cached."""
+    (tmp_path / "package.json").write_text("{}")
+    failed = subprocess.CompletedProcess(["npm"], 1, "", "ELSPROBLEMS")
+    run = MagicMock(side_effect=[failed, _npm_list_result({"dependencies": {}})])
+    monkeypatch.setattr(tools_mod, "_run_streaming", run)
+
+    assert npm_list_tool.invoke({"cwd": str(tmp_path)}).startswith("Failed")
+    assert npm_list_tool.invoke({"cwd": str(tmp_path)}) == '{"dependencies":{}}'
+
+
+def test_npm_install_tool_invalidates_npm_list_cache(tmp_path, monkeypatch):
+    """Test installing packages drops cached npm list output."""
+    (tmp_path / "package.json").write_text("{}")
+    monkeypatch.setattr(
+        tools_mod, "_run_streaming", MagicMock(return_value=_npm_list_result({}))
+    )
+    monkeypatch.setattr(
+        tools_mod.subprocess,
+        "run",
+        MagicMock(return_value=subprocess.CompletedProcess(["npm"], 0, "", "")),
+    )
+    npm_list_tool.invoke({"cwd": str(tmp_path)})
+    assert tools_mod._NPM_LIST_CACHE
+
+    npm_install_tool.invoke({"cwd": str(tmp_path)})
+
+    assert not tools_mod._NPM_LIST_CACHE
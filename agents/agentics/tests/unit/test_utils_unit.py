@@ -1,6 +1,9 @@
 import pytest
 import json
+import logging
 import re
+from unittest.mock import MagicMock, patch
+import src.utils as utils_mod
 from src.utils import validate_github_url, remove_thinking_tags, parse_json_response
 
 
@@ -43,6 +46,24 @@ def test_remove_thinking_tags():
     assert result == "Some contentcode"
 
 
+def test_remove_thinking_tags_clean_text_skips_regex():
+    """Test text without think tags or code fences never reaches the regex engine."""
+    # Given: A plain LLM response that is not already memoized
+    utils_mod._strip_thinking_tags_cached.cache_clear()
+    text = '  {"title": "Add timestamp"}  '
+
+    # When: Cleaning it with the substitution patterns stubbed out
+    with patch.object(utils_mod, "_THINK_RE") as think_re, patch.object(
+        utils_mod, "_CODEBLOCK_RE"
+    ) as codeblock_re:
+        result = remove_thinking_tags(text)
+
+    # Then: Only stripping happened
+    assert result == '{"title": "Add timestamp"}'
+    think_re.sub.assert_not_called()
+    codeblock_re.sub.assert_not_called()
+
+
 def test_parse_json_response_valid():
     """Test parsing a valid JSON string."""
     # Given a valid JSON string
@@ -121,3 +142,456 @@ def test_parse_json_response_complex():
     result = parse_json_response(response)
     # Then it should extract the valid JSON object
     assert result == {"is_clear": False, "suggestions": ["test"]}
+
+
+def test_parse_json_response_fence_variants():
+    """Test fenced JSON parses without a dedicated markdown extraction pass."""
+    responses = [
+        '```json\n{"key": "value"}\n```',
+        '```JSON\n{"key": "value"}\n```',
+        '```json \n{"key": "value"}\n```',
+        'Here you go: ```json \n{"key": "value"}\n```',
+    ]
+
+    results = [parse_json_response(response) for response in responses]
+
+    assert all(result == {"key": "value"} for result in results)
+
+
+def test_safe_json_dumps_matches_stdlib_indent():
+    """Test safe_json_dumps output is identical across JSON backends."""
+    # Given a nested payload with a dataclass, a set and a datetime
+    from dataclasses import dataclass
+    from datetime import datetime
+
+    @dataclass
+    class Item:
+        name: str
+        tags: set
+
+    payload = {"item": Item("a", {"x"}), "at": datetime(2024, 1, 2, 3, 4, 5)}
+
+    # When serializing with and without orjson
+    fast = utils_mod.safe_json_dumps(payload, indent=2)
+    with patch.object(utils_mod, "ORJSON_AVAILABLE", False):
+        slow = utils_mod.safe_json_dumps(payload, indent=2)
+
+    # Then both backends produce the same text
+    assert fast == slow
+    assert json.loads(fast) == {
+        "item": {"name": "a", "tags": ["x"]},
+        "at": "2024-01-02T03:04:05",
+    }
+
+
+def test_safe_json_dumps_keeps_stdlib_escaping_and_types():
+    """Test non-ASCII text, dates and dataclasses serialize as with the stdlib."""
+    # Given a payload with non-ASCII text, a date and a nested dataclass
+    from dataclasses import dataclass
+    from datetime import date, datetime, timezone
+
+    @dataclass
+    class Stamp:
+        at: datetime
+
+    payload = {
+        "title": "Zeitstempel für Notizen ✓",
+        "day": date(2024, 1, 2),
+        "stamp": Stamp(datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc)),
+    }
+
+    # When serializing with and without orjson
+    fast = utils_mod.safe_json_dumps(payload, indent=2)
+    with patch.object(utils_mod, "ORJSON_AVAILABLE", False):
+        slow = utils_mod.safe_json_dumps(payload, indent=2)
+
+    # Then both backends produce the same escaped text
+    assert fast == slow
+    assert fast.isascii()
+
+
+def test_safe_json_dumps_orjson_format_differences():
+    """Test the documented orjson differences: non-finite floats and exponents."""
+    # Given floats the two backends write differently
+    payload = {"nan": float("nan"), "inf": float("inf"), "small": 1e-05}
+
+    # When serializing with and without orjson
+    fast = utils_mod.safe_json_dumps(payload, indent=2)
+    with patch.object(utils_mod, "ORJSON_AVAILABLE", False):
+        slow = utils_mod.safe_json_dumps(payload, indent=2)
+
+    # Then orjson writes standard JSON and the stdlib keeps its own tokens
+    if utils_mod.ORJSON_AVAILABLE:
+        assert json.loads(fast) == {"nan": None, "inf": None, "small": 1e-05}
+        assert '"small": 0.00001' in fast
+    assert '"nan": NaN' in slow and '"inf": Infinity' in slow
+    assert '"small": 1e-05' in slow
+
+
+def test_extract_json_by_braces_skips_surrounding_text():
+    """Test brace extraction returns the first balanced object."""
+    # Given a nested object wrapped in prose with a second object after it
+    text = 'prefix {"a": {"b": [1, {"c": 2}]}} middle {"d": 3} suffix'
+
+    # When extracting by braces
+    result = utils_mod._extract_json_by_braces(text)
+
+    # Then only the first balanced object is parsed
+    assert result == {"a": {"b": [1, {"c": 2}]}}
+    with pytest.raises(ValueError, match="Unbalanced braces"):
+        utils_mod._extract_json_by_braces('{"a": {"b": 1}')
+
+
+def test_clean_llm_json_string():
+    """Test the shared cleanup strips tags, unterminated fences and trailing prose."""
+    # Given responses with thinking tags, an unterminated fence and trailing text
+    cases = {
+        '<think>plan</think>```json\n{"a": {"b": 1}}': '{"a": {"b": 1}}',
+        '{"a": {"b": 1}}\n```': '{"a": {"b": 1}}',
+        '{"a": {"b": 1}} hope this helps': '{"a": {"b": 1}}',
+        "no braces here": "no braces here",
+    }
+
+    # When cleaning each response
+    results = {raw: utils_mod._clean_llm_json_string(raw) for raw in cases}
+
+    # Then each result matches the expected cleaned text
+    assert results == cases
+
+
+def test_remove_thinking_tags_caches_repeated_text():
+    """Test repeated cleanup of the same reply reuses the memoized result."""
+    # Given: An empty cache and a reply with a thinking block
+    utils_mod._strip_thinking_tags_cached.cache_clear()
+    text = "<think>draft</think>final answer"
+
+    # When: Cleaning the same reply twice
+    first = remove_thinking_tags(text)
+    second = remove_thinking_tags(text)
+
+    # Then: The second call is a cache hit with the same output
+    assert first == second == "final answer"
+    assert utils_mod._strip_thinking_tags_cached.cache_info().hits == 1
+
+
+def test_remove_thinking_tags_large_text_bypasses_cache():
+    """Test replies above the size cap are cleaned without being memoized."""
+    # Given: An empty cache and a reply larger than the cache limit
+    utils_mod._strip_thinking_tags_cached.cache_clear()
+    text = "<think>x</think>" + "a" * (utils_mod._STRIP_CACHE_MAX_LEN + 1)
+
+    # When: Cleaning it
+    result = remove_thinking_tags(text)
+
+    # Then: It is cleaned but not stored
+    assert result == "a" * (utils_mod._STRIP_CACHE_MAX_LEN + 1)
+    assert utils_mod._strip_thinking_tags_cached.cache_info().currsize == 0
+
+
+def test_parse_json_response_skips_disabled_attempt_logs():
+    """Test per-attempt log events are not emitted when their level is disabled."""
+    # Given: A monitor with every level disabled
+    with patch.object(utils_mod, "monitor") as monitor:
+        monitor.is_enabled_for.return_value = False
+
+        # When: Parsing a valid response with required keys
+        result = parse_json_response('{"key": "value"}', required_keys={"key"})
+
+    # Then: No per-attempt events were logged
+    assert result == {"key": "value"}
+    calls = monitor.debug.call_args_list + monitor.info.call_args_list
+    logged = [c.args[0] for c in calls]
+    assert "json_parsing_attempt" not in logged
+    assert "json_parsing_success" not in logged
+    assert "json_validation_passed" not in logged
+
+
+def test_parse_json_response_retry_parses_new_response():
+    """Test the retry loop parses the LLM's new reply, not the original one."""
+    # Given: An unparseable first reply and a client that returns valid JSON
+    llm_client = MagicMock()
+    llm_client.invoke.return_value = '```json\n{"title": "Fixed"}\n```'
+
+    # When: Parsing with retries enabled
+    result = parse_json_response(
+        "not json at all",
+        llm_client=llm_client,
+        original_prompt="Return a title",
+    )
+
+    # Then: The retried reply is parsed after a single LLM call
+    assert result == {"title": "Fixed"}
+    llm_client.invoke.assert_called_once()
+
+
+def test_parse_json_response_retry_skips_unchanged_reply():
+    """Test retry replies that clean to an already failed text are not reparsed."""
+    # Given: A client that repeats the original unparseable reply
+    llm_client = MagicMock()
+    llm_client.invoke.return_value = "<think>hmm</think>{broken"
+
+    # When: Parsing with retries enabled while counting parse passes
+    with patch.object(
+        utils_mod, "_attempts_for", wraps=utils_mod._attempts_for
+    ) as attempts_for:
+        with pytest.raises(ValueError):
+            parse_json_response(
+                "{broken", llm_client=llm_client, original_prompt="Return JSON"
+            )
+
+    # Then: Every retry asked the LLM, but only the first reply was parsed
+    assert llm_client.invoke.call_count == 3
+    attempts_for.assert_called_once_with("{broken")
+
+
+def test_parse_json_response_prose_skips_object_extractors():
+    """Test replies without an opening brace skip the object extraction attempts."""
+    # Given: A prose reply with no JSON object
+    response = "I could not produce the requested output."
+
+    # When: Parsing it with the object span scanner stubbed out
+    with patch.object(utils_mod, "_find_json_span") as find_span:
+        with pytest.raises(ValueError):
+            parse_json_response(response)
+
+    # Then: The object extractor never scanned the reply
+    find_span.assert_not_called()
+    assert parse_json_response("[1, 2]") == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_parse_json_response_async_offloads_large_replies():
+    """Test large replies are parsed in a worker thread and small ones inline."""
+    # Given: A small reply and one above the offload threshold
+    small = '{"key": "value"}'
+    large = '{"key": "' + "v" * utils_mod._ASYNC_PARSE_THRESHOLD + '"}'
+
+    # When: Parsing both through the async variant
+    with patch.object(
+        utils_mod.asyncio, "to_thread", wraps=utils_mod.asyncio.to_thread
+    ) as to_thread:
+        small_result = await utils_mod.parse_json_response_async(small)
+        large_result = await utils_mod.parse_json_response_async(large)
+
+    # Then: Both parse, and only the large one was handed to a thread
+    assert small_result == {"key": "value"}
+    assert large_result["key"] == "v" * utils_mod._ASYNC_PARSE_THRESHOLD
+    to_thread.assert_called_once()
+
+
+def test_extract_fields_by_regex_single_scan():
+    """Test the field fallback extracts every known field from malformed JSON."""
+    # Given: Malformed JSON with all fields and a repeated, differently cased title
+    text = (
+        '{"Title": "Add timestamp command", "description": "Insert now", '
+        '"requirements": ["Use moment", "Add hotkey"], '
+        '"acceptance_criteria": ["Inserts text"], "title": "Ignored" oops'
+    )
+
+    # When: Extracting fields by regex
+    fields = utils_mod._extract_fields_by_regex(text)
+
+    # Then: Each field comes from its first occurrence
+    assert fields == {
+        "title": "Add timestamp command",
+        "description": "Insert now",
+        "requirements": ["Use moment", "Add hotkey"],
+        "acceptance_criteria": ["Inserts text"],
+    }
+
+
+def test_remove_thinking_tags_accepts_message_objects():
+    """Test message objects are unwrapped via .content and other values coerced."""
+    # Given: A message-like object and a non-string value
+    message = MagicMock(content="<think>x</think>Answer")
+
+    # When: Cleaning both
+    from_message = remove_thinking_tags(message)
+    from_number = remove_thinking_tags(42)
+
+    # Then: The message content is cleaned and the number is stringified
+    assert from_message == "Answer"
+    assert from_number == "42"
+
+
+def test_log_state_serializes_only_when_emitted():
+    """Test state snapshots are not serialized when the root logger drops them."""
+    # Given: A root logger that only passes warnings
+    root = logging.getLogger()
+    previous = root.level
+    root.setLevel(logging.WARNING)
+
+    # When: Logging a state snapshot
+    try:
+        with patch.object(utils_mod, "safe_json_dumps") as dumps:
+            utils_mod.log_state("Agent", "Before processing in Agent", {"a": 1})
+    finally:
+        root.setLevel(previous)
+
+    # Then: The state was never rendered to JSON
+    dumps.assert_not_called()
+
+
+def test_log_state_emits_snapshot(caplog):
+    """Test state snapshots are rendered into the log_info message when enabled."""
+    # Given: Logging captured at DEBUG
+    with caplog.at_level(logging.DEBUG):
+        # When: Logging a state snapshot
+        utils_mod.log_state("Agent", "After processing in Agent", {"a": 1})
+
+    # Then: The rendered state follows the label
+    assert "After processing in Agent: {" in caplog.text
+
+
+def test_to_columns_round_trip():
+    """Test columnar tables list keys once and expand back to the original rows."""
+    # Given: Per-issue results sharing the same keys
+    rows = [
+        {"issue_url": "https://github.com/u/r/issues/1", "error": "timeout"},
+        {"issue_url": "https://github.com/u/r/issues/2", "error": None},
+    ]
+
+    # When: Packing them into columns and expanding again
+    table = utils_mod.to_columns(rows, ("issue_url", "error"))
+
+    # Then: Keys appear once and the rows survive the round trip
+    assert table == {
+        "columns": ["issue_url", "error"],
+        "rows": [
+            ["https://github.com/u/r/issues/1", "timeout"],
+            ["https://github.com/u/r/issues/2", None],
+        ],
+    }
+    assert utils_mod.rows_to_dicts(table) == rows
+
+
+def test_parse_json_response_reuses_cached_retry_reply():
+    """Test a retry reply that parsed is reused for the same prompt."""
+    # Given: An empty response cache and a client that returns valid JSON on retry
+    from src.performance import TTLCache
+
+    cache = TTLCache()
+    llm_client = MagicMock()
+    llm_client.invoke.return_value = '{"title": "Cached"}'
+
+    # When: Two unparseable replies to the same prompt go through the retry path
+    try:
+        with patch("src.performance.get_response_cache", return_value=cache):
+            first = parse_json_response(
+                "not json", llm_client=llm_client, original_prompt="Give a title"
+            )
+            second = parse_json_response(
+                "still not json", llm_client=llm_client, original_prompt="Give a title"
+            )
+    finally:
+        cache.stop()
+
+    # Then: Both parse, and the LLM was only asked once
+    assert first == second == {"title": "Cached"}
+    llm_client.invoke.assert_called_once()
+
+
+def test_parse_json_response_retry_cache_is_per_client():
+    """Test a cached retry reply from one client is not served to another."""
+    # Given: An empty response cache and two clients with different replies
+    from src.performance import TTLCache
+
+    cache = TTLCache()
+    first_client = MagicMock()
+    first_client.invoke.return_value = '{"title": "First"}'
+    second_client = MagicMock()
+    second_client.invoke.return_value = '{"title": "Second"}'
+
+    # When: Both clients go through the retry path for the same prompt
+    try:
+        with patch("src.performance.get_response_cache", return_value=cache):
+            first = parse_json_response(
+                "not json", llm_client=first_client, original_prompt="Give a title"
+            )
+            second = parse_json_response(
+                "not json", llm_client=second_client, original_prompt="Give a title"
+            )
+    finally:
+        cache.stop()
+
+    # Then: Each client was asked and its own reply was used
+    assert first == {"title": "First"}
+    assert second == {"title": "Second"}
+    second_client.invoke.assert_called_once()
+
+
+def test_parse_json_response_does_not_cache_failed_retries():
+    """Test unparseable retry replies are not cached and every retry asks again."""
+    # Given: An empty response cache and a client that never returns JSON
+    from src.performance import TTLCache
+
+    cache = TTLCache()
+    llm_client = MagicMock()
+    llm_client.invoke.return_value = "no json here"
+
+    # When: Parsing with three retries
+    try:
+        with patch("src.performance.get_response_cache", return_value=cache):
+            with pytest.raises(ValueError):
+                parse_json_response(
+                    "not json", llm_client=llm_client, original_prompt="Give a title"
+                )
+    finally:
+        cache.stop()
+
+    # Then: Each retry called the LLM and nothing was cached
+    assert llm_client.invoke.call_count == 3
+    assert cache.cache == {}
+
+
+def test_find_json_span_handles_depth_and_strings():
+    """Test the span scanner handles deep nesting and braces inside strings."""
+    # Given: Prose around a deeply nested object with braces in a string value
+    payload = '{"a": {"b": {"c": {"d": "}{ \\" {"}}}}'
+    text = "Result: " + payload + " trailing {"
+
+    # When: Extracting by the span scanner
+    result = utils_mod._extract_json_by_regex(text)
+
+    # Then: The whole object is returned
+    assert result == {"a": {"b": {"c": {"d": '}{ " {'}}}}
+    assert utils_mod._find_json_span("{ stray " + payload) == (8, 8 + len(payload))
+    with pytest.raises(ValueError):
+        utils_mod._find_json_span("no object {")
+
+
+def test_validate_github_urls_logs_one_summary():
+    """Test batch URL validation returns per-URL results with a single log event."""
+    # Given: A mix of valid, invalid and non-string URLs
+    urls = [
+        "https://github.com/user/repo/issues/1",
+        "https://github.com/user/repo/pull/2",
+        None,
+    ]
+
+    # When: Validating them as a batch
+    with patch.object(utils_mod, "monitor") as monitor:
+        results = utils_mod.validate_github_urls(urls)
+
+    # Then: Results line up with the input and one summary was logged
+    assert results == [True, False, False]
+    monitor.info.assert_called_once_with(
+        "github_url_batch_validation", data={"count": 3, "invalid": 2}
+    )
+
+
+def test_validate_and_fill_json_fills_missing_keys_in_sorted_order():
+    """Test missing keys are filled in sorted order for sets and frozensets."""
+    # Given: A schema and a reply missing two keys
+    schema = frozenset({"title", "description", "requirements"})
+    defaults = {"title": "Untitled", "description": "", "requirements": []}
+
+    # When: Validating replies against the schema as a frozenset and a set
+    first = utils_mod._validate_and_fill_json({"title": "A"}, schema, defaults)
+    second = utils_mod._validate_and_fill_json({"title": "B"}, set(schema), defaults)
+
+    # Then: Both are filled in sorted order, and a key without a default raises
+    assert list(first) == ["title", "description", "requirements"]
+    assert list(second) == ["title", "description", "requirements"]
+    with pytest.raises(ValueError, match="'description'"):
+        utils_mod._validate_and_fill_json({}, schema, {"title": "x"})
@@ -330,13 +330,13 @@ class TestBatchIssueProcessingWorkflow:
         assert workflow.service_manager == service_manager
 
     @patch("src.workflows.get_service_manager")
-    @patch("src.workflows.validate_github_url")
+    @patch("src.workflows.validate_github_urls")
     def test_validate_input_valid_urls(
         self, mock_validate_url, mock_get_service_manager, service_manager
     ):
         """Test batch input validation with valid URLs."""
         mock_get_service_manager.return_value = service_manager
-        mock_validate_url.return_value = True
+        mock_validate_url.return_value = [True, True]
 
         workflow = BatchIssueProcessingWorkflow()
         input_data = {
@@ -347,7 +347,7 @@ class TestBatchIssueProcessingWorkflow:
         }
 
         workflow.validate_input(input_data)
-        assert mock_validate_url.call_count == 2
+        mock_validate_url.assert_called_once_with(input_data["issue_urls"])
 
     @patch("src.workflows.get_service_manager")
     @patch("src.workflows.validate_github_url")
@@ -378,13 +378,13 @@ class TestBatchIssueProcessingWorkflow:
             workflow.validate_input(input_data)
 
     @patch("src.workflows.get_service_manager")
-    @patch("src.workflows.validate_github_url")
+    @patch("src.workflows.validate_github_urls")
     def test_validate_input_invalid_url_in_list(
         self, mock_validate_url, mock_get_service_manager, service_manager
     ):
         """Test batch input validation with invalid URL in list."""
         mock_get_service_manager.return_value = service_manager
-        mock_validate_url.side_effect = [True, False]
+        mock_validate_url.return_value = [True, False]
 
         workflow = BatchIssueProcessingWorkflow()
         input_data = {
@@ -394,6 +394,31 @@ class TestBatchIssueProcessingWorkflow:
         with pytest.raises(ValidationError, match="Invalid GitHub issue URL"):
             workflow.validate_input(input_data)
 
+    @patch("src.workflows.get_service_manager")
+    def test_validate_input_lists_all_invalid_urls(
+        self, mock_get_service_manager, service_manager
+    ):
+        """Test batch input validation reports every invalid URL at once."""
+        mock_get_service_manager.return_value = service_manager
+
+        workflow = BatchIssueProcessingWorkflow()
+        input_data = {
+            "issue_urls": [
+                "invalid-url",
+                "https://github.com/user/repo/issues/1",
+                "https://github.com/user/repo/pull/2",
+                42,
+            ]
+        }
+
+        with pytest.raises(ValidationError) as exc_info:
+            workflow.validate_input(input_data)
+
+        assert str(exc_info.value) == (
+            "Invalid GitHub issue URL: invalid-url, "
+            "https://github.com/user/repo/pull/2, 42"
+        )
+
     @patch("src.workflows.get_service_manager")
     @patch("src.workflows.get_task_manager")
     @patch("src.workflows.get_batch_processor")
@@ -534,6 +559,67 @@ class TestBatchIssueProcessingWorkflow:
 
         assert result == expected_result
 
+    @patch("src.workflows.get_service_manager")
+    @patch("src.workflows.get_task_manager")
+    @patch("src.workflows.get_batch_processor")
+    @patch("src.workflows.validate_github_url")
+    @patch("src.workflows._monitor")
+    @pytest.mark.asyncio
+    async def test_execute_logs_failures_as_one_table(
+        self,
+        mock_monitor,
+        mock_validate_url,
+        mock_get_batch_processor,
+        mock_get_task_manager,
+        mock_get_service_manager,
+        service_manager,
+    ):
+        """Test failed issues are reported in a single columnar warning."""
+        mock_get_service_manager.return_value = service_manager
+        mock_get_task_manager.return_value = MagicMock()
+        mock_batch_processor = MagicMock()
+        mock_get_batch_processor.return_value = mock_batch_processor
+        mock_validate_url.return_value = True
+        mock_batch_processor.process_batch = AsyncMock(
+            return_value=[
+                {"success": True, "issue_url": "https://github.com/user/repo/issues/1"},
+                {
+                    "success": False,
+                    "issue_url": "https://github.com/user/repo/issues/2",
+                    "error": "Failed",
+                },
+                {
+                    "success": False,
+                    "issue_url": "https://github.com/user/repo/issues/3",
+                    "error": "Timeout",
+                },
+            ]
+        )
+
+        workflow = BatchIssueProcessingWorkflow()
+        await workflow.execute(
+            {
+                "issue_urls": [
+                    "https://github.com/user/repo/issues/1",
+                    "https://github.com/user/repo/issues/2",
+                    "https://github.com/user/repo/issues/3",
+                ]
+            }
+        )
+
+        mock_monitor.warning.assert_called_once_with(
+            "batch_issue_failures",
+            {
+                "failures": {
+                    "columns": ["issue_url", "error"],
+                    "rows": [
+                        ["https://github.com/user/repo/issues/2", "Failed"],
+                        ["https://github.com/user/repo/issues/3", "Timeout"],
+                    ],
+                }
+            },
+        )
+
     @patch("src.workflows.get_service_manager")
     @patch("src.workflows.get_task_manager")
     @patch("src.workflows.get_batch_processor")
@@ -858,6 +944,147 @@ class TestAsyncExecutionPatterns:
         for result in results:
             assert result["success"] is True
 
+    @patch("src.workflows.get_service_manager")
+    @patch("src.workflows.get_task_manager")
+    @patch("src.workflows.get_batch_processor")
+    @patch("src.workflows.validate_github_url")
+    @patch("src.workflows.ComposableWorkflows")
+    @pytest.mark.asyncio
+    async def test_workflow_system_reused_when_enabled(
+        self,
+        mock_composable_class,
+        mock_validate_url,
+        mock_get_batch_processor,
+        mock_get_task_manager,
+        mock_get_service_manager,
+        service_manager,
+    ):
+        """Test repeated executions reuse the composable workflow system when enabled."""
+        mock_get_service_manager.return_value = service_manager
+        mock_get_task_manager.return_value = MagicMock()
+        mock_get_batch_processor.return_value = MagicMock()
+        mock_validate_url.return_value = True
+
+        mock_workflow = MagicMock()
+        mock_workflow.process_issue = AsyncMock(return_value={"result": "success"})
+        mock_composable_class.return_value = mock_workflow
+
+        workflow = IssueProcessingWorkflow(reuse_workflow_system=True)
+        for issue in (1, 2, 3):
+            url = f"https://github.com/user/repo/issues/{issue}"
+            await workflow.execute({"url": url})
+
+        mock_composable_class.assert_called_once()
+        assert mock_workflow.process_issue.await_count == 3
+
+    @patch("src.workflows.get_service_manager")
+    @patch("src.workflows.get_task_manager")
+    @patch("src.workflows.get_batch_processor")
+    @patch("src.workflows.validate_github_url")
+    @patch("src.workflows.ComposableWorkflows")
+    @pytest.mark.asyncio
+    async def test_workflow_system_built_per_execution_by_default(
+        self,
+        mock_composable_class,
+        mock_validate_url,
+        mock_get_batch_processor,
+        mock_get_task_manager,
+        mock_get_service_manager,
+        service_manager,
+    ):
+        """Test the shared workflow instance builds a new system for each execution."""
+        mock_get_service_manager.return_value = service_manager
+        mock_get_task_manager.return_value = MagicMock()
+        mock_get_batch_processor.return_value = MagicMock()
+        mock_validate_url.return_value = True
+
+        mock_workflow = MagicMock()
+        mock_workflow.process_issue = AsyncMock(return_value={"result": "success"})
+        mock_composable_class.return_value = mock_workflow
+
+        workflow = IssueProcessingWorkflow()
+        for issue in (1, 2, 3):
+            url = f"https://github.com/user/repo/issues/{issue}"
+            await workflow.execute({"url": url})
+
+        assert mock_composable_class.call_count == 3
+        assert workflow._workflow_system is None
+
+    @patch("src.workflows.get_service_manager")
+    @patch("src.workflows.get_task_manager")
+    @patch("src.workflows.get_batch_processor")
+    @patch("src.workflows.IssueProcessingWorkflow")
+    @pytest.mark.asyncio
+    async def test_process_batch_reuses_idle_workflows(
+        self,
+        mock_issue_workflow_class,
+        mock_get_batch_processor,
+        mock_get_task_manager,
+        mock_get_service_manager,
+        service_manager,
+    ):
+        """Test sequential issues in a batch share one issue workflow."""
+        mock_get_service_manager.return_value = service_manager
+        mock_get_task_manager.return_value = MagicMock()
+        mock_batch_processor = MagicMock()
+        mock_get_batch_processor.return_value = mock_batch_processor
+
+        async def run_sequentially(items, processor_func):
+            return [await processor_func(item) for item in items]
+
+        mock_batch_processor.process_batch = AsyncMock(side_effect=run_sequentially)
+        issue_workflow = MagicMock()
+        issue_workflow.execute = AsyncMock(
+            side_effect=[{"success": True}, Exception("boom"), {"success": True}]
+        )
+        mock_issue_workflow_class.return_value = issue_workflow
+
+        workflow = BatchIssueProcessingWorkflow()
+        results = await workflow._process_batch(
+            [f"https://github.com/user/repo/issues/{i}" for i in (1, 2, 3)]
+        )
+
+        mock_issue_workflow_class.assert_called_once_with(reuse_workflow_system=True)
+        assert issue_workflow.execute.await_count == 3
+        assert results[1] == {
+            "issue_url": "https://github.com/user/repo/issues/2",
+            "success": False,
+            "error": "boom",
+        }
+
+    @patch("src.workflows.get_service_manager")
+    @patch("src.workflows.get_task_manager")
+    @patch("src.workflows.get_batch_processor")
+    @pytest.mark.asyncio
+    async def test_process_batch_reports_workflow_construction_failure(
+        self,
+        mock_get_batch_processor,
+        mock_get_task_manager,
+        mock_get_service_manager,
+        service_manager,
+    ):
+        """Test an issue whose workflow cannot be built is reported as failed."""
+        mock_get_service_manager.return_value = service_manager
+        mock_get_task_manager.return_value = MagicMock()
+        mock_batch_processor = MagicMock()
+        mock_get_batch_processor.return_value = mock_batch_processor
+
+        async def run_sequentially(items, processor_func):
+            return [await processor_func(item) for item in items]
+
+        mock_batch_processor.process_batch = AsyncMock(side_effect=run_sequentially)
+
+        workflow = BatchIssueProcessingWorkflow()
+        issue_urls = [f"https://github.com/user/repo/issues/{i}" for i in (1, 2)]
+        mock_get_service_manager.side_effect = RuntimeError("no service manager")
+
+        results = await workflow._process_batch(issue_urls)
+
+        assert results == [
+            {"issue_url": url, "success": False, "error": "no service manager"}
+            for url in issue_urls
+        ]
+
     @patch("src.workflows.get_service_manager")
     @patch("src.workflows.get_task_manager")
     @patch("src.workflows.get_batch_processor")